@@ -32,7 +32,19 @@ Properties of ICRU-44 composition tables:
 from . import icru44
 from . import elements
 from .material import Material
+from .mixture import Mixture
+from .energygrid import EnergyGrid
+from .coefficients import CoefficientMatrix
+from .batch import MaterialBatch
 from . import library
 
 
-version = "0.6.4"
\ No newline at end of file
+version = "0.6.4"
+
+
+def __getattr__(name):
+    # parallel imports concurrent.futures and multiprocessing, so load it on first use
+    if name == "parallel":
+        import importlib
+        return importlib.import_module(".parallel", __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
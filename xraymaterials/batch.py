@@ -0,0 +1,291 @@
+"""
+Stacks of many materials evaluated together.
+
+A MaterialBatch holds a (materials x 99) matrix of element densities, one row
+per material, and evaluates every property for all materials in one matrix
+product.
+
+Batches can also be built from many chemical formulas with
+MaterialBatch.from_compounds, or by mixing the same components in many
+proportions, with MaterialBatch.sum_by_mass and sum_by_volume.
+
+Example:
+    batch = MaterialBatch.from_materials({"water": water, "bone": bone})
+    mu = batch.mu(energy_keV)            # shape (2, len(energy_keV))
+    bone_mu = batch["bone"].mu(energy_keV)
+"""
+
+import numpy as np
+
+from . import formula
+from . import stoichiometry
+from .material import Material
+from .coefficients import CoefficientMatrix, NUM_ELEMENTS, PROPERTIES
+from .energygrid import EnergyGrid
+
+
+class MaterialBatch:
+    """
+    Many materials stored as rows of a (materials x 99) density matrix.
+
+    Column N of density_g_cc corresponds to atomic number N+1, as in Material.to_array().
+    """
+
+    def __init__(self, density_g_cc, names=None):
+        """
+        Args:
+            density_g_cc (array-like): (materials x 99) element densities in g/cc
+            names (list of str): (optional) Name of each material, for indexing by name
+        """
+        density_g_cc = np.array(density_g_cc, dtype=float, ndmin=2)
+        if density_g_cc.ndim != 2 or density_g_cc.shape[1] != NUM_ELEMENTS:
+            raise Exception(f"Density matrix must have shape (materials, {NUM_ELEMENTS}), got {density_g_cc.shape}")
+        if names is not None:
+            names = [n for n in names]
+            if len(names) != len(density_g_cc):
+                raise Exception("Number of names does not match number of materials")
+        self.density_g_cc = density_g_cc
+        self.names = names
+        self._name_index = None
+
+    @classmethod
+    def from_materials(cls, materials, names=None):
+        """
+        Stack Materials into a batch.
+
+        materials: list of Materials, or dict of names and Materials
+        names:     (optional) list of names, if materials is a list
+        """
+        if isinstance(materials, dict):
+            names = [k for k in materials.keys()]
+            materials = [v for v in materials.values()]
+        density_g_cc = np.zeros((len(materials), NUM_ELEMENTS))
+        for (row, material) in zip(density_g_cc, materials):
+            row[:] = material.to_array()
+        return cls(density_g_cc, names)
+
+    @classmethod
+    def from_compounds(cls, formulas, density_g_cc=None, names=None):
+        """
+        Create a batch of compounds from chemical formulas, like Material.from_compound.
+
+        formulas:     list of chemical formulas, see formula.parse
+        density_g_cc: (optional) density of every compound, or one per compound.  Default is 1.0.
+        names:        (optional) name of each compound.  Default is the formulas.
+
+        Returns: MaterialBatch with one row per formula
+        """
+        if density_g_cc is None:
+            density_g_cc = 1.0
+        if names is None:
+            names = [f for f in formulas]
+        # Mass of each element per formula unit, normalized to mass fractions
+        mass = formula.stoichiometry_matrix(formulas) * stoichiometry.ATOMIC_MASS_G[1:NUM_ELEMENTS+1]
+        mass *= (np.asarray(density_g_cc, dtype=float) / mass.sum(axis=1))[..., np.newaxis]
+        return cls(mass, names)
+
+    @classmethod
+    def sum_by_volume(cls, materials, volumes, final_density_g_cc=None, names=None):
+        """
+        Mix the same components in many recipes at once, by parts-per-volume.
+
+        Row i of the result is Material.sum_by_volume(materials, volumes[i],
+        final_density_g_cc[i]), computed for all rows in one matrix product.
+
+        materials:          list of K component Materials
+        volumes:            (recipes x K) parts-by-volume
+        final_density_g_cc: (optional) density of every result, or one per recipe [g/cc]
+        names:              (optional) name of each recipe
+
+        Returns: MaterialBatch with one row per recipe
+        """
+        components = np.array([m.to_array() for m in materials]).reshape(-1, NUM_ELEMENTS)
+        volumes = np.array(volumes, dtype=float, ndmin=2)
+        if volumes.shape[1] != len(components):
+            raise Exception(f"Volumes have {volumes.shape[1]} columns but there are {len(components)} materials")
+        density_g_cc = volumes @ components
+        density_g_cc /= volumes.sum(axis=1)[:, np.newaxis]
+        if final_density_g_cc is not None:
+            density_g_cc *= (np.asarray(final_density_g_cc, dtype=float) / density_g_cc.sum(axis=1))[..., np.newaxis]
+        return cls(density_g_cc, names)
+
+    @classmethod
+    def sum_by_mass(cls, materials, masses, final_density_g_cc=None, names=None):
+        """
+        Mix the same components in many recipes at once, by parts-per-mass.
+
+        Row i of the result is Material.sum_by_mass(materials, masses[i],
+        final_density_g_cc[i]).  See sum_by_volume.
+
+        materials:          list of K component Materials
+        masses:             (recipes x K) parts-by-mass
+        final_density_g_cc: (optional) density of every result, or one per recipe [g/cc]
+        names:              (optional) name of each recipe
+
+        Returns: MaterialBatch with one row per recipe
+        """
+        volumes = np.divide(np.array(masses, dtype=float, ndmin=2), [m.density for m in materials])
+        return cls.sum_by_volume(materials, volumes, final_density_g_cc, names)
+
+    def __len__(self):
+        return len(self.density_g_cc)
+
+    def __iter__(self):
+        for ii in range(len(self)):
+            yield self[ii]
+
+    def __getitem__(self, key):
+        """
+        batch[int] and batch[name] return a Material.  Slices, lists of
+        names or indices, and boolean masks return a MaterialBatch.
+        """
+        if isinstance(key, str):
+            return Material.from_array(self.density_g_cc[self.index(key)])
+        if isinstance(key, (int, np.integer)):
+            return Material.from_array(self.density_g_cc[key])
+
+        if isinstance(key, slice):
+            rows = np.arange(len(self))[key]
+        else:
+            key = [k for k in key]
+            if any(isinstance(k, str) for k in key):
+                rows = np.array([self.index(k) for k in key], dtype=int)
+            else:
+                rows = np.arange(len(self))[np.asarray(key)]
+
+        names = None if self.names is None else [self.names[ii] for ii in rows]
+        return MaterialBatch(self.density_g_cc[rows], names)
+
+    def index(self, name):
+        """
+        Return row number of the material with given name.
+        """
+        if self.names is None:
+            raise Exception("Batch has no material names")
+        if self._name_index is None:
+            self._name_index = {n: ii for (ii, n) in enumerate(self.names)}
+        try:
+            return self._name_index[name]
+        except KeyError:
+            raise KeyError(f"No material named '{name}' in batch")
+
+    def to_materials(self):
+        """
+        Return list of Materials, one per row.
+        """
+        return [m for m in self]
+
+    def to_dict(self):
+        """
+        Return dict of names and Materials.  Keys are row numbers if the batch has no names.
+        """
+        names = range(len(self)) if self.names is None else self.names
+        return dict(zip(names, self.to_materials()))
+
+    @property
+    def density(self):
+        """
+        Total density of each material [g/cc]
+        """
+        return self.density_g_cc.sum(axis=1)
+
+    @property
+    def z(self):
+        """
+        Atomic numbers present in any material of the batch.
+        """
+        return np.flatnonzero(self.density_g_cc.any(axis=0)) + 1
+
+    def coefficients(self, energy_keV):
+        """
+        Return a CoefficientMatrix for the elements of this batch.
+
+        Pass the result to evaluate() or the property methods in place of
+        energy_keV to reuse it for several properties, or for other batches
+        whose elements are all in this one; evaluating a batch with other
+        elements raises.  For an EnergyGrid, the grid's own CoefficientMatrix
+        is returned.
+        """
+        if isinstance(energy_keV, EnergyGrid):
+            return energy_keV.coefficients()
+        return CoefficientMatrix(energy_keV, self.z)
+
+    def evaluate(self, property_name, energy_keV):
+        """
+        Evaluate a property for every material.
+
+        property_name: one of "mu", "mu_pe", "mu_pe_k", "sigma", "delta", "beta"
+        energy_keV:    photon energies in keV, an EnergyGrid, or a CoefficientMatrix
+
+        Returns: array of shape (materials,) + energy_keV.shape
+        """
+        if isinstance(energy_keV, CoefficientMatrix):
+            coefficients = energy_keV
+        else:
+            coefficients = self.coefficients(energy_keV)
+        return coefficients.evaluate(property_name, self.density_g_cc)
+
+    def evaluate_all(self, energy_keV):
+        """
+        Evaluate every property for every material.
+
+        Returns: dict of property name and (materials x energies) array
+        """
+        if not isinstance(energy_keV, CoefficientMatrix):
+            energy_keV = self.coefficients(energy_keV)
+        return {p: self.evaluate(p, energy_keV) for p in PROPERTIES}
+
+    def delta(self, energy_keV):
+        """
+        Refractive index decrement of each material.  n = 1 - delta - 1j*beta
+        """
+        return self.evaluate("delta", energy_keV)
+
+    def beta(self, energy_keV):
+        """
+        Imaginary part of refractive index of each material.  n = 1 - delta - 1j*beta
+        """
+        return self.evaluate("beta", energy_keV)
+
+    def mu(self, energy_keV):
+        """
+        Total attenuation coefficient of each material [1/cm]
+        """
+        return self.evaluate("mu", energy_keV)
+
+    def mu_pe(self, energy_keV):
+        """
+        Photoelectric attenuation coefficient of each material [1/cm]
+        """
+        return self.evaluate("mu_pe", energy_keV)
+
+    def mu_pe_k(self, energy_keV):
+        """
+        K-shell component of photoelectric attenuation coefficient of each material [1/cm]
+        """
+        return self.evaluate("mu_pe_k", energy_keV)
+
+    def sigma(self, energy_keV):
+        """
+        Total scattering cross-section of each material [1/cm]
+        """
+        return self.evaluate("sigma", energy_keV)
+
+    def __repr__(self):
+        if self.names is None:
+            return f"MaterialBatch({len(self)} materials)"
+        return f"MaterialBatch({self.names!r})"
+
+
+def _test_shared_coefficients():
+    energy_keV = np.array([10.0, 30.0])
+    water = MaterialBatch.from_compounds(["H2O"], [1.0])
+    ice = MaterialBatch.from_compounds(["H2O2", "H2O"], [1.44, 0.92])
+    coefficients = water.coefficients(energy_keV)
+    np.testing.assert_allclose(ice.mu(coefficients), ice.mu(energy_keV), rtol=1e-12)
+    calcite = MaterialBatch.from_compounds(["CaCO3"], [2.71])
+    try:
+        calcite.mu(coefficients)
+    except Exception:
+        return
+    raise AssertionError("Elements outside the CoefficientMatrix should raise")
@@ -0,0 +1,149 @@
+"""
+Size-bounded least-recently-used cache with hit/miss counters.
+
+loaddata keeps its parsed tables in one of these.  Query it at runtime with
+cache.info() and empty it with cache.clear().
+"""
+
+import sys
+import threading
+import collections
+import numpy as np
+
+class CacheInfo(collections.namedtuple("CacheInfo", ["hits", "misses", "entries", "bytes", "max_bytes"])):
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """
+        Fraction of lookups that were hits, or 0.0 before any lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def sizeof(value):
+    """
+    Estimate the memory held by a cached value, in bytes.
+
+    Arrays, Tables and DataFrames report their data buffers.  Containers are summed
+    recursively.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if hasattr(value, "memory_usage"):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for (k, v) in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Mapping from keys to values that evicts the least recently used entries
+    once the total size exceeds max_bytes.
+
+    Safe to use from several threads.
+    """
+
+    def __init__(self, max_bytes=None):
+        """
+        Args:
+            max_bytes (int): Size limit in bytes.  None means unlimited.
+        """
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self):
+        """
+        Size limit in bytes, or None for unlimited.  Lowering it evicts entries immediately.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def get(self, key, default=None):
+        """
+        Return cached value for key, or default if key is not cached.
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, nbytes=None):
+        """
+        Store value under key.
+
+        nbytes is the size to account for value.  If not given it is estimated
+        with sizeof().  Values larger than max_bytes are not stored.
+        """
+        if nbytes is None:
+            nbytes = sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if self._max_bytes is not None and nbytes > self._max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self._bytes += nbytes
+            self._evict()
+
+    def get_or_compute(self, key, func):
+        """
+        Return cached value for key, calling func() to compute and store it on a miss.
+        """
+        sentinel = self._entries  # never a cached value
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """
+        Remove all entries and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Return CacheInfo(hits, misses, entries, bytes, max_bytes).
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._entries), self._bytes, self._max_bytes)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _evict(self):
+        if self._max_bytes is None:
+            return
+        while self._bytes > self._max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
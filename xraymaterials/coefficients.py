@@ -0,0 +1,187 @@
+"""
+Evaluate material properties as matrix products.
+
+Every property xraymaterials computes is linear in the mass densities of the
+constituent elements.  A CoefficientMatrix interpolates each element's
+coefficients onto an energy grid once, into an (energies x 99) matrix per
+property.  The property of any material on that grid is then one
+matrix-vector product with its density vector, Material.to_array().
+
+Example:
+    coefficients = CoefficientMatrix(np.linspace(10, 100, 500))
+    water_mu = coefficients.mu(Material.from_compound("H2O", 1.0))
+"""
+
+import numpy as np
+
+from . import loaddata
+from . import stoichiometry
+from .refractiveindex import _calculate_refractive_index, _energy_grid, _interp
+
+# Material properties and the element table columns they derive from.
+MASS_COEFFICIENT_COLUMNS = {
+    "mu": "mu_rho_tot_cm2_g",
+    "mu_pe": "mu_rho_pe_cm2_g",
+    "mu_pe_k": "mu_rho_K_cm2_g",
+    "sigma": "sigma_rho_cm2_g",
+}
+REFRACTIVE_INDEX_PROPERTIES = ("delta", "beta")
+PROPERTIES = tuple(MASS_COEFFICIENT_COLUMNS) + REFRACTIVE_INDEX_PROPERTIES
+
+NUM_ELEMENTS = 99
+
+
+def available_z():
+    """
+    Return array of atomic numbers that have xray data.
+    """
+    _, index = loaddata._load_packed_elements()
+    return np.flatnonzero(np.diff(index)) + 1
+
+
+def density_array(material):
+    """
+    Return density vector(s) of a Material, a 99-vector or a (materials x 99) matrix.
+    """
+    if hasattr(material, "to_array"):
+        return material.to_array()
+    density_g_cc = np.asarray(material, dtype=float)
+    if density_g_cc.shape[-1] != NUM_ELEMENTS:
+        raise Exception(f"Density arrays must have {NUM_ELEMENTS} columns, got shape {density_g_cc.shape}")
+    return density_g_cc
+
+
+class CoefficientMatrix:
+    """
+    Per-element property coefficients interpolated onto a fixed energy grid.
+
+    matrix(property)[i, z-1] is the property at energy_keV[i] of element z at a
+    density of 1 g/cc.  Matrices are built on first use of each property.
+    """
+
+    def __init__(self, energy_keV, z=None):
+        """
+        Args:
+            energy_keV (array-like or EnergyGrid): Photon energies in keV.  Any shape; results have this shape.
+            z (array-like): (optional) Atomic numbers to include.  Default is every element with
+                xray data.  Columns of other elements are zero.
+        """
+        energy_keV, self._grid = _energy_grid(energy_keV)
+        energy_keV = np.asarray(energy_keV, dtype=float)
+        self.shape = energy_keV.shape
+        self.energy_keV = energy_keV.ravel()
+        if z is None:
+            z = available_z()
+        self.z = np.unique(np.asarray(z, dtype=int))
+        # Columns of elements not in z, which are zero
+        self._excluded = np.ones(NUM_ELEMENTS, dtype=bool)
+        self._excluded[self.z - 1] = False
+        self._matrices = {}
+
+    def matrix(self, property_name):
+        """
+        Return the read-only (energies x 99) coefficient matrix of a property.
+
+        property_name: one of PROPERTIES
+        """
+        if property_name not in self._matrices:
+            if property_name in MASS_COEFFICIENT_COLUMNS:
+                self._matrices[property_name] = self._build_mass_coefficient(property_name)
+            elif property_name in REFRACTIVE_INDEX_PROPERTIES:
+                self._build_refractive_index()
+            else:
+                raise Exception('Invalid property name {}, should be one of {}'.format(property_name, PROPERTIES))
+        return self._matrices[property_name]
+
+    def evaluate(self, property_name, material):
+        """
+        Evaluate a property for one or many materials.
+
+        property_name: one of PROPERTIES
+        material:      Material, 99-vector of element densities, or (materials x 99) matrix
+
+        Returns: property with the shape of energy_keV, or (materials,) + that shape
+
+        Raises if material contains elements outside z, whose columns are zero.
+        """
+        density_g_cc = density_array(material)
+        if self._excluded.any():
+            missing = np.flatnonzero(np.any(density_g_cc[..., self._excluded] != 0,
+                                            axis=tuple(range(density_g_cc.ndim - 1))))
+            if len(missing):
+                missing_z = np.flatnonzero(self._excluded)[missing] + 1
+                raise Exception(f"Material contains atomic numbers {missing_z.tolist()} "
+                                f"not in this CoefficientMatrix, which has {self.z.tolist()}")
+        matrix = self.matrix(property_name)
+        if density_g_cc.ndim == 1:
+            return (matrix @ density_g_cc).reshape(self.shape)
+        values = density_g_cc @ matrix.T
+        return values.reshape(density_g_cc.shape[:-1] + self.shape)
+
+    def delta(self, material):
+        """
+        Refractive index decrement of material.  n = 1 - delta - 1j*beta
+        """
+        return self.evaluate("delta", material)
+
+    def beta(self, material):
+        """
+        Imaginary part of refractive index of material.  n = 1 - delta - 1j*beta
+        """
+        return self.evaluate("beta", material)
+
+    def mu(self, material):
+        """
+        Total attenuation coefficient of material [1/cm]
+        """
+        return self.evaluate("mu", material)
+
+    def mu_pe(self, material):
+        """
+        Photoelectric attenuation coefficient of material [1/cm]
+        """
+        return self.evaluate("mu_pe", material)
+
+    def mu_pe_k(self, material):
+        """
+        K-shell component of photoelectric attenuation coefficient of material [1/cm]
+        """
+        return self.evaluate("mu_pe_k", material)
+
+    def sigma(self, material):
+        """
+        Total scattering cross-section of material [1/cm]
+        """
+        return self.evaluate("sigma", material)
+
+    def _new_matrix(self):
+        return np.zeros((self.energy_keV.size, NUM_ELEMENTS))
+
+    def _interp(self, z, table, column):
+        return _interp(self.energy_keV, self._grid, z, table, column).ravel()
+
+    def _build_mass_coefficient(self, property_name):
+        column = loaddata.ELEMENT_COLUMN_INDEX[MASS_COEFFICIENT_COLUMNS[property_name]]
+        matrix = self._new_matrix()
+        for z in self.z:
+            table = loaddata.load_element_array(z)
+            matrix[:, z-1] = self._interp(z, table, column)
+        matrix.flags.writeable = False
+        return matrix
+
+    def _build_refractive_index(self):
+        # Number density of 1 g/cc of each element
+        n_cc = stoichiometry.number_density(self.z, np.ones(len(self.z)))
+        delta = self._new_matrix()
+        beta = self._new_matrix()
+        f1_column = loaddata.ELEMENT_COLUMN_INDEX["f1_e_atom"]
+        f2_column = loaddata.ELEMENT_COLUMN_INDEX["f2_e_atom"]
+        for (z, z_n_cc) in zip(self.z, n_cc):
+            table = loaddata.load_element_array(z)
+            f1 = self._interp(z, table, f1_column)
+            f2 = self._interp(z, table, f2_column)
+            beta[:, z-1], delta[:, z-1] = _calculate_refractive_index(self.energy_keV, z_n_cc, f1, f2)
+        delta.flags.writeable = False
+        beta.flags.writeable = False
+        self._matrices["delta"] = delta
+        self._matrices["beta"] = beta
@@ -0,0 +1,72 @@
+"""
+Compile the per-element CSV tables in xraymaterials/elements into one packed
+binary table that loaddata can memory-map.
+
+Run this after changing any of the element tables:
+
+    python -m xraymaterials.compiletables
+"""
+
+import os
+import numpy as np
+import pandas
+
+from . import elements
+from . import loaddata
+
+
+def pack_element_tables():
+    """
+    Read every element CSV table and pack them into one array.
+
+    Returns:
+        data: array of shape (len(ELEMENT_COLUMNS), total_rows).  Row i holds
+              column ELEMENT_COLUMNS[i] of every element, elements in order of
+              atomic number.
+        index: array of shape (100,).  Element with atomic number z occupies
+               data[:, index[z-1]:index[z]].  index[0] is 0.
+    """
+    index = np.zeros(100, dtype=np.int64)
+    blocks = []
+    for z in range(1, 100):
+        symbol = elements.ELEMENTS[z].symbol
+        fname = os.path.join(loaddata.elements_dir, symbol + ".txt")
+        num_rows = 0
+        if os.path.exists(fname):
+            df = pandas.read_csv(fname)
+            if list(df.columns) != loaddata.ELEMENT_COLUMNS:
+                raise Exception(f"Unexpected columns in {fname}: {list(df.columns)}")
+            blocks.append(df.values.T)
+            num_rows = len(df)
+        index[z] = index[z-1] + num_rows
+
+    data = np.ascontiguousarray(np.concatenate(blocks, axis=1), dtype=np.float64)
+    return data, index
+
+
+def compile_element_tables(output_dir=None):
+    """
+    Write the packed element table and its index as .npy files.
+
+    Parameters:
+        output_dir: str
+            Directory to write to.  Default is loaddata.compiled_dir.
+
+    Returns:
+        data_file, index_file: paths of the written files
+    """
+    if output_dir is None:
+        output_dir = loaddata.compiled_dir
+    os.makedirs(output_dir, exist_ok=True)
+
+    data, index = pack_element_tables()
+    data_file = os.path.join(output_dir, os.path.basename(loaddata.element_table_file))
+    index_file = os.path.join(output_dir, os.path.basename(loaddata.element_index_file))
+    np.save(data_file, data)
+    np.save(index_file, index)
+    return data_file, index_file
+
+
+if __name__ == "__main__":
+    for fname in compile_element_tables():
+        print("Wrote", fname)
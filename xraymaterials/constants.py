@@ -0,0 +1,37 @@
+"""
+Physical constants in SI units, CODATA 2022.
+
+These are the values of scipy.constants, copied so the core package does not
+import scipy.  _test_constants() compares them with scipy.
+"""
+
+import math
+
+# Speed of light in vacuum [m/s]
+c = 299792458.0
+# Planck constant [J s]
+h = 6.62607015e-34
+# Reduced Planck constant [J s]
+hbar = h / (2 * math.pi)
+# Electron volt [J]
+electron_volt = 1.602176634e-19
+# Atomic mass constant [kg]
+atomic_mass = 1.66053906892e-27
+# Gram [kg]
+gram = 1e-3
+# Classical electron radius [m]
+classical_electron_radius = 2.8179403205e-15
+
+
+def _test_constants():
+    import scipy.constants
+    assert c == scipy.constants.c
+    assert h == scipy.constants.h
+    assert electron_volt == scipy.constants.electron_volt
+    assert gram == scipy.constants.gram
+    # Measured constants change between CODATA releases; allow a few standard uncertainties
+    for (value, name) in [(hbar, "reduced Planck constant"),
+                          (atomic_mass, "atomic mass constant"),
+                          (classical_electron_radius, "classical electron radius")]:
+        (expected, unit, uncertainty) = scipy.constants.physical_constants[name]
+        assert abs(value - expected) <= 5 * uncertainty + 1e-15 * abs(expected), f"{name}: {value} != {expected}"
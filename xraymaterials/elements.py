@@ -43,6 +43,9 @@ Requirements
 
 Revisions
 ---------
+Unreleased
+    Build Element objects on first access from a compact table of core
+    properties.  Load ionization energies and isotopes on first access.
 2018.8.15
     Move module into molmass package.
 2018.5.25
@@ -215,6 +218,16 @@ class Element(object):
         ]
         return ',\n    '.join(result)
 
+    @lazyattr
+    def ionenergy(self):
+        """Return ionization energies in eV."""
+        return _ionenergy_isotopes(self.number)[0]
+
+    @lazyattr
+    def isotopes(self):
+        """Return isotopic composition."""
+        return _ionenergy_isotopes(self.number)[1]
+
     @lazyattr
     def nominalmass(self):
         """Return mass number of most abundant natural stable isotope."""
@@ -315,10 +328,16 @@ class Isotope(object):
 
 
 class ElementsDict(object):
-    """Ordered dict of Elements with lookup by number, symbol, and name."""
+    """Ordered dict of Elements with lookup by number, symbol, and name.
+
+    Elements added with from_rows() are built on first access.
+
+    """
     def __init__(self, *elements):
         self._list = []
         self._dict = {}
+        self._fields = None
+        self._rows = []
         for element in elements:
             if element.number > len(self._list) + 1:
                 raise ValueError('Elements must be added in order')
@@ -326,1399 +345,694 @@ class ElementsDict(object):
                 self._list[element.number - 1] = element
             else:
                 self._list.append(element)
-            self._dict[element.number] = element
-            self._dict[element.symbol] = element
-            self._dict[element.name] = element
+                self._rows.append(None)
+            self._dict[element.number] = element.number
+            self._dict[element.symbol] = element.number
+            self._dict[element.name] = element.number
+
+    @classmethod
+    def from_rows(cls, fields, rows):
+        """Return ElementsDict of rows of Element attributes, in order.
+
+        fields starts with 'number', 'symbol', 'name'.
+
+        """
+        self = cls()
+        self._fields = fields[3:]
+        for number, row in enumerate(rows, 1):
+            if row[0] != number:
+                raise ValueError('Elements must be added in order')
+            self._list.append(None)
+            self._rows.append(row)
+            self._dict[number] = number
+            self._dict[row[1]] = number
+            self._dict[row[2]] = number
+        return self
+
+    def _element(self, number):
+        """Return Element of atomic number, building it if necessary."""
+        element = self._list[number - 1]
+        if element is None:
+            row = self._rows[number - 1]
+            element = Element(*row[:3], **dict(zip(self._fields, row[3:])))
+            self._list[number - 1] = element
+        return element
 
     def __str__(self):
-        return '[%s]' % ', '.join(ele.symbol for ele in self._list)
+        return '[%s]' % ', '.join(ele.symbol for ele in self)
 
     def __contains__(self, item):
         return item in self._dict
 
     def __iter__(self):
-        return iter(self._list)
+        return (self._element(number)
+                for number in range(1, len(self._list) + 1))
 
     def __len__(self):
         return len(self._list)
 
     def __getitem__(self, key):
         try:
-            return self._dict[key]
-        except KeyError:
+            return self._element(self._dict[key])
+        except (KeyError, TypeError):
             try:
                 start, stop, step = key.indices(len(self._list))
-                return self._list[slice(start - 1, stop - 1, step)]
+                numbers = range(1, len(self._list) + 1)
+                return [self._element(number) for number in
+                        numbers[slice(start - 1, stop - 1, step)]]
             except Exception:
                 raise KeyError
 
 
-ELEMENTS = ElementsDict(
-    Element(
-        1, 'H', 'Hydrogen',
-        group=1, period=1, block='s', series=1,
-        mass=1.00794, eleneg=2.2, eleaffin=0.75420375,
-        covrad=0.32, atmrad=0.79, vdwrad=1.2,
-        tboil=20.28, tmelt=13.81, density=0.084,
-        eleconfig='1s',
-        oxistates='1*, -1',
-        ionenergy=(13.5984, ),
-        isotopes={1: Isotope(1.0078250321, 0.999885, 1),
-                  2: Isotope(2.014101778, 0.000115, 2)}),
-    Element(
-        2, 'He', 'Helium',
-        group=18, period=1, block='s', series=2,
-        mass=4.002602, eleneg=0.0, eleaffin=0.0,
-        covrad=0.93, atmrad=0.49, vdwrad=1.4,
-        tboil=4.216, tmelt=0.95, density=0.1785,
-        eleconfig='1s2',
-        oxistates='*',
-        ionenergy=(24.5874, 54.416, ),
-        isotopes={3: Isotope(3.0160293097, 1.37e-06, 3),
-                  4: Isotope(4.0026032497, 0.99999863, 4)}),
-    Element(
-        3, 'Li', 'Lithium',
-        group=1, period=2, block='s', series=3,
-        mass=6.941, eleneg=0.98, eleaffin=0.618049,
-        covrad=1.23, atmrad=2.05, vdwrad=1.82,
-        tboil=1615.0, tmelt=453.7, density=0.53,
-        eleconfig='[He] 2s',
-        oxistates='1*',
-        ionenergy=(5.3917, 75.638, 122.451, ),
-        isotopes={6: Isotope(6.0151223, 0.0759, 6),
-                  7: Isotope(7.016004, 0.9241, 7)}),
-    Element(
-        4, 'Be', 'Beryllium',
-        group=2, period=2, block='s', series=4,
-        mass=9.012182, eleneg=1.57, eleaffin=0.0,
-        covrad=0.9, atmrad=1.4, vdwrad=0.0,
-        tboil=3243.0, tmelt=1560.0, density=1.85,
-        eleconfig='[He] 2s2',
-        oxistates='2*',
-        ionenergy=(9.3227, 18.211, 153.893, 217.713, ),
-        isotopes={9: Isotope(9.0121821, 1.0, 9)}),
-    Element(
-        5, 'B', 'Boron',
-        group=13, period=2, block='p', series=5,
-        mass=10.811, eleneg=2.04, eleaffin=0.279723,
-        covrad=0.82, atmrad=1.17, vdwrad=0.0,
-        tboil=4275.0, tmelt=2365.0, density=2.46,
-        eleconfig='[He] 2s2 2p',
-        oxistates='3*',
-        ionenergy=(8.298, 25.154, 37.93, 59.368, 340.217, ),
-        isotopes={10: Isotope(10.012937, 0.199, 10),
-                  11: Isotope(11.0093055, 0.801, 11)}),
-    Element(
-        6, 'C', 'Carbon',
-        group=14, period=2, block='p', series=1,
-        mass=12.0107, eleneg=2.55, eleaffin=1.262118,
-        covrad=0.77, atmrad=0.91, vdwrad=1.7,
-        tboil=5100.0, tmelt=3825.0, density=3.51,
-        eleconfig='[He] 2s2 2p2',
-        oxistates='4*, 2, -4*',
-        ionenergy=(11.2603, 24.383, 47.877, 64.492, 392.077,
-                   489.981, ),
-        isotopes={12: Isotope(12.0, 0.9893, 12),
-                  13: Isotope(13.0033548378, 0.0107, 13)}),
-    Element(
-        7, 'N', 'Nitrogen',
-        group=15, period=2, block='p', series=1,
-        mass=14.0067, eleneg=3.04, eleaffin=-0.07,
-        covrad=0.75, atmrad=0.75, vdwrad=1.55,
-        tboil=77.344, tmelt=63.15, density=1.17,
-        eleconfig='[He] 2s2 2p3',
-        oxistates='5, 4, 3, 2, -3*',
-        ionenergy=(14.5341, 39.601, 47.488, 77.472, 97.888,
-                   522.057, 667.029, ),
-        isotopes={14: Isotope(14.0030740052, 0.99632, 14),
-                  15: Isotope(15.0001088984, 0.00368, 15)}),
-    Element(
-        8, 'O', 'Oxygen',
-        group=16, period=2, block='p', series=1,
-        mass=15.9994, eleneg=3.44, eleaffin=1.461112,
-        covrad=0.73, atmrad=0.65, vdwrad=1.52,
-        tboil=90.188, tmelt=54.8, density=1.33,
-        eleconfig='[He] 2s2 2p4',
-        oxistates='-2*, -1',
-        ionenergy=(13.6181, 35.116, 54.934, 77.412,
-                   113.896, 138.116, 739.315, 871.387, ),
-        isotopes={16: Isotope(15.9949146221, 0.99757, 16),
-                  17: Isotope(16.9991315, 0.00038, 17),
-                  18: Isotope(17.9991604, 0.00205, 18)}),
-    Element(
-        9, 'F', 'Fluorine',
-        group=17, period=2, block='p', series=6,
-        mass=18.9984032, eleneg=3.98, eleaffin=3.4011887,
-        covrad=0.72, atmrad=0.57, vdwrad=1.47,
-        tboil=85.0, tmelt=53.55, density=1.58,
-        eleconfig='[He] 2s2 2p5',
-        oxistates='-1*',
-        ionenergy=(17.4228, 34.97, 62.707, 87.138, 114.24,
-                   157.161, 185.182, 953.886, 1103.089, ),
-        isotopes={19: Isotope(18.9984032, 1.0, 19)}),
-    Element(
-        10, 'Ne', 'Neon',
-        group=18, period=2, block='p', series=2,
-        mass=20.1797, eleneg=0.0, eleaffin=0.0,
-        covrad=0.71, atmrad=0.51, vdwrad=1.54,
-        tboil=27.1, tmelt=24.55, density=0.8999,
-        eleconfig='[He] 2s2 2p6',
-        oxistates='*',
-        ionenergy=(21.5645, 40.962, 63.45, 97.11, 126.21,
-                   157.93, 207.27, 239.09, 1195.797, 1362.164, ),
-        isotopes={20: Isotope(19.9924401759, 0.9048, 20),
-                  21: Isotope(20.99384674, 0.0027, 21),
-                  22: Isotope(21.99138551, 0.0925, 22)}),
-    Element(
-        11, 'Na', 'Sodium',
-        group=1, period=3, block='s', series=3,
-        mass=22.98977, eleneg=0.93, eleaffin=0.547926,
-        covrad=1.54, atmrad=2.23, vdwrad=2.27,
-        tboil=1156.0, tmelt=371.0, density=0.97,
-        eleconfig='[Ne] 3s',
-        oxistates='1*',
-        ionenergy=(5.1391, 47.286, 71.64, 98.91, 138.39,
-                   172.15, 208.47, 264.18, 299.87, 1465.091,
-                   1648.659, ),
-        isotopes={23: Isotope(22.98976967, 1.0, 23)}),
-    Element(
-        12, 'Mg', 'Magnesium',
-        group=2, period=3, block='s', series=4,
-        mass=24.305, eleneg=1.31, eleaffin=0.0,
-        covrad=1.36, atmrad=1.72, vdwrad=1.73,
-        tboil=1380.0, tmelt=922.0, density=1.74,
-        eleconfig='[Ne] 3s2',
-        oxistates='2*',
-        ionenergy=(7.6462, 15.035, 80.143, 109.24, 141.26,
-                   186.5, 224.94, 265.9, 327.95, 367.53,
-                   1761.802, 1962.613, ),
-        isotopes={24: Isotope(23.9850419, 0.7899, 24),
-                  25: Isotope(24.98583702, 0.1, 25),
-                  26: Isotope(25.98259304, 0.1101, 26)}),
-    Element(
-        13, 'Al', 'Aluminium',
-        group=13, period=3, block='p', series=7,
-        mass=26.981538, eleneg=1.61, eleaffin=0.43283,
-        covrad=1.18, atmrad=1.82, vdwrad=0.0,
-        tboil=2740.0, tmelt=933.5, density=2.7,
-        eleconfig='[Ne] 3s2 3p',
-        oxistates='3*',
-        ionenergy=(5.9858, 18.828, 28.447, 119.99, 153.71,
-                   190.47, 241.43, 284.59, 330.21, 398.57,
-                   442.07, 2085.983, 2304.08, ),
-        isotopes={27: Isotope(26.98153844, 1.0, 27)}),
-    Element(
-        14, 'Si', 'Silicon',
-        group=14, period=3, block='p', series=5,
-        mass=28.0855, eleneg=1.9, eleaffin=1.389521,
-        covrad=1.11, atmrad=1.46, vdwrad=2.1,
-        tboil=2630.0, tmelt=1683.0, density=2.33,
-        eleconfig='[Ne] 3s2 3p2',
-        oxistates='4*, -4',
-        ionenergy=(8.1517, 16.345, 33.492, 45.141, 166.77,
-                   205.05, 246.52, 303.17, 351.1, 401.43,
-                   476.06, 523.5, 2437.676, 2673.108, ),
-        isotopes={28: Isotope(27.9769265327, 0.922297, 28),
-                  29: Isotope(28.97649472, 0.046832, 29),
-                  30: Isotope(29.97377022, 0.030871, 30)}),
-    Element(
-        15, 'P', 'Phosphorus',
-        group=15, period=3, block='p', series=1,
-        mass=30.973761, eleneg=2.19, eleaffin=0.7465,
-        covrad=1.06, atmrad=1.23, vdwrad=1.8,
-        tboil=553.0, tmelt=317.3, density=1.82,
-        eleconfig='[Ne] 3s2 3p3',
-        oxistates='5*, 3, -3',
-        ionenergy=(10.4867, 19.725, 30.18, 51.37, 65.023,
-                   220.43, 263.22, 309.41, 371.73, 424.5,
-                   479.57, 560.41, 611.85, 2816.943, 3069.762, ),
-        isotopes={31: Isotope(30.97376151, 1.0, 31)}),
-    Element(
-        16, 'S', 'Sulfur',
-        group=16, period=3, block='p', series=1,
-        mass=32.065, eleneg=2.58, eleaffin=2.0771029,
-        covrad=1.02, atmrad=1.09, vdwrad=1.8,
-        tboil=717.82, tmelt=392.2, density=2.06,
-        eleconfig='[Ne] 3s2 3p4',
-        oxistates='6*, 4, 2, -2',
-        ionenergy=(10.36, 23.33, 34.83, 47.3, 72.68,
-                   88.049, 280.93, 328.23, 379.1, 447.09,
-                   504.78, 564.65, 651.63, 707.14, 3223.836,
-                   3494.099, ),
-        isotopes={32: Isotope(31.97207069, 0.9493, 32),
-                  33: Isotope(32.9714585, 0.0076, 33),
-                  34: Isotope(33.96786683, 0.0429, 34),
-                  36: Isotope(35.96708088, 0.0002, 36)}),
-    Element(
-        17, 'Cl', 'Chlorine',
-        group=17, period=3, block='p', series=6,
-        mass=35.453, eleneg=3.16, eleaffin=3.612724,
-        covrad=0.99, atmrad=0.97, vdwrad=1.75,
-        tboil=239.18, tmelt=172.17, density=2.95,
-        eleconfig='[Ne] 3s2 3p5',
-        oxistates='7, 5, 3, 1, -1*',
-        ionenergy=(12.9676, 23.81, 39.61, 53.46, 67.8,
-                   98.03, 114.193, 348.28, 400.05, 455.62,
-                   529.97, 591.97, 656.69, 749.75, 809.39,
-                   3658.425, 3946.193, ),
-        isotopes={35: Isotope(34.96885271, 0.7578, 35),
-                  37: Isotope(36.9659026, 0.2422, 37)}),
-    Element(
-        18, 'Ar', 'Argon',
-        group=18, period=3, block='p', series=2,
-        mass=39.948, eleneg=0.0, eleaffin=0.0,
-        covrad=0.98, atmrad=0.88, vdwrad=1.88,
-        tboil=87.45, tmelt=83.95, density=1.66,
-        eleconfig='[Ne] 3s2 3p6',
-        oxistates='*',
-        ionenergy=(15.7596, 27.629, 40.74, 59.81, 75.02,
-                   91.007, 124.319, 143.456, 422.44, 478.68,
-                   538.95, 618.24, 686.09, 755.73, 854.75,
-                   918.0, 4120.778, 4426.114, ),
-        isotopes={36: Isotope(35.96754628, 0.003365, 36),
-                  38: Isotope(37.9627322, 0.000632, 38),
-                  40: Isotope(39.962383123, 0.996003, 40)}),
-    Element(
-        19, 'K', 'Potassium',
-        group=1, period=4, block='s', series=3,
-        mass=39.0983, eleneg=0.82, eleaffin=0.501459,
-        covrad=2.03, atmrad=2.77, vdwrad=2.75,
-        tboil=1033.0, tmelt=336.8, density=0.86,
-        eleconfig='[Ar] 4s',
-        oxistates='1*',
-        ionenergy=(4.3407, 31.625, 45.72, 60.91, 82.66,
-                   100.0, 117.56, 154.86, 175.814, 503.44,
-                   564.13, 629.09, 714.02, 787.13, 861.77,
-                   968.0, 1034.0, 4610.955, 4933.931, ),
-        isotopes={39: Isotope(38.9637069, 0.932581, 39),
-                  40: Isotope(39.96399867, 0.000117, 40),
-                  41: Isotope(40.96182597, 0.067302, 41)}),
-    Element(
-        20, 'Ca', 'Calcium',
-        group=2, period=4, block='s', series=4,
-        mass=40.078, eleneg=1.0, eleaffin=0.02455,
-        covrad=1.74, atmrad=2.23, vdwrad=0.0,
-        tboil=1757.0, tmelt=1112.0, density=1.54,
-        eleconfig='[Ar] 4s2',
-        oxistates='2*',
-        ionenergy=(6.1132, 11.71, 50.908, 67.1, 84.41,
-                   108.78, 127.7, 147.24, 188.54, 211.27,
-                   591.25, 656.39, 726.03, 816.61, 895.12,
-                   974.0, 1087.0, 1157.0, 5129.045, 5469.738, ),
-        isotopes={40: Isotope(39.9625912, 0.96941, 40),
-                  42: Isotope(41.9586183, 0.00647, 42),
-                  43: Isotope(42.9587668, 0.00135, 43),
-                  44: Isotope(43.9554811, 0.02086, 44),
-                  46: Isotope(45.9536928, 4e-05, 46),
-                  48: Isotope(47.952534, 0.00187, 48)}),
-    Element(
-        21, 'Sc', 'Scandium',
-        group=3, period=4, block='d', series=8,
-        mass=44.95591, eleneg=1.36, eleaffin=0.188,
-        covrad=1.44, atmrad=2.09, vdwrad=0.0,
-        tboil=3109.0, tmelt=1814.0, density=2.99,
-        eleconfig='[Ar] 3d 4s2',
-        oxistates='3*',
-        ionenergy=(6.5615, 12.8, 24.76, 73.47, 91.66,
-                   110.1, 138.0, 158.7, 180.02, 225.32,
-                   249.8, 685.89, 755.47, 829.79, 926.0, ),
-        isotopes={45: Isotope(44.9559102, 1.0, 45)}),
-    Element(
-        22, 'Ti', 'Titanium',
-        group=4, period=4, block='d', series=8,
-        mass=47.867, eleneg=1.54, eleaffin=0.084,
-        covrad=1.32, atmrad=2.0, vdwrad=0.0,
-        tboil=3560.0, tmelt=1935.0, density=4.51,
-        eleconfig='[Ar] 3d2 4s2',
-        oxistates='4*, 3',
-        ionenergy=(6.8281, 13.58, 27.491, 43.266, 99.22,
-                   119.36, 140.8, 168.5, 193.5, 215.91,
-                   265.23, 291.497, 787.33, 861.33, ),
-        isotopes={46: Isotope(45.9526295, 0.0825, 46),
-                  47: Isotope(46.9517638, 0.0744, 47),
-                  48: Isotope(47.9479471, 0.7372, 48),
-                  49: Isotope(48.9478708, 0.0541, 49),
-                  50: Isotope(49.9447921, 0.0518, 50)}),
-    Element(
-        23, 'V', 'Vanadium',
-        group=5, period=4, block='d', series=8,
-        mass=50.9415, eleneg=1.63, eleaffin=0.525,
-        covrad=1.22, atmrad=1.92, vdwrad=0.0,
-        tboil=3650.0, tmelt=2163.0, density=6.09,
-        eleconfig='[Ar] 3d3 4s2',
-        oxistates='5*, 4, 3, 2, 0',
-        ionenergy=(6.7462, 14.65, 29.31, 46.707, 65.23,
-                   128.12, 150.17, 173.7, 205.8, 230.5,
-                   255.04, 308.25, 336.267, 895.58, 974.02, ),
-        isotopes={50: Isotope(49.9471628, 0.0025, 50),
-                  51: Isotope(50.9439637, 0.9975, 51)}),
-    Element(
-        24, 'Cr', 'Chromium',
-        group=6, period=4, block='d', series=8,
-        mass=51.9961, eleneg=1.66, eleaffin=0.67584,
-        covrad=1.18, atmrad=1.85, vdwrad=0.0,
-        tboil=2945.0, tmelt=2130.0, density=7.14,
-        eleconfig='[Ar] 3d5 4s',
-        oxistates='6, 3*, 2, 0',
-        ionenergy=(6.7665, 16.5, 30.96, 49.1, 69.3,
-                   90.56, 161.1, 184.7, 209.3, 244.4,
-                   270.8, 298.0, 355.0, 384.3, 1010.64, ),
-        isotopes={50: Isotope(49.9460496, 0.04345, 50),
-                  52: Isotope(51.9405119, 0.83789, 52),
-                  53: Isotope(52.9406538, 0.09501, 53),
-                  54: Isotope(53.9388849, 0.02365, 54)}),
-    Element(
-        25, 'Mn', 'Manganese',
-        group=7, period=4, block='d', series=8,
-        mass=54.938049, eleneg=1.55, eleaffin=0.0,
-        covrad=1.17, atmrad=1.79, vdwrad=0.0,
-        tboil=2235.0, tmelt=1518.0, density=7.44,
-        eleconfig='[Ar] 3d5 4s2',
-        oxistates='7, 6, 4, 3, 2*, 0, -1',
-        ionenergy=(7.434, 15.64, 33.667, 51.2, 72.4,
-                   95.0, 119.27, 196.46, 221.8, 248.3,
-                   286.0, 314.4, 343.6, 404.0, 435.3,
-                   1136.2, ),
-        isotopes={55: Isotope(54.9380496, 1.0, 55)}),
-    Element(
-        26, 'Fe', 'Iron',
-        group=8, period=4, block='d', series=8,
-        mass=55.845, eleneg=1.83, eleaffin=0.151,
-        covrad=1.17, atmrad=1.72, vdwrad=0.0,
-        tboil=3023.0, tmelt=1808.0, density=7.874,
-        eleconfig='[Ar] 3d6 4s2',
-        oxistates='6, 3*, 2, 0, -2',
-        ionenergy=(7.9024, 16.18, 30.651, 54.8, 75.0,
-                   99.0, 125.0, 151.06, 235.04, 262.1,
-                   290.4, 330.8, 361.0, 392.2, 457.0,
-                   485.5, 1266.1, ),
-        isotopes={54: Isotope(53.9396148, 0.05845, 54),
-                  56: Isotope(55.9349421, 0.91754, 56),
-                  57: Isotope(56.9353987, 0.02119, 57),
-                  58: Isotope(57.9332805, 0.00282, 58)}),
-    Element(
-        27, 'Co', 'Cobalt',
-        group=9, period=4, block='d', series=8,
-        mass=58.9332, eleneg=1.88, eleaffin=0.6633,
-        covrad=1.16, atmrad=1.67, vdwrad=0.0,
-        tboil=3143.0, tmelt=1768.0, density=8.89,
-        eleconfig='[Ar] 3d7 4s2',
-        oxistates='3, 2*, 0, -1',
-        ionenergy=(7.881, 17.06, 33.5, 51.3, 79.5,
-                   102.0, 129.0, 157.0, 186.13, 276.0,
-                   305.0, 336.0, 376.0, 411.0, 444.0,
-                   512.0, 546.8, 1403.0, ),
-        isotopes={59: Isotope(58.9332002, 1.0, 59)}),
-    Element(
-        28, 'Ni', 'Nickel',
-        group=10, period=4, block='d', series=8,
-        mass=58.6934, eleneg=1.91, eleaffin=1.15716,
-        covrad=1.15, atmrad=1.62, vdwrad=1.63,
-        tboil=3005.0, tmelt=1726.0, density=8.91,
-        eleconfig='[Ar] 3d8 4s2',
-        oxistates='3, 2*, 0',
-        ionenergy=(7.6398, 18.168, 35.17, 54.9, 75.5,
-                   108.0, 133.0, 162.0, 193.0, 224.5,
-                   321.2, 352.0, 384.0, 430.0, 464.0,
-                   499.0, 571.0, 607.2, 1547.0, ),
-        isotopes={58: Isotope(57.9353479, 0.680769, 58),
-                  60: Isotope(59.9307906, 0.262231, 60),
-                  61: Isotope(60.9310604, 0.011399, 61),
-                  62: Isotope(61.9283488, 0.036345, 62),
-                  64: Isotope(63.9279696, 0.009256, 64)}),
-    Element(
-        29, 'Cu', 'Copper',
-        group=11, period=4, block='d', series=8,
-        mass=63.546, eleneg=1.9, eleaffin=1.23578,
-        covrad=1.17, atmrad=1.57, vdwrad=1.4,
-        tboil=2840.0, tmelt=1356.6, density=8.92,
-        eleconfig='[Ar] 3d10 4s',
-        oxistates='2*, 1',
-        ionenergy=(7.7264, 20.292, 26.83, 55.2, 79.9,
-                   103.0, 139.0, 166.0, 199.0, 232.0,
-                   266.0, 368.8, 401.0, 435.0, 484.0,
-                   520.0, 557.0, 633.0, 671.0, 1698.0, ),
-        isotopes={63: Isotope(62.9296011, 0.6917, 63),
-                  65: Isotope(64.9277937, 0.3083, 65)}),
-    Element(
-        30, 'Zn', 'Zinc',
-        group=12, period=4, block='d', series=8,
-        mass=65.409, eleneg=1.65, eleaffin=0.0,
-        covrad=1.25, atmrad=1.53, vdwrad=1.39,
-        tboil=1180.0, tmelt=692.73, density=7.14,
-        eleconfig='[Ar] 3d10 4s2',
-        oxistates='2*',
-        ionenergy=(9.3942, 17.964, 39.722, 59.4, 82.6,
-                   108.0, 134.0, 174.0, 203.0, 238.0,
-                   274.0, 310.8, 419.7, 454.0, 490.0,
-                   542.0, 579.0, 619.0, 698.8, 738.0,
-                   1856.0, ),
-        isotopes={64: Isotope(63.9291466, 0.4863, 64),
-                  66: Isotope(65.9260368, 0.279, 66),
-                  67: Isotope(66.9271309, 0.041, 67),
-                  68: Isotope(67.9248476, 0.1875, 68),
-                  70: Isotope(69.925325, 0.0062, 70)}),
-    Element(
-        31, 'Ga', 'Gallium',
-        group=13, period=4, block='p', series=7,
-        mass=69.723, eleneg=1.81, eleaffin=0.41,
-        covrad=1.26, atmrad=1.81, vdwrad=1.87,
-        tboil=2478.0, tmelt=302.92, density=5.91,
-        eleconfig='[Ar] 3d10 4s2 4p',
-        oxistates='3*',
-        ionenergy=(5.9993, 20.51, 30.71, 64.0, ),
-        isotopes={69: Isotope(68.925581, 0.60108, 69),
-                  71: Isotope(70.924705, 0.39892, 71)}),
-    Element(
-        32, 'Ge', 'Germanium',
-        group=14, period=4, block='p', series=5,
-        mass=72.64, eleneg=2.01, eleaffin=1.232712,
-        covrad=1.22, atmrad=1.52, vdwrad=0.0,
-        tboil=3107.0, tmelt=1211.5, density=5.32,
-        eleconfig='[Ar] 3d10 4s2 4p2',
-        oxistates='4*',
-        ionenergy=(7.8994, 15.934, 34.22, 45.71, 93.5, ),
-        isotopes={70: Isotope(69.9242504, 0.2084, 70),
-                  72: Isotope(71.9220762, 0.2754, 72),
-                  73: Isotope(72.9234594, 0.0773, 73),
-                  74: Isotope(73.9211782, 0.3628, 74),
-                  76: Isotope(75.9214027, 0.0761, 76)}),
-    Element(
-        33, 'As', 'Arsenic',
-        group=15, period=4, block='p', series=5,
-        mass=74.9216, eleneg=2.18, eleaffin=0.814,
-        covrad=1.2, atmrad=1.33, vdwrad=1.85,
-        tboil=876.0, tmelt=1090.0, density=5.72,
-        eleconfig='[Ar] 3d10 4s2 4p3',
-        oxistates='5, 3*, -3',
-        ionenergy=(9.7886, 18.633, 28.351, 50.13, 62.63,
-                   127.6, ),
-        isotopes={75: Isotope(74.9215964, 1.0, 75)}),
-    Element(
-        34, 'Se', 'Selenium',
-        group=16, period=4, block='p', series=1,
-        mass=78.96, eleneg=2.55, eleaffin=2.02067,
-        covrad=1.16, atmrad=1.22, vdwrad=1.9,
-        tboil=958.0, tmelt=494.0, density=4.82,
-        eleconfig='[Ar] 3d10 4s2 4p4',
-        oxistates='6, 4*, -2',
-        ionenergy=(9.7524, 21.9, 30.82, 42.944, 68.3,
-                   81.7, 155.4, ),
-        isotopes={74: Isotope(73.9224766, 0.0089, 74),
-                  76: Isotope(75.9192141, 0.0937, 76),
-                  77: Isotope(76.9199146, 0.0763, 77),
-                  78: Isotope(77.9173095, 0.2377, 78),
-                  80: Isotope(79.9165218, 0.4961, 80),
-                  82: Isotope(81.9167, 0.0873, 82)}),
-    Element(
-        35, 'Br', 'Bromine',
-        group=17, period=4, block='p', series=6,
-        mass=79.904, eleneg=2.96, eleaffin=3.363588,
-        covrad=1.14, atmrad=1.12, vdwrad=1.85,
-        tboil=331.85, tmelt=265.95, density=3.14,
-        eleconfig='[Ar] 3d10 4s2 4p5',
-        oxistates='7, 5, 3, 1, -1*',
-        ionenergy=(11.8138, 21.8, 36.0, 47.3, 59.7,
-                   88.6, 103.0, 192.8, ),
-        isotopes={79: Isotope(78.9183376, 0.5069, 79),
-                  81: Isotope(80.916291, 0.4931, 81)}),
-    Element(
-        36, 'Kr', 'Krypton',
-        group=18, period=4, block='p', series=2,
-        mass=83.798, eleneg=0.0, eleaffin=0.0,
-        covrad=1.12, atmrad=1.03, vdwrad=2.02,
-        tboil=120.85, tmelt=116.0, density=4.48,
-        eleconfig='[Ar] 3d10 4s2 4p6',
-        oxistates='2*',
-        ionenergy=(13.9996, 24.359, 36.95, 52.5, 64.7,
-                   78.5, 110.0, 126.0, 230.39, ),
-        isotopes={78: Isotope(77.920386, 0.0035, 78),
-                  80: Isotope(79.916378, 0.0228, 80),
-                  82: Isotope(81.9134846, 0.1158, 82),
-                  83: Isotope(82.914136, 0.1149, 83),
-                  84: Isotope(83.911507, 0.57, 84),
-                  86: Isotope(85.9106103, 0.173, 86)}),
-    Element(
-        37, 'Rb', 'Rubidium',
-        group=1, period=5, block='s', series=3,
-        mass=85.4678, eleneg=0.82, eleaffin=0.485916,
-        covrad=2.16, atmrad=2.98, vdwrad=0.0,
-        tboil=961.0, tmelt=312.63, density=1.53,
-        eleconfig='[Kr] 5s',
-        oxistates='1*',
-        ionenergy=(4.1771, 27.28, 40.0, 52.6, 71.0,
-                   84.4, 99.2, 136.0, 150.0, 277.1, ),
-        isotopes={85: Isotope(84.9117893, 0.7217, 85),
-                  87: Isotope(86.9091835, 0.2783, 87)}),
-    Element(
-        38, 'Sr', 'Strontium',
-        group=2, period=5, block='s', series=4,
-        mass=87.62, eleneg=0.95, eleaffin=0.05206,
-        covrad=1.91, atmrad=2.45, vdwrad=0.0,
-        tboil=1655.0, tmelt=1042.0, density=2.63,
-        eleconfig='[Kr] 5s2',
-        oxistates='2*',
-        ionenergy=(5.6949, 11.03, 43.6, 57.0, 71.6,
-                   90.8, 106.0, 122.3, 162.0, 177.0,
-                   324.1, ),
-        isotopes={84: Isotope(83.913425, 0.0056, 84),
-                  86: Isotope(85.9092624, 0.0986, 86),
-                  87: Isotope(86.9088793, 0.07, 87),
-                  88: Isotope(87.9056143, 0.8258, 88)}),
-    Element(
-        39, 'Y', 'Yttrium',
-        group=3, period=5, block='d', series=8,
-        mass=88.90585, eleneg=1.22, eleaffin=0.307,
-        covrad=1.62, atmrad=2.27, vdwrad=0.0,
-        tboil=3611.0, tmelt=1795.0, density=4.47,
-        eleconfig='[Kr] 4d 5s2',
-        oxistates='3*',
-        ionenergy=(6.2173, 12.24, 20.52, 61.8, 77.0,
-                   93.0, 116.0, 129.0, 146.52, 191.0,
-                   206.0, 374.0, ),
-        isotopes={89: Isotope(88.9058479, 1.0, 89)}),
-    Element(
-        40, 'Zr', 'Zirconium',
-        group=4, period=5, block='d', series=8,
-        mass=91.224, eleneg=1.33, eleaffin=0.426,
-        covrad=1.45, atmrad=2.16, vdwrad=0.0,
-        tboil=4682.0, tmelt=2128.0, density=6.51,
-        eleconfig='[Kr] 4d2 5s2',
-        oxistates='4*',
-        ionenergy=(6.6339, 13.13, 22.99, 34.34, 81.5, ),
-        isotopes={90: Isotope(89.9047037, 0.5145, 90),
-                  91: Isotope(90.905645, 0.1122, 91),
-                  92: Isotope(91.9050401, 0.1715, 92),
-                  94: Isotope(93.9063158, 0.1738, 94),
-                  96: Isotope(95.908276, 0.028, 96)}),
-    Element(
-        41, 'Nb', 'Niobium',
-        group=5, period=5, block='d', series=8,
-        mass=92.90638, eleneg=1.6, eleaffin=0.893,
-        covrad=1.34, atmrad=2.08, vdwrad=0.0,
-        tboil=5015.0, tmelt=2742.0, density=8.58,
-        eleconfig='[Kr] 4d4 5s',
-        oxistates='5*, 3',
-        ionenergy=(6.7589, 14.32, 25.04, 38.3, 50.55,
-                   102.6, 125.0, ),
-        isotopes={93: Isotope(92.9063775, 1.0, 93)}),
-    Element(
-        42, 'Mo', 'Molybdenum',
-        group=6, period=5, block='d', series=8,
-        mass=95.94, eleneg=2.16, eleaffin=0.7472,
-        covrad=1.3, atmrad=2.01, vdwrad=0.0,
-        tboil=4912.0, tmelt=2896.0, density=10.28,
-        eleconfig='[Kr] 4d5 5s',
-        oxistates='6*, 5, 4, 3, 2, 0',
-        ionenergy=(7.0924, 16.15, 27.16, 46.4, 61.2,
-                   68.0, 126.8, 153.0, ),
-        isotopes={92: Isotope(91.90681, 0.1484, 92),
-                  94: Isotope(93.9050876, 0.0925, 94),
-                  95: Isotope(94.9058415, 0.1592, 95),
-                  96: Isotope(95.9046789, 0.1668, 96),
-                  97: Isotope(96.906021, 0.0955, 97),
-                  98: Isotope(97.9054078, 0.2413, 98),
-                  100: Isotope(99.907477, 0.0963, 100)}),
-    Element(
-        43, 'Tc', 'Technetium',
-        group=7, period=5, block='d', series=8,
-        mass=97.907216, eleneg=1.9, eleaffin=0.55,
-        covrad=1.27, atmrad=1.95, vdwrad=0.0,
-        tboil=4538.0, tmelt=2477.0, density=11.49,
-        eleconfig='[Kr] 4d5 5s2',
-        oxistates='7*',
-        ionenergy=(7.28, 15.26, 29.54, ),
-        isotopes={98: Isotope(97.907216, 1.0, 98)}),
-    Element(
-        44, 'Ru', 'Ruthenium',
-        group=8, period=5, block='d', series=8,
-        mass=101.07, eleneg=2.2, eleaffin=1.04638,
-        covrad=1.25, atmrad=1.89, vdwrad=0.0,
-        tboil=4425.0, tmelt=2610.0, density=12.45,
-        eleconfig='[Kr] 4d7 5s',
-        oxistates='8, 6, 4*, 3*, 2, 0, -2',
-        ionenergy=(7.3605, 16.76, 28.47, ),
-        isotopes={96: Isotope(95.907598, 0.0554, 96),
-                  98: Isotope(97.905287, 0.0187, 98),
-                  99: Isotope(98.9059393, 0.1276, 99),
-                  100: Isotope(99.9042197, 0.126, 100),
-                  101: Isotope(100.9055822, 0.1706, 101),
-                  102: Isotope(101.9043495, 0.3155, 102),
-                  104: Isotope(103.90543, 0.1862, 104)}),
-    Element(
-        45, 'Rh', 'Rhodium',
-        group=9, period=5, block='d', series=8,
-        mass=102.9055, eleneg=2.28, eleaffin=1.14289,
-        covrad=1.25, atmrad=1.83, vdwrad=0.0,
-        tboil=3970.0, tmelt=2236.0, density=12.41,
-        eleconfig='[Kr] 4d8 5s',
-        oxistates='5, 4, 3*, 1*, 2, 0',
-        ionenergy=(7.4589, 18.08, 31.06, ),
-        isotopes={103: Isotope(102.905504, 1.0, 103)}),
-    Element(
-        46, 'Pd', 'Palladium',
-        group=10, period=5, block='d', series=8,
-        mass=106.42, eleneg=2.2, eleaffin=0.56214,
-        covrad=1.28, atmrad=1.79, vdwrad=1.63,
-        tboil=3240.0, tmelt=1825.0, density=12.02,
-        eleconfig='[Kr] 4d10',
-        oxistates='4, 2*, 0',
-        ionenergy=(8.3369, 19.43, 32.93, ),
-        isotopes={102: Isotope(101.905608, 0.0102, 102),
-                  104: Isotope(103.904035, 0.1114, 104),
-                  105: Isotope(104.905084, 0.2233, 105),
-                  106: Isotope(105.903483, 0.2733, 106),
-                  108: Isotope(107.903894, 0.2646, 108),
-                  110: Isotope(109.905152, 0.1172, 110)}),
-    Element(
-        47, 'Ag', 'Silver',
-        group=11, period=5, block='d', series=8,
-        mass=107.8682, eleneg=1.93, eleaffin=1.30447,
-        covrad=1.34, atmrad=1.75, vdwrad=1.72,
-        tboil=2436.0, tmelt=1235.1, density=10.49,
-        eleconfig='[Kr] 4d10 5s',
-        oxistates='2, 1*',
-        ionenergy=(7.5762, 21.49, 34.83, ),
-        isotopes={107: Isotope(106.905093, 0.51839, 107),
-                  109: Isotope(108.904756, 0.48161, 109)}),
-    Element(
-        48, 'Cd', 'Cadmium',
-        group=12, period=5, block='d', series=8,
-        mass=112.411, eleneg=1.69, eleaffin=0.0,
-        covrad=1.48, atmrad=1.71, vdwrad=1.58,
-        tboil=1040.0, tmelt=594.26, density=8.64,
-        eleconfig='[Kr] 4d10 5s2',
-        oxistates='2*',
-        ionenergy=(8.9938, 16.908, 37.48, ),
-        isotopes={106: Isotope(105.906458, 0.0125, 106),
-                  108: Isotope(107.904183, 0.0089, 108),
-                  110: Isotope(109.903006, 0.1249, 110),
-                  111: Isotope(110.904182, 0.128, 111),
-                  112: Isotope(111.9027572, 0.2413, 112),
-                  113: Isotope(112.9044009, 0.1222, 113),
-                  114: Isotope(113.9033581, 0.2873, 114),
-                  116: Isotope(115.904755, 0.0749, 116)}),
-    Element(
-        49, 'In', 'Indium',
-        group=13, period=5, block='p', series=7,
-        mass=114.818, eleneg=1.78, eleaffin=0.404,
-        covrad=1.44, atmrad=2.0, vdwrad=1.93,
-        tboil=2350.0, tmelt=429.78, density=7.31,
-        eleconfig='[Kr] 4d10 5s2 5p',
-        oxistates='3*',
-        ionenergy=(5.7864, 18.869, 28.03, 55.45, ),
-        isotopes={113: Isotope(112.904061, 0.0429, 113),
-                  115: Isotope(114.903878, 0.9571, 115)}),
-    Element(
-        50, 'Sn', 'Tin',
-        group=14, period=5, block='p', series=7,
-        mass=118.71, eleneg=1.96, eleaffin=1.112066,
-        covrad=1.41, atmrad=1.72, vdwrad=2.17,
-        tboil=2876.0, tmelt=505.12, density=7.29,
-        eleconfig='[Kr] 4d10 5s2 5p2',
-        oxistates='4*, 2*',
-        ionenergy=(7.3439, 14.632, 30.502, 40.734, 72.28, ),
-        isotopes={112: Isotope(111.904821, 0.0097, 112),
-                  114: Isotope(113.902782, 0.0066, 114),
-                  115: Isotope(114.903346, 0.0034, 115),
-                  116: Isotope(115.901744, 0.1454, 116),
-                  117: Isotope(116.902954, 0.0768, 117),
-                  118: Isotope(117.901606, 0.2422, 118),
-                  119: Isotope(118.903309, 0.0859, 119),
-                  120: Isotope(119.9021966, 0.3258, 120),
-                  122: Isotope(121.9034401, 0.0463, 122),
-                  124: Isotope(123.9052746, 0.0579, 124)}),
-    Element(
-        51, 'Sb', 'Antimony',
-        group=15, period=5, block='p', series=5,
-        mass=121.76, eleneg=2.05, eleaffin=1.047401,
-        covrad=1.4, atmrad=1.53, vdwrad=0.0,
-        tboil=1860.0, tmelt=903.91, density=6.69,
-        eleconfig='[Kr] 4d10 5s2 5p3',
-        oxistates='5, 3*, -3',
-        ionenergy=(8.6084, 16.53, 25.3, 44.2, 56.0,
-                   108.0, ),
-        isotopes={121: Isotope(120.903818, 0.5721, 121),
-                  123: Isotope(122.9042157, 0.4279, 123)}),
-    Element(
-        52, 'Te', 'Tellurium',
-        group=16, period=5, block='p', series=5,
-        mass=127.6, eleneg=2.1, eleaffin=1.970875,
-        covrad=1.36, atmrad=1.42, vdwrad=2.06,
-        tboil=1261.0, tmelt=722.72, density=6.25,
-        eleconfig='[Kr] 4d10 5s2 5p4',
-        oxistates='6, 4*, -2',
-        ionenergy=(9.0096, 18.6, 27.96, 37.41, 58.75,
-                   70.7, 137.0, ),
-        isotopes={120: Isotope(119.90402, 0.0009, 120),
-                  122: Isotope(121.9030471, 0.0255, 122),
-                  123: Isotope(122.904273, 0.0089, 123),
-                  124: Isotope(123.9028195, 0.0474, 124),
-                  125: Isotope(124.9044247, 0.0707, 125),
-                  126: Isotope(125.9033055, 0.1884, 126),
-                  128: Isotope(127.9044614, 0.3174, 128),
-                  130: Isotope(129.9062228, 0.3408, 130)}),
-    Element(
-        53, 'I', 'Iodine',
-        group=17, period=5, block='p', series=6,
-        mass=126.90447, eleneg=2.66, eleaffin=3.059038,
-        covrad=1.33, atmrad=1.32, vdwrad=1.98,
-        tboil=457.5, tmelt=386.7, density=4.94,
-        eleconfig='[Kr] 4d10 5s2 5p5',
-        oxistates='7, 5, 1, -1*',
-        ionenergy=(10.4513, 19.131, 33.0, ),
-        isotopes={127: Isotope(126.904468, 1.0, 127)}),
-    Element(
-        54, 'Xe', 'Xenon',
-        group=18, period=5, block='p', series=2,
-        mass=131.293, eleneg=0.0, eleaffin=0.0,
-        covrad=1.31, atmrad=1.24, vdwrad=2.16,
-        tboil=165.1, tmelt=161.39, density=4.49,
-        eleconfig='[Kr] 4d10 5s2 5p6',
-        oxistates='2, 4, 6',
-        ionenergy=(12.1298, 21.21, 32.1, ),
-        isotopes={124: Isotope(123.9058958, 0.0009, 124),
-                  126: Isotope(125.904269, 0.0009, 126),
-                  128: Isotope(127.9035304, 0.0192, 128),
-                  129: Isotope(128.9047795, 0.2644, 129),
-                  130: Isotope(129.9035079, 0.0408, 130),
-                  131: Isotope(130.9050819, 0.2118, 131),
-                  132: Isotope(131.9041545, 0.2689, 132),
-                  134: Isotope(133.9053945, 0.1044, 134),
-                  136: Isotope(135.90722, 0.0887, 136)}),
-    Element(
-        55, 'Cs', 'Caesium',
-        group=1, period=6, block='s', series=3,
-        mass=132.90545, eleneg=0.79, eleaffin=0.471626,
-        covrad=2.35, atmrad=3.34, vdwrad=0.0,
-        tboil=944.0, tmelt=301.54, density=1.9,
-        eleconfig='[Xe] 6s',
-        oxistates='1*',
-        ionenergy=(3.8939, 25.1, ),
-        isotopes={133: Isotope(132.905447, 1.0, 133)}),
-    Element(
-        56, 'Ba', 'Barium',
-        group=2, period=6, block='s', series=4,
-        mass=137.327, eleneg=0.89, eleaffin=0.14462,
-        covrad=1.98, atmrad=2.78, vdwrad=0.0,
-        tboil=2078.0, tmelt=1002.0, density=3.65,
-        eleconfig='[Xe] 6s2',
-        oxistates='2*',
-        ionenergy=(5.2117, 100.004, ),
-        isotopes={130: Isotope(129.90631, 0.00106, 130),
-                  132: Isotope(131.905056, 0.00101, 132),
-                  134: Isotope(133.904503, 0.02417, 134),
-                  135: Isotope(134.905683, 0.06592, 135),
-                  136: Isotope(135.90457, 0.07854, 136),
-                  137: Isotope(136.905821, 0.11232, 137),
-                  138: Isotope(137.905241, 0.71698, 138)}),
-    Element(
-        57, 'La', 'Lanthanum',
-        group=3, period=6, block='f', series=9,
-        mass=138.9055, eleneg=1.1, eleaffin=0.47,
-        covrad=1.69, atmrad=2.74, vdwrad=0.0,
-        tboil=3737.0, tmelt=1191.0, density=6.16,
-        eleconfig='[Xe] 5d 6s2',
-        oxistates='3*',
-        ionenergy=(5.5769, 11.06, 19.175, ),
-        isotopes={138: Isotope(137.907107, 0.0009, 138),
-                  139: Isotope(138.906348, 0.9991, 139)}),
-    Element(
-        58, 'Ce', 'Cerium',
-        group=3, period=6, block='f', series=9,
-        mass=140.116, eleneg=1.12, eleaffin=0.5,
-        covrad=1.65, atmrad=2.7, vdwrad=0.0,
-        tboil=3715.0, tmelt=1071.0, density=6.77,
-        eleconfig='[Xe] 4f 5d 6s2',
-        oxistates='4, 3*',
-        ionenergy=(5.5387, 10.85, 20.2, 36.72, ),
-        isotopes={136: Isotope(135.90714, 0.00185, 136),
-                  138: Isotope(137.905986, 0.00251, 138),
-                  140: Isotope(139.905434, 0.8845, 140),
-                  142: Isotope(141.90924, 0.11114, 142)}),
-    Element(
-        59, 'Pr', 'Praseodymium',
-        group=3, period=6, block='f', series=9,
-        mass=140.90765, eleneg=1.13, eleaffin=0.5,
-        covrad=1.65, atmrad=2.67, vdwrad=0.0,
-        tboil=3785.0, tmelt=1204.0, density=6.48,
-        eleconfig='[Xe] 4f3 6s2',
-        oxistates='4, 3*',
-        ionenergy=(5.473, 10.55, 21.62, 38.95, 57.45, ),
-        isotopes={141: Isotope(140.907648, 1.0, 141)}),
-    Element(
-        60, 'Nd', 'Neodymium',
-        group=3, period=6, block='f', series=9,
-        mass=144.24, eleneg=1.14, eleaffin=0.5,
-        covrad=1.64, atmrad=2.64, vdwrad=0.0,
-        tboil=3347.0, tmelt=1294.0, density=7.0,
-        eleconfig='[Xe] 4f4 6s2',
-        oxistates='3*',
-        ionenergy=(5.525, 10.72, ),
-        isotopes={142: Isotope(141.907719, 0.272, 142),
-                  143: Isotope(142.90981, 0.122, 143),
-                  144: Isotope(143.910083, 0.238, 144),
-                  145: Isotope(144.912569, 0.083, 145),
-                  146: Isotope(145.913112, 0.172, 146),
-                  148: Isotope(147.916889, 0.057, 148),
-                  150: Isotope(149.920887, 0.056, 150)}),
-    Element(
-        61, 'Pm', 'Promethium',
-        group=3, period=6, block='f', series=9,
-        mass=144.912744, eleneg=1.13, eleaffin=0.5,
-        covrad=1.63, atmrad=2.62, vdwrad=0.0,
-        tboil=3273.0, tmelt=1315.0, density=7.22,
-        eleconfig='[Xe] 4f5 6s2',
-        oxistates='3*',
-        ionenergy=(5.582, 10.9, ),
-        isotopes={145: Isotope(144.912744, 1.0, 145)}),
-    Element(
-        62, 'Sm', 'Samarium',
-        group=3, period=6, block='f', series=9,
-        mass=150.36, eleneg=1.17, eleaffin=0.5,
-        covrad=1.62, atmrad=2.59, vdwrad=0.0,
-        tboil=2067.0, tmelt=1347.0, density=7.54,
-        eleconfig='[Xe] 4f6 6s2',
-        oxistates='3*, 2',
-        ionenergy=(5.6437, 11.07, ),
-        isotopes={144: Isotope(143.911995, 0.0307, 144),
-                  147: Isotope(146.914893, 0.1499, 147),
-                  148: Isotope(147.914818, 0.1124, 148),
-                  149: Isotope(148.91718, 0.1382, 149),
-                  150: Isotope(149.917271, 0.0738, 150),
-                  152: Isotope(151.919728, 0.2675, 152),
-                  154: Isotope(153.922205, 0.2275, 154)}),
-    Element(
-        63, 'Eu', 'Europium',
-        group=3, period=6, block='f', series=9,
-        mass=151.964, eleneg=1.2, eleaffin=0.5,
-        covrad=1.85, atmrad=2.56, vdwrad=0.0,
-        tboil=1800.0, tmelt=1095.0, density=5.25,
-        eleconfig='[Xe] 4f7 6s2',
-        oxistates='3*, 2',
-        ionenergy=(5.6704, 11.25, ),
-        isotopes={151: Isotope(150.919846, 0.4781, 151),
-                  153: Isotope(152.921226, 0.5219, 153)}),
-    Element(
-        64, 'Gd', 'Gadolinium',
-        group=3, period=6, block='f', series=9,
-        mass=157.25, eleneg=1.2, eleaffin=0.5,
-        covrad=1.61, atmrad=2.54, vdwrad=0.0,
-        tboil=3545.0, tmelt=1585.0, density=7.89,
-        eleconfig='[Xe] 4f7 5d 6s2',
-        oxistates='3*',
-        ionenergy=(6.1498, 12.1, ),
-        isotopes={152: Isotope(151.919788, 0.002, 152),
-                  154: Isotope(153.920862, 0.0218, 154),
-                  155: Isotope(154.922619, 0.148, 155),
-                  156: Isotope(155.92212, 0.2047, 156),
-                  157: Isotope(156.923957, 0.1565, 157),
-                  158: Isotope(157.924101, 0.2484, 158),
-                  160: Isotope(159.927051, 0.2186, 160)}),
-    Element(
-        65, 'Tb', 'Terbium',
-        group=3, period=6, block='f', series=9,
-        mass=158.92534, eleneg=1.2, eleaffin=0.5,
-        covrad=1.59, atmrad=2.51, vdwrad=0.0,
-        tboil=3500.0, tmelt=1629.0, density=8.25,
-        eleconfig='[Xe] 4f9 6s2',
-        oxistates='4, 3*',
-        ionenergy=(5.8638, 11.52, ),
-        isotopes={159: Isotope(158.925343, 1.0, 159)}),
-    Element(
-        66, 'Dy', 'Dysprosium',
-        group=3, period=6, block='f', series=9,
-        mass=162.5, eleneg=1.22, eleaffin=0.5,
-        covrad=1.59, atmrad=2.49, vdwrad=0.0,
-        tboil=2840.0, tmelt=1685.0, density=8.56,
-        eleconfig='[Xe] 4f10 6s2',
-        oxistates='3*',
-        ionenergy=(5.9389, 11.67, ),
-        isotopes={156: Isotope(155.924278, 0.0006, 156),
-                  158: Isotope(157.924405, 0.001, 158),
-                  160: Isotope(159.925194, 0.0234, 160),
-                  161: Isotope(160.92693, 0.1891, 161),
-                  162: Isotope(161.926795, 0.2551, 162),
-                  163: Isotope(162.928728, 0.249, 163),
-                  164: Isotope(163.929171, 0.2818, 164)}),
-    Element(
-        67, 'Ho', 'Holmium',
-        group=3, period=6, block='f', series=9,
-        mass=164.93032, eleneg=1.23, eleaffin=0.5,
-        covrad=1.58, atmrad=2.47, vdwrad=0.0,
-        tboil=2968.0, tmelt=1747.0, density=8.78,
-        eleconfig='[Xe] 4f11 6s2',
-        oxistates='3*',
-        ionenergy=(6.0215, 11.8, ),
-        isotopes={165: Isotope(164.930319, 1.0, 165)}),
-    Element(
-        68, 'Er', 'Erbium',
-        group=3, period=6, block='f', series=9,
-        mass=167.259, eleneg=1.24, eleaffin=0.5,
-        covrad=1.57, atmrad=2.45, vdwrad=0.0,
-        tboil=3140.0, tmelt=1802.0, density=9.05,
-        eleconfig='[Xe] 4f12 6s2',
-        oxistates='3*',
-        ionenergy=(6.1077, 11.93, ),
-        isotopes={162: Isotope(161.928775, 0.0014, 162),
-                  164: Isotope(163.929197, 0.0161, 164),
-                  166: Isotope(165.93029, 0.3361, 166),
-                  167: Isotope(166.932045, 0.2293, 167),
-                  168: Isotope(167.932368, 0.2678, 168),
-                  170: Isotope(169.93546, 0.1493, 170)}),
-    Element(
-        69, 'Tm', 'Thulium',
-        group=3, period=6, block='f', series=9,
-        mass=168.93421, eleneg=1.25, eleaffin=0.5,
-        covrad=1.56, atmrad=2.42, vdwrad=0.0,
-        tboil=2223.0, tmelt=1818.0, density=9.32,
-        eleconfig='[Xe] 4f13 6s2',
-        oxistates='3*, 2',
-        ionenergy=(6.1843, 12.05, 23.71, ),
-        isotopes={169: Isotope(168.934211, 1.0, 169)}),
-    Element(
-        70, 'Yb', 'Ytterbium',
-        group=3, period=6, block='f', series=9,
-        mass=173.04, eleneg=1.1, eleaffin=0.5,
-        covrad=1.74, atmrad=2.4, vdwrad=0.0,
-        tboil=1469.0, tmelt=1092.0, density=9.32,
-        eleconfig='[Xe] 4f14 6s2',
-        oxistates='3*, 2',
-        ionenergy=(6.2542, 12.17, 25.2, ),
-        isotopes={168: Isotope(167.933894, 0.0013, 168),
-                  170: Isotope(169.934759, 0.0304, 170),
-                  171: Isotope(170.936322, 0.1428, 171),
-                  172: Isotope(171.9363777, 0.2183, 172),
-                  173: Isotope(172.9382068, 0.1613, 173),
-                  174: Isotope(173.9388581, 0.3183, 174),
-                  176: Isotope(175.942568, 0.1276, 176)}),
-    Element(
-        71, 'Lu', 'Lutetium',
-        group=3, period=6, block='d', series=9,
-        mass=174.967, eleneg=1.27, eleaffin=0.5,
-        covrad=1.56, atmrad=2.25, vdwrad=0.0,
-        tboil=3668.0, tmelt=1936.0, density=9.84,
-        eleconfig='[Xe] 4f14 5d 6s2',
-        oxistates='3*',
-        ionenergy=(5.4259, 13.9, ),
-        isotopes={175: Isotope(174.9407679, 0.9741, 175),
-                  176: Isotope(175.9426824, 0.0259, 176)}),
-    Element(
-        72, 'Hf', 'Hafnium',
-        group=4, period=6, block='d', series=8,
-        mass=178.49, eleneg=1.3, eleaffin=0.0,
-        covrad=1.44, atmrad=2.16, vdwrad=0.0,
-        tboil=4875.0, tmelt=2504.0, density=13.31,
-        eleconfig='[Xe] 4f14 5d2 6s2',
-        oxistates='4*',
-        ionenergy=(6.8251, 14.9, 23.3, 33.3, ),
-        isotopes={174: Isotope(173.94004, 0.0016, 174),
-                  176: Isotope(175.9414018, 0.0526, 176),
-                  177: Isotope(176.94322, 0.186, 177),
-                  178: Isotope(177.9436977, 0.2728, 178),
-                  179: Isotope(178.9458151, 0.1362, 179),
-                  180: Isotope(179.9465488, 0.3508, 180)}),
-    Element(
-        73, 'Ta', 'Tantalum',
-        group=5, period=6, block='d', series=8,
-        mass=180.9479, eleneg=1.5, eleaffin=0.322,
-        covrad=1.34, atmrad=2.09, vdwrad=0.0,
-        tboil=5730.0, tmelt=3293.0, density=16.68,
-        eleconfig='[Xe] 4f14 5d3 6s2',
-        oxistates='5*',
-        ionenergy=(7.5496, ),
-        isotopes={180: Isotope(179.947466, 0.00012, 180),
-                  181: Isotope(180.947996, 0.99988, 181)}),
-    Element(
-        74, 'W', 'Tungsten',
-        group=6, period=6, block='d', series=8,
-        mass=183.84, eleneg=2.36, eleaffin=0.815,
-        covrad=1.3, atmrad=2.02, vdwrad=0.0,
-        tboil=5825.0, tmelt=3695.0, density=19.26,
-        eleconfig='[Xe] 4f14 5d4 6s2',
-        oxistates='6*, 5, 4, 3, 2, 0',
-        ionenergy=(7.864, ),
-        isotopes={180: Isotope(179.946706, 0.0012, 180),
-                  182: Isotope(181.948206, 0.265, 182),
-                  183: Isotope(182.9502245, 0.1431, 183),
-                  184: Isotope(183.9509326, 0.3064, 184),
-                  186: Isotope(185.954362, 0.2843, 186)}),
-    Element(
-        75, 'Re', 'Rhenium',
-        group=7, period=6, block='d', series=8,
-        mass=186.207, eleneg=1.9, eleaffin=0.15,
-        covrad=1.28, atmrad=1.97, vdwrad=0.0,
-        tboil=5870.0, tmelt=3455.0, density=21.03,
-        eleconfig='[Xe] 4f14 5d5 6s2',
-        oxistates='7, 6, 4, 2, -1',
-        ionenergy=(7.8335, ),
-        isotopes={185: Isotope(184.9529557, 0.374, 185),
-                  187: Isotope(186.9557508, 0.626, 187)}),
-    Element(
-        76, 'Os', 'Osmium',
-        group=8, period=6, block='d', series=8,
-        mass=190.23, eleneg=2.2, eleaffin=1.0778,
-        covrad=1.26, atmrad=1.92, vdwrad=0.0,
-        tboil=5300.0, tmelt=3300.0, density=22.61,
-        eleconfig='[Xe] 4f14 5d6 6s2',
-        oxistates='8, 6, 4*, 3, 2, 0, -2',
-        ionenergy=(8.4382, ),
-        isotopes={184: Isotope(183.952491, 0.0002, 184),
-                  186: Isotope(185.953838, 0.0159, 186),
-                  187: Isotope(186.9557479, 0.0196, 187),
-                  188: Isotope(187.955836, 0.1324, 188),
-                  189: Isotope(188.9581449, 0.1615, 189),
-                  190: Isotope(189.958445, 0.2626, 190),
-                  192: Isotope(191.961479, 0.4078, 192)}),
-    Element(
-        77, 'Ir', 'Iridium',
-        group=9, period=6, block='d', series=8,
-        mass=192.217, eleneg=2.2, eleaffin=1.56436,
-        covrad=1.27, atmrad=1.87, vdwrad=0.0,
-        tboil=4700.0, tmelt=2720.0, density=22.65,
-        eleconfig='[Xe] 4f14 5d7 6s2',
-        oxistates='6, 4*, 3, 2, 1*, 0, -1',
-        ionenergy=(8.967, ),
-        isotopes={191: Isotope(190.960591, 0.373, 191),
-                  193: Isotope(192.962924, 0.627, 193)}),
-    Element(
-        78, 'Pt', 'Platinum',
-        group=10, period=6, block='d', series=8,
-        mass=195.078, eleneg=2.28, eleaffin=2.1251,
-        covrad=1.3, atmrad=1.83, vdwrad=1.75,
-        tboil=4100.0, tmelt=2042.1, density=21.45,
-        eleconfig='[Xe] 4f14 5d9 6s',
-        oxistates='4*, 2*, 0',
-        ionenergy=(8.9588, 18.563, ),
-        isotopes={190: Isotope(189.95993, 0.00014, 190),
-                  192: Isotope(191.961035, 0.00782, 192),
-                  194: Isotope(193.962664, 0.32967, 194),
-                  195: Isotope(194.964774, 0.33832, 195),
-                  196: Isotope(195.964935, 0.25242, 196),
-                  198: Isotope(197.967876, 0.07163, 198)}),
-    Element(
-        79, 'Au', 'Gold',
-        group=11, period=6, block='d', series=8,
-        mass=196.96655, eleneg=2.54, eleaffin=2.30861,
-        covrad=1.34, atmrad=1.79, vdwrad=1.66,
-        tboil=3130.0, tmelt=1337.58, density=19.32,
-        eleconfig='[Xe] 4f14 5d10 6s',
-        oxistates='3*, 1',
-        ionenergy=(9.2255, 20.5, ),
-        isotopes={197: Isotope(196.966552, 1.0, 197)}),
-    Element(
-        80, 'Hg', 'Mercury',
-        group=12, period=6, block='d', series=8,
-        mass=200.59, eleneg=2.0, eleaffin=0.0,
-        covrad=1.49, atmrad=1.76, vdwrad=0.0,
-        tboil=629.88, tmelt=234.31, density=13.55,
-        eleconfig='[Xe] 4f14 5d10 6s2',
-        oxistates='2*, 1',
-        ionenergy=(10.4375, 18.756, 34.2, ),
-        isotopes={196: Isotope(195.965815, 0.0015, 196),
-                  198: Isotope(197.966752, 0.0997, 198),
-                  199: Isotope(198.968262, 0.1687, 199),
-                  200: Isotope(199.968309, 0.231, 200),
-                  201: Isotope(200.970285, 0.1318, 201),
-                  202: Isotope(201.970626, 0.2986, 202),
-                  204: Isotope(203.973476, 0.0687, 204)}),
-    Element(
-        81, 'Tl', 'Thallium',
-        group=13, period=6, block='p', series=7,
-        mass=204.3833, eleneg=2.04, eleaffin=0.377,
-        covrad=1.48, atmrad=2.08, vdwrad=1.96,
-        tboil=1746.0, tmelt=577.0, density=11.85,
-        eleconfig='[Xe] 4f14 5d10 6s2 6p',
-        oxistates='3, 1*',
-        ionenergy=(6.1082, 20.428, 29.83, ),
-        isotopes={203: Isotope(202.972329, 0.29524, 203),
-                  205: Isotope(204.974412, 0.70476, 205)}),
-    Element(
-        82, 'Pb', 'Lead',
-        group=14, period=6, block='p', series=7,
-        mass=207.2, eleneg=2.33, eleaffin=0.364,
-        covrad=1.47, atmrad=1.81, vdwrad=2.02,
-        tboil=2023.0, tmelt=600.65, density=11.34,
-        eleconfig='[Xe] 4f14 5d10 6s2 6p2',
-        oxistates='4, 2*',
-        ionenergy=(7.4167, 15.032, 31.937, 42.32, 68.8, ),
-        isotopes={204: Isotope(203.973029, 0.014, 204),
-                  206: Isotope(205.974449, 0.241, 206),
-                  207: Isotope(206.975881, 0.221, 207),
-                  208: Isotope(207.976636, 0.524, 208)}),
-    Element(
-        83, 'Bi', 'Bismuth',
-        group=15, period=6, block='p', series=7,
-        mass=208.98038, eleneg=2.02, eleaffin=0.942363,
-        covrad=1.46, atmrad=1.63, vdwrad=0.0,
-        tboil=1837.0, tmelt=544.59, density=9.8,
-        eleconfig='[Xe] 4f14 5d10 6s2 6p3',
-        oxistates='5, 3*',
-        ionenergy=(7.2855, 16.69, 25.56, 45.3, 56.0,
-                   88.3, ),
-        isotopes={209: Isotope(208.980383, 1.0, 209)}),
-    Element(
-        84, 'Po', 'Polonium',
-        group=16, period=6, block='p', series=5,
-        mass=208.982416, eleneg=2.0, eleaffin=1.9,
-        covrad=1.46, atmrad=1.53, vdwrad=0.0,
-        tboil=0.0, tmelt=527.0, density=9.2,
-        eleconfig='[Xe] 4f14 5d10 6s2 6p4',
-        oxistates='6, 4*, 2',
-        ionenergy=(8.414, ),
-        isotopes={209: Isotope(208.982416, 1.0, 209)}),
-    Element(
-        85, 'At', 'Astatine',
-        group=17, period=6, block='p', series=6,
-        mass=209.9871, eleneg=2.2, eleaffin=2.8,
-        covrad=1.45, atmrad=1.43, vdwrad=0.0,
-        tboil=610.0, tmelt=575.0, density=0.0,
-        eleconfig='[Xe] 4f14 5d10 6s2 6p5',
-        oxistates='7, 5, 3, 1, -1*',
-        ionenergy=(),
-        isotopes={210: Isotope(209.987131, 1.0, 210)}),
-    Element(
-        86, 'Rn', 'Radon',
-        group=18, period=6, block='p', series=2,
-        mass=222.0176, eleneg=0.0, eleaffin=0.0,
-        covrad=0.0, atmrad=1.34, vdwrad=0.0,
-        tboil=211.4, tmelt=202.0, density=9.23,
-        eleconfig='[Xe] 4f14 5d10 6s2 6p6',
-        oxistates='2*',
-        ionenergy=(10.7485, ),
-        isotopes={222: Isotope(222.0175705, 1.0, 222)}),
-    Element(
-        87, 'Fr', 'Francium',
-        group=1, period=7, block='s', series=3,
-        mass=223.0197307, eleneg=0.7, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=950.0, tmelt=300.0, density=0.0,
-        eleconfig='[Rn] 7s',
-        oxistates='1*',
-        ionenergy=(4.0727, ),
-        isotopes={223: Isotope(223.0197307, 1.0, 223)}),
-    Element(
-        88, 'Ra', 'Radium',
-        group=2, period=7, block='s', series=4,
-        mass=226.025403, eleneg=0.9, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=1413.0, tmelt=973.0, density=5.5,
-        eleconfig='[Rn] 7s2',
-        oxistates='2*',
-        ionenergy=(5.2784, 10.147, ),
-        isotopes={226: Isotope(226.0254026, 1.0, 226)}),
-    Element(
-        89, 'Ac', 'Actinium',
-        group=3, period=7, block='f', series=10,
-        mass=227.027747, eleneg=1.1, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=3470.0, tmelt=1324.0, density=10.07,
-        eleconfig='[Rn] 6d 7s2',
-        oxistates='3*',
-        ionenergy=(5.17, 12.1, ),
-        isotopes={227: Isotope(227.027747, 1.0, 227)}),
-    Element(
-        90, 'Th', 'Thorium',
-        group=3, period=7, block='f', series=10,
-        mass=232.0381, eleneg=1.3, eleaffin=0.0,
-        covrad=1.65, atmrad=0.0, vdwrad=0.0,
-        tboil=5060.0, tmelt=2028.0, density=11.72,
-        eleconfig='[Rn] 6d2 7s2',
-        oxistates='4*',
-        ionenergy=(6.3067, 11.5, 20.0, 28.8, ),
-        isotopes={232: Isotope(232.0380504, 1.0, 232)}),
-    Element(
-        91, 'Pa', 'Protactinium',
-        group=3, period=7, block='f', series=10,
-        mass=231.03588, eleneg=1.5, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=4300.0, tmelt=1845.0, density=15.37,
-        eleconfig='[Rn] 5f2 6d 7s2',
-        oxistates='5*, 4',
-        ionenergy=(5.89, ),
-        isotopes={231: Isotope(231.0358789, 1.0, 231)}),
-    Element(
-        92, 'U', 'Uranium',
-        group=3, period=7, block='f', series=10,
-        mass=238.02891, eleneg=1.38, eleaffin=0.0,
-        covrad=1.42, atmrad=0.0, vdwrad=1.86,
-        tboil=4407.0, tmelt=1408.0, density=18.97,
-        eleconfig='[Rn] 5f3 6d 7s2',
-        oxistates='6*, 5, 4, 3',
-        ionenergy=(6.1941, ),
-        isotopes={234: Isotope(234.0409456, 5.5e-05, 234),
-                  235: Isotope(235.0439231, 0.0072, 235),
-                  238: Isotope(238.0507826, 0.992745, 238)}),
-    Element(
-        93, 'Np', 'Neptunium',
-        group=3, period=7, block='f', series=10,
-        mass=237.048167, eleneg=1.36, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=4175.0, tmelt=912.0, density=20.48,
-        eleconfig='[Rn] 5f4 6d 7s2',
-        oxistates='6, 5*, 4, 3',
-        ionenergy=(6.2657, ),
-        isotopes={237: Isotope(237.0481673, 1.0, 237)}),
-    Element(
-        94, 'Pu', 'Plutonium',
-        group=3, period=7, block='f', series=10,
-        mass=244.064198, eleneg=1.28, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=3505.0, tmelt=913.0, density=19.74,
-        eleconfig='[Rn] 5f6 7s2',
-        oxistates='6, 5, 4*, 3',
-        ionenergy=(6.026, ),
-        isotopes={244: Isotope(244.064198, 1.0, 244)}),
-    Element(
-        95, 'Am', 'Americium',
-        group=3, period=7, block='f', series=10,
-        mass=243.061373, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=2880.0, tmelt=1449.0, density=13.67,
-        eleconfig='[Rn] 5f7 7s2',
-        oxistates='6, 5, 4, 3*',
-        ionenergy=(5.9738, ),
-        isotopes={243: Isotope(243.0613727, 1.0, 243)}),
-    Element(
-        96, 'Cm', 'Curium',
-        group=3, period=7, block='f', series=10,
-        mass=247.070347, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1620.0, density=13.51,
-        eleconfig='[Rn] 5f7 6d 7s2',
-        oxistates='4, 3*',
-        ionenergy=(5.9914, ),
-        isotopes={247: Isotope(247.070347, 1.0, 247)}),
-    Element(
-        97, 'Bk', 'Berkelium',
-        group=3, period=7, block='f', series=10,
-        mass=247.070299, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1258.0, density=13.25,
-        eleconfig='[Rn] 5f9 7s2',
-        oxistates='4, 3*',
-        ionenergy=(6.1979, ),
-        isotopes={247: Isotope(247.070299, 1.0, 247)}),
-    Element(
-        98, 'Cf', 'Californium',
-        group=3, period=7, block='f', series=10,
-        mass=251.07958, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1172.0, density=15.1,
-        eleconfig='[Rn] 5f10 7s2',
-        oxistates='4, 3*',
-        ionenergy=(6.2817, ),
-        isotopes={251: Isotope(251.07958, 1.0, 251)}),
-    Element(
-        99, 'Es', 'Einsteinium',
-        group=3, period=7, block='f', series=10,
-        mass=252.08297, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1130.0, density=0.0,
-        eleconfig='[Rn] 5f11 7s2',
-        oxistates='3*',
-        ionenergy=(6.42, ),
-        isotopes={252: Isotope(252.08297, 1.0, 252)}),
-    Element(
-        100, 'Fm', 'Fermium',
-        group=3, period=7, block='f', series=10,
-        mass=257.095099, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1800.0, density=0.0,
-        eleconfig='[Rn] 5f12 7s2',
-        oxistates='3*',
-        ionenergy=(6.5, ),
-        isotopes={257: Isotope(257.095099, 1.0, 257)}),
-    Element(
-        101, 'Md', 'Mendelevium',
-        group=3, period=7, block='f', series=10,
-        mass=258.098425, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1100.0, density=0.0,
-        eleconfig='[Rn] 5f13 7s2',
-        oxistates='3*',
-        ionenergy=(6.58, ),
-        isotopes={258: Isotope(258.098425, 1.0, 258)}),
-    Element(
-        102, 'No', 'Nobelium',
-        group=3, period=7, block='f', series=10,
-        mass=259.10102, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1100.0, density=0.0,
-        eleconfig='[Rn] 5f14 7s2',
-        oxistates='3, 2*',
-        ionenergy=(6.65, ),
-        isotopes={259: Isotope(259.10102, 1.0, 259)}),
-    Element(
-        103, 'Lr', 'Lawrencium',
-        group=3, period=7, block='d', series=10,
-        mass=262.10969, eleneg=1.3, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=1900.0, density=0.0,
-        eleconfig='[Rn] 5f14 6d 7s2',
-        oxistates='3*',
-        ionenergy=(4.9, ),
-        isotopes={262: Isotope(262.10969, 1.0, 262)}),
-    Element(
-        104, 'Rf', 'Rutherfordium',
-        group=4, period=7, block='d', series=8,
-        mass=261.10875, eleneg=0.0, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=0.0, density=0.0,
-        eleconfig='[Rn] 5f14 6d2 7s2',
-        oxistates='*',
-        ionenergy=(6.0, ),
-        isotopes={261: Isotope(261.10875, 1.0, 261)}),
-    Element(
-        105, 'Db', 'Dubnium',
-        group=5, period=7, block='d', series=8,
-        mass=262.11415, eleneg=0.0, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=0.0, density=0.0,
-        eleconfig='[Rn] 5f14 6d3 7s2',
-        oxistates='*',
-        ionenergy=(),
-        isotopes={262: Isotope(262.11415, 1.0, 262)}),
-    Element(
-        106, 'Sg', 'Seaborgium',
-        group=6, period=7, block='d', series=8,
-        mass=266.12193, eleneg=0.0, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=0.0, density=0.0,
-        eleconfig='[Rn] 5f14 6d4 7s2',
-        oxistates='*',
-        ionenergy=(),
-        isotopes={266: Isotope(266.12193, 1.0, 266)}),
-    Element(
-        107, 'Bh', 'Bohrium',
-        group=7, period=7, block='d', series=8,
-        mass=264.12473, eleneg=0.0, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=0.0, density=0.0,
-        eleconfig='[Rn] 5f14 6d5 7s2',
-        oxistates='*',
-        ionenergy=(),
-        isotopes={264: Isotope(264.12473, 1.0, 264)}),
-    Element(
-        108, 'Hs', 'Hassium',
-        group=8, period=7, block='d', series=8,
-        mass=269.13411, eleneg=0.0, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=0.0, density=0.0,
-        eleconfig='[Rn] 5f14 6d6 7s2',
-        oxistates='*',
-        ionenergy=(),
-        isotopes={269: Isotope(269.13411, 1.0, 269)}),
-    Element(
-        109, 'Mt', 'Meitnerium',
-        group=9, period=7, block='d', series=8,
-        mass=268.13882, eleneg=0.0, eleaffin=0.0,
-        covrad=0.0, atmrad=0.0, vdwrad=0.0,
-        tboil=0.0, tmelt=0.0, density=0.0,
-        eleconfig='[Rn] 5f14 6d7 7s2',
-        oxistates='*',
-        ionenergy=(),
-        isotopes={268: Isotope(268.13882, 1.0, 268)}))
+# Core properties of each element, one row per element in order of atomic
+# number.  Element objects are built from these rows on first access.
+_CORE_FIELDS = (
+    'number', 'symbol', 'name', 'group', 'period', 'block', 'series',
+    'mass', 'eleneg', 'eleaffin', 'covrad', 'atmrad', 'vdwrad',
+    'tboil', 'tmelt', 'density', 'eleconfig', 'oxistates')
+
+_CORE = (
+    (1, 'H', 'Hydrogen', 1, 1, 's', 1, 1.00794, 2.2, 0.75420375, 0.32, 0.79, 1.2, 20.28, 13.81, 0.084, '1s', '1*, -1'),
+    (2, 'He', 'Helium', 18, 1, 's', 2, 4.002602, 0.0, 0.0, 0.93, 0.49, 1.4, 4.216, 0.95, 0.1785, '1s2', '*'),
+    (3, 'Li', 'Lithium', 1, 2, 's', 3, 6.941, 0.98, 0.618049, 1.23, 2.05, 1.82, 1615.0, 453.7, 0.53, '[He] 2s', '1*'),
+    (4, 'Be', 'Beryllium', 2, 2, 's', 4, 9.012182, 1.57, 0.0, 0.9, 1.4, 0.0, 3243.0, 1560.0, 1.85, '[He] 2s2', '2*'),
+    (5, 'B', 'Boron', 13, 2, 'p', 5, 10.811, 2.04, 0.279723, 0.82, 1.17, 0.0, 4275.0, 2365.0, 2.46, '[He] 2s2 2p', '3*'),
+    (6, 'C', 'Carbon', 14, 2, 'p', 1, 12.0107, 2.55, 1.262118, 0.77, 0.91, 1.7, 5100.0, 3825.0, 3.51, '[He] 2s2 2p2', '4*, 2, -4*'),
+    (7, 'N', 'Nitrogen', 15, 2, 'p', 1, 14.0067, 3.04, -0.07, 0.75, 0.75, 1.55, 77.344, 63.15, 1.17, '[He] 2s2 2p3', '5, 4, 3, 2, -3*'),
+    (8, 'O', 'Oxygen', 16, 2, 'p', 1, 15.9994, 3.44, 1.461112, 0.73, 0.65, 1.52, 90.188, 54.8, 1.33, '[He] 2s2 2p4', '-2*, -1'),
+    (9, 'F', 'Fluorine', 17, 2, 'p', 6, 18.9984032, 3.98, 3.4011887, 0.72, 0.57, 1.47, 85.0, 53.55, 1.58, '[He] 2s2 2p5', '-1*'),
+    (10, 'Ne', 'Neon', 18, 2, 'p', 2, 20.1797, 0.0, 0.0, 0.71, 0.51, 1.54, 27.1, 24.55, 0.8999, '[He] 2s2 2p6', '*'),
+    (11, 'Na', 'Sodium', 1, 3, 's', 3, 22.98977, 0.93, 0.547926, 1.54, 2.23, 2.27, 1156.0, 371.0, 0.97, '[Ne] 3s', '1*'),
+    (12, 'Mg', 'Magnesium', 2, 3, 's', 4, 24.305, 1.31, 0.0, 1.36, 1.72, 1.73, 1380.0, 922.0, 1.74, '[Ne] 3s2', '2*'),
+    (13, 'Al', 'Aluminium', 13, 3, 'p', 7, 26.981538, 1.61, 0.43283, 1.18, 1.82, 0.0, 2740.0, 933.5, 2.7, '[Ne] 3s2 3p', '3*'),
+    (14, 'Si', 'Silicon', 14, 3, 'p', 5, 28.0855, 1.9, 1.389521, 1.11, 1.46, 2.1, 2630.0, 1683.0, 2.33, '[Ne] 3s2 3p2', '4*, -4'),
+    (15, 'P', 'Phosphorus', 15, 3, 'p', 1, 30.973761, 2.19, 0.7465, 1.06, 1.23, 1.8, 553.0, 317.3, 1.82, '[Ne] 3s2 3p3', '5*, 3, -3'),
+    (16, 'S', 'Sulfur', 16, 3, 'p', 1, 32.065, 2.58, 2.0771029, 1.02, 1.09, 1.8, 717.82, 392.2, 2.06, '[Ne] 3s2 3p4', '6*, 4, 2, -2'),
+    (17, 'Cl', 'Chlorine', 17, 3, 'p', 6, 35.453, 3.16, 3.612724, 0.99, 0.97, 1.75, 239.18, 172.17, 2.95, '[Ne] 3s2 3p5', '7, 5, 3, 1, -1*'),
+    (18, 'Ar', 'Argon', 18, 3, 'p', 2, 39.948, 0.0, 0.0, 0.98, 0.88, 1.88, 87.45, 83.95, 1.66, '[Ne] 3s2 3p6', '*'),
+    (19, 'K', 'Potassium', 1, 4, 's', 3, 39.0983, 0.82, 0.501459, 2.03, 2.77, 2.75, 1033.0, 336.8, 0.86, '[Ar] 4s', '1*'),
+    (20, 'Ca', 'Calcium', 2, 4, 's', 4, 40.078, 1.0, 0.02455, 1.74, 2.23, 0.0, 1757.0, 1112.0, 1.54, '[Ar] 4s2', '2*'),
+    (21, 'Sc', 'Scandium', 3, 4, 'd', 8, 44.95591, 1.36, 0.188, 1.44, 2.09, 0.0, 3109.0, 1814.0, 2.99, '[Ar] 3d 4s2', '3*'),
+    (22, 'Ti', 'Titanium', 4, 4, 'd', 8, 47.867, 1.54, 0.084, 1.32, 2.0, 0.0, 3560.0, 1935.0, 4.51, '[Ar] 3d2 4s2', '4*, 3'),
+    (23, 'V', 'Vanadium', 5, 4, 'd', 8, 50.9415, 1.63, 0.525, 1.22, 1.92, 0.0, 3650.0, 2163.0, 6.09, '[Ar] 3d3 4s2', '5*, 4, 3, 2, 0'),
+    (24, 'Cr', 'Chromium', 6, 4, 'd', 8, 51.9961, 1.66, 0.67584, 1.18, 1.85, 0.0, 2945.0, 2130.0, 7.14, '[Ar] 3d5 4s', '6, 3*, 2, 0'),
+    (25, 'Mn', 'Manganese', 7, 4, 'd', 8, 54.938049, 1.55, 0.0, 1.17, 1.79, 0.0, 2235.0, 1518.0, 7.44, '[Ar] 3d5 4s2', '7, 6, 4, 3, 2*, 0, -1'),
+    (26, 'Fe', 'Iron', 8, 4, 'd', 8, 55.845, 1.83, 0.151, 1.17, 1.72, 0.0, 3023.0, 1808.0, 7.874, '[Ar] 3d6 4s2', '6, 3*, 2, 0, -2'),
+    (27, 'Co', 'Cobalt', 9, 4, 'd', 8, 58.9332, 1.88, 0.6633, 1.16, 1.67, 0.0, 3143.0, 1768.0, 8.89, '[Ar] 3d7 4s2', '3, 2*, 0, -1'),
+    (28, 'Ni', 'Nickel', 10, 4, 'd', 8, 58.6934, 1.91, 1.15716, 1.15, 1.62, 1.63, 3005.0, 1726.0, 8.91, '[Ar] 3d8 4s2', '3, 2*, 0'),
+    (29, 'Cu', 'Copper', 11, 4, 'd', 8, 63.546, 1.9, 1.23578, 1.17, 1.57, 1.4, 2840.0, 1356.6, 8.92, '[Ar] 3d10 4s', '2*, 1'),
+    (30, 'Zn', 'Zinc', 12, 4, 'd', 8, 65.409, 1.65, 0.0, 1.25, 1.53, 1.39, 1180.0, 692.73, 7.14, '[Ar] 3d10 4s2', '2*'),
+    (31, 'Ga', 'Gallium', 13, 4, 'p', 7, 69.723, 1.81, 0.41, 1.26, 1.81, 1.87, 2478.0, 302.92, 5.91, '[Ar] 3d10 4s2 4p', '3*'),
+    (32, 'Ge', 'Germanium', 14, 4, 'p', 5, 72.64, 2.01, 1.232712, 1.22, 1.52, 0.0, 3107.0, 1211.5, 5.32, '[Ar] 3d10 4s2 4p2', '4*'),
+    (33, 'As', 'Arsenic', 15, 4, 'p', 5, 74.9216, 2.18, 0.814, 1.2, 1.33, 1.85, 876.0, 1090.0, 5.72, '[Ar] 3d10 4s2 4p3', '5, 3*, -3'),
+    (34, 'Se', 'Selenium', 16, 4, 'p', 1, 78.96, 2.55, 2.02067, 1.16, 1.22, 1.9, 958.0, 494.0, 4.82, '[Ar] 3d10 4s2 4p4', '6, 4*, -2'),
+    (35, 'Br', 'Bromine', 17, 4, 'p', 6, 79.904, 2.96, 3.363588, 1.14, 1.12, 1.85, 331.85, 265.95, 3.14, '[Ar] 3d10 4s2 4p5', '7, 5, 3, 1, -1*'),
+    (36, 'Kr', 'Krypton', 18, 4, 'p', 2, 83.798, 0.0, 0.0, 1.12, 1.03, 2.02, 120.85, 116.0, 4.48, '[Ar] 3d10 4s2 4p6', '2*'),
+    (37, 'Rb', 'Rubidium', 1, 5, 's', 3, 85.4678, 0.82, 0.485916, 2.16, 2.98, 0.0, 961.0, 312.63, 1.53, '[Kr] 5s', '1*'),
+    (38, 'Sr', 'Strontium', 2, 5, 's', 4, 87.62, 0.95, 0.05206, 1.91, 2.45, 0.0, 1655.0, 1042.0, 2.63, '[Kr] 5s2', '2*'),
+    (39, 'Y', 'Yttrium', 3, 5, 'd', 8, 88.90585, 1.22, 0.307, 1.62, 2.27, 0.0, 3611.0, 1795.0, 4.47, '[Kr] 4d 5s2', '3*'),
+    (40, 'Zr', 'Zirconium', 4, 5, 'd', 8, 91.224, 1.33, 0.426, 1.45, 2.16, 0.0, 4682.0, 2128.0, 6.51, '[Kr] 4d2 5s2', '4*'),
+    (41, 'Nb', 'Niobium', 5, 5, 'd', 8, 92.90638, 1.6, 0.893, 1.34, 2.08, 0.0, 5015.0, 2742.0, 8.58, '[Kr] 4d4 5s', '5*, 3'),
+    (42, 'Mo', 'Molybdenum', 6, 5, 'd', 8, 95.94, 2.16, 0.7472, 1.3, 2.01, 0.0, 4912.0, 2896.0, 10.28, '[Kr] 4d5 5s', '6*, 5, 4, 3, 2, 0'),
+    (43, 'Tc', 'Technetium', 7, 5, 'd', 8, 97.907216, 1.9, 0.55, 1.27, 1.95, 0.0, 4538.0, 2477.0, 11.49, '[Kr] 4d5 5s2', '7*'),
+    (44, 'Ru', 'Ruthenium', 8, 5, 'd', 8, 101.07, 2.2, 1.04638, 1.25, 1.89, 0.0, 4425.0, 2610.0, 12.45, '[Kr] 4d7 5s', '8, 6, 4*, 3*, 2, 0, -2'),
+    (45, 'Rh', 'Rhodium', 9, 5, 'd', 8, 102.9055, 2.28, 1.14289, 1.25, 1.83, 0.0, 3970.0, 2236.0, 12.41, '[Kr] 4d8 5s', '5, 4, 3*, 1*, 2, 0'),
+    (46, 'Pd', 'Palladium', 10, 5, 'd', 8, 106.42, 2.2, 0.56214, 1.28, 1.79, 1.63, 3240.0, 1825.0, 12.02, '[Kr] 4d10', '4, 2*, 0'),
+    (47, 'Ag', 'Silver', 11, 5, 'd', 8, 107.8682, 1.93, 1.30447, 1.34, 1.75, 1.72, 2436.0, 1235.1, 10.49, '[Kr] 4d10 5s', '2, 1*'),
+    (48, 'Cd', 'Cadmium', 12, 5, 'd', 8, 112.411, 1.69, 0.0, 1.48, 1.71, 1.58, 1040.0, 594.26, 8.64, '[Kr] 4d10 5s2', '2*'),
+    (49, 'In', 'Indium', 13, 5, 'p', 7, 114.818, 1.78, 0.404, 1.44, 2.0, 1.93, 2350.0, 429.78, 7.31, '[Kr] 4d10 5s2 5p', '3*'),
+    (50, 'Sn', 'Tin', 14, 5, 'p', 7, 118.71, 1.96, 1.112066, 1.41, 1.72, 2.17, 2876.0, 505.12, 7.29, '[Kr] 4d10 5s2 5p2', '4*, 2*'),
+    (51, 'Sb', 'Antimony', 15, 5, 'p', 5, 121.76, 2.05, 1.047401, 1.4, 1.53, 0.0, 1860.0, 903.91, 6.69, '[Kr] 4d10 5s2 5p3', '5, 3*, -3'),
+    (52, 'Te', 'Tellurium', 16, 5, 'p', 5, 127.6, 2.1, 1.970875, 1.36, 1.42, 2.06, 1261.0, 722.72, 6.25, '[Kr] 4d10 5s2 5p4', '6, 4*, -2'),
+    (53, 'I', 'Iodine', 17, 5, 'p', 6, 126.90447, 2.66, 3.059038, 1.33, 1.32, 1.98, 457.5, 386.7, 4.94, '[Kr] 4d10 5s2 5p5', '7, 5, 1, -1*'),
+    (54, 'Xe', 'Xenon', 18, 5, 'p', 2, 131.293, 0.0, 0.0, 1.31, 1.24, 2.16, 165.1, 161.39, 4.49, '[Kr] 4d10 5s2 5p6', '2, 4, 6'),
+    (55, 'Cs', 'Caesium', 1, 6, 's', 3, 132.90545, 0.79, 0.471626, 2.35, 3.34, 0.0, 944.0, 301.54, 1.9, '[Xe] 6s', '1*'),
+    (56, 'Ba', 'Barium', 2, 6, 's', 4, 137.327, 0.89, 0.14462, 1.98, 2.78, 0.0, 2078.0, 1002.0, 3.65, '[Xe] 6s2', '2*'),
+    (57, 'La', 'Lanthanum', 3, 6, 'f', 9, 138.9055, 1.1, 0.47, 1.69, 2.74, 0.0, 3737.0, 1191.0, 6.16, '[Xe] 5d 6s2', '3*'),
+    (58, 'Ce', 'Cerium', 3, 6, 'f', 9, 140.116, 1.12, 0.5, 1.65, 2.7, 0.0, 3715.0, 1071.0, 6.77, '[Xe] 4f 5d 6s2', '4, 3*'),
+    (59, 'Pr', 'Praseodymium', 3, 6, 'f', 9, 140.90765, 1.13, 0.5, 1.65, 2.67, 0.0, 3785.0, 1204.0, 6.48, '[Xe] 4f3 6s2', '4, 3*'),
+    (60, 'Nd', 'Neodymium', 3, 6, 'f', 9, 144.24, 1.14, 0.5, 1.64, 2.64, 0.0, 3347.0, 1294.0, 7.0, '[Xe] 4f4 6s2', '3*'),
+    (61, 'Pm', 'Promethium', 3, 6, 'f', 9, 144.912744, 1.13, 0.5, 1.63, 2.62, 0.0, 3273.0, 1315.0, 7.22, '[Xe] 4f5 6s2', '3*'),
+    (62, 'Sm', 'Samarium', 3, 6, 'f', 9, 150.36, 1.17, 0.5, 1.62, 2.59, 0.0, 2067.0, 1347.0, 7.54, '[Xe] 4f6 6s2', '3*, 2'),
+    (63, 'Eu', 'Europium', 3, 6, 'f', 9, 151.964, 1.2, 0.5, 1.85, 2.56, 0.0, 1800.0, 1095.0, 5.25, '[Xe] 4f7 6s2', '3*, 2'),
+    (64, 'Gd', 'Gadolinium', 3, 6, 'f', 9, 157.25, 1.2, 0.5, 1.61, 2.54, 0.0, 3545.0, 1585.0, 7.89, '[Xe] 4f7 5d 6s2', '3*'),
+    (65, 'Tb', 'Terbium', 3, 6, 'f', 9, 158.92534, 1.2, 0.5, 1.59, 2.51, 0.0, 3500.0, 1629.0, 8.25, '[Xe] 4f9 6s2', '4, 3*'),
+    (66, 'Dy', 'Dysprosium', 3, 6, 'f', 9, 162.5, 1.22, 0.5, 1.59, 2.49, 0.0, 2840.0, 1685.0, 8.56, '[Xe] 4f10 6s2', '3*'),
+    (67, 'Ho', 'Holmium', 3, 6, 'f', 9, 164.93032, 1.23, 0.5, 1.58, 2.47, 0.0, 2968.0, 1747.0, 8.78, '[Xe] 4f11 6s2', '3*'),
+    (68, 'Er', 'Erbium', 3, 6, 'f', 9, 167.259, 1.24, 0.5, 1.57, 2.45, 0.0, 3140.0, 1802.0, 9.05, '[Xe] 4f12 6s2', '3*'),
+    (69, 'Tm', 'Thulium', 3, 6, 'f', 9, 168.93421, 1.25, 0.5, 1.56, 2.42, 0.0, 2223.0, 1818.0, 9.32, '[Xe] 4f13 6s2', '3*, 2'),
+    (70, 'Yb', 'Ytterbium', 3, 6, 'f', 9, 173.04, 1.1, 0.5, 1.74, 2.4, 0.0, 1469.0, 1092.0, 9.32, '[Xe] 4f14 6s2', '3*, 2'),
+    (71, 'Lu', 'Lutetium', 3, 6, 'd', 9, 174.967, 1.27, 0.5, 1.56, 2.25, 0.0, 3668.0, 1936.0, 9.84, '[Xe] 4f14 5d 6s2', '3*'),
+    (72, 'Hf', 'Hafnium', 4, 6, 'd', 8, 178.49, 1.3, 0.0, 1.44, 2.16, 0.0, 4875.0, 2504.0, 13.31, '[Xe] 4f14 5d2 6s2', '4*'),
+    (73, 'Ta', 'Tantalum', 5, 6, 'd', 8, 180.9479, 1.5, 0.322, 1.34, 2.09, 0.0, 5730.0, 3293.0, 16.68, '[Xe] 4f14 5d3 6s2', '5*'),
+    (74, 'W', 'Tungsten', 6, 6, 'd', 8, 183.84, 2.36, 0.815, 1.3, 2.02, 0.0, 5825.0, 3695.0, 19.26, '[Xe] 4f14 5d4 6s2', '6*, 5, 4, 3, 2, 0'),
+    (75, 'Re', 'Rhenium', 7, 6, 'd', 8, 186.207, 1.9, 0.15, 1.28, 1.97, 0.0, 5870.0, 3455.0, 21.03, '[Xe] 4f14 5d5 6s2', '7, 6, 4, 2, -1'),
+    (76, 'Os', 'Osmium', 8, 6, 'd', 8, 190.23, 2.2, 1.0778, 1.26, 1.92, 0.0, 5300.0, 3300.0, 22.61, '[Xe] 4f14 5d6 6s2', '8, 6, 4*, 3, 2, 0, -2'),
+    (77, 'Ir', 'Iridium', 9, 6, 'd', 8, 192.217, 2.2, 1.56436, 1.27, 1.87, 0.0, 4700.0, 2720.0, 22.65, '[Xe] 4f14 5d7 6s2', '6, 4*, 3, 2, 1*, 0, -1'),
+    (78, 'Pt', 'Platinum', 10, 6, 'd', 8, 195.078, 2.28, 2.1251, 1.3, 1.83, 1.75, 4100.0, 2042.1, 21.45, '[Xe] 4f14 5d9 6s', '4*, 2*, 0'),
+    (79, 'Au', 'Gold', 11, 6, 'd', 8, 196.96655, 2.54, 2.30861, 1.34, 1.79, 1.66, 3130.0, 1337.58, 19.32, '[Xe] 4f14 5d10 6s', '3*, 1'),
+    (80, 'Hg', 'Mercury', 12, 6, 'd', 8, 200.59, 2.0, 0.0, 1.49, 1.76, 0.0, 629.88, 234.31, 13.55, '[Xe] 4f14 5d10 6s2', '2*, 1'),
+    (81, 'Tl', 'Thallium', 13, 6, 'p', 7, 204.3833, 2.04, 0.377, 1.48, 2.08, 1.96, 1746.0, 577.0, 11.85, '[Xe] 4f14 5d10 6s2 6p', '3, 1*'),
+    (82, 'Pb', 'Lead', 14, 6, 'p', 7, 207.2, 2.33, 0.364, 1.47, 1.81, 2.02, 2023.0, 600.65, 11.34, '[Xe] 4f14 5d10 6s2 6p2', '4, 2*'),
+    (83, 'Bi', 'Bismuth', 15, 6, 'p', 7, 208.98038, 2.02, 0.942363, 1.46, 1.63, 0.0, 1837.0, 544.59, 9.8, '[Xe] 4f14 5d10 6s2 6p3', '5, 3*'),
+    (84, 'Po', 'Polonium', 16, 6, 'p', 5, 208.982416, 2.0, 1.9, 1.46, 1.53, 0.0, 0.0, 527.0, 9.2, '[Xe] 4f14 5d10 6s2 6p4', '6, 4*, 2'),
+    (85, 'At', 'Astatine', 17, 6, 'p', 6, 209.9871, 2.2, 2.8, 1.45, 1.43, 0.0, 610.0, 575.0, 0.0, '[Xe] 4f14 5d10 6s2 6p5', '7, 5, 3, 1, -1*'),
+    (86, 'Rn', 'Radon', 18, 6, 'p', 2, 222.0176, 0.0, 0.0, 0.0, 1.34, 0.0, 211.4, 202.0, 9.23, '[Xe] 4f14 5d10 6s2 6p6', '2*'),
+    (87, 'Fr', 'Francium', 1, 7, 's', 3, 223.0197307, 0.7, 0.0, 0.0, 0.0, 0.0, 950.0, 300.0, 0.0, '[Rn] 7s', '1*'),
+    (88, 'Ra', 'Radium', 2, 7, 's', 4, 226.025403, 0.9, 0.0, 0.0, 0.0, 0.0, 1413.0, 973.0, 5.5, '[Rn] 7s2', '2*'),
+    (89, 'Ac', 'Actinium', 3, 7, 'f', 10, 227.027747, 1.1, 0.0, 0.0, 0.0, 0.0, 3470.0, 1324.0, 10.07, '[Rn] 6d 7s2', '3*'),
+    (90, 'Th', 'Thorium', 3, 7, 'f', 10, 232.0381, 1.3, 0.0, 1.65, 0.0, 0.0, 5060.0, 2028.0, 11.72, '[Rn] 6d2 7s2', '4*'),
+    (91, 'Pa', 'Protactinium', 3, 7, 'f', 10, 231.03588, 1.5, 0.0, 0.0, 0.0, 0.0, 4300.0, 1845.0, 15.37, '[Rn] 5f2 6d 7s2', '5*, 4'),
+    (92, 'U', 'Uranium', 3, 7, 'f', 10, 238.02891, 1.38, 0.0, 1.42, 0.0, 1.86, 4407.0, 1408.0, 18.97, '[Rn] 5f3 6d 7s2', '6*, 5, 4, 3'),
+    (93, 'Np', 'Neptunium', 3, 7, 'f', 10, 237.048167, 1.36, 0.0, 0.0, 0.0, 0.0, 4175.0, 912.0, 20.48, '[Rn] 5f4 6d 7s2', '6, 5*, 4, 3'),
+    (94, 'Pu', 'Plutonium', 3, 7, 'f', 10, 244.064198, 1.28, 0.0, 0.0, 0.0, 0.0, 3505.0, 913.0, 19.74, '[Rn] 5f6 7s2', '6, 5, 4*, 3'),
+    (95, 'Am', 'Americium', 3, 7, 'f', 10, 243.061373, 1.3, 0.0, 0.0, 0.0, 0.0, 2880.0, 1449.0, 13.67, '[Rn] 5f7 7s2', '6, 5, 4, 3*'),
+    (96, 'Cm', 'Curium', 3, 7, 'f', 10, 247.070347, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1620.0, 13.51, '[Rn] 5f7 6d 7s2', '4, 3*'),
+    (97, 'Bk', 'Berkelium', 3, 7, 'f', 10, 247.070299, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1258.0, 13.25, '[Rn] 5f9 7s2', '4, 3*'),
+    (98, 'Cf', 'Californium', 3, 7, 'f', 10, 251.07958, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1172.0, 15.1, '[Rn] 5f10 7s2', '4, 3*'),
+    (99, 'Es', 'Einsteinium', 3, 7, 'f', 10, 252.08297, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1130.0, 0.0, '[Rn] 5f11 7s2', '3*'),
+    (100, 'Fm', 'Fermium', 3, 7, 'f', 10, 257.095099, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1800.0, 0.0, '[Rn] 5f12 7s2', '3*'),
+    (101, 'Md', 'Mendelevium', 3, 7, 'f', 10, 258.098425, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1100.0, 0.0, '[Rn] 5f13 7s2', '3*'),
+    (102, 'No', 'Nobelium', 3, 7, 'f', 10, 259.10102, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1100.0, 0.0, '[Rn] 5f14 7s2', '3, 2*'),
+    (103, 'Lr', 'Lawrencium', 3, 7, 'd', 10, 262.10969, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 1900.0, 0.0, '[Rn] 5f14 6d 7s2', '3*'),
+    (104, 'Rf', 'Rutherfordium', 4, 7, 'd', 8, 261.10875, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '[Rn] 5f14 6d2 7s2', '*'),
+    (105, 'Db', 'Dubnium', 5, 7, 'd', 8, 262.11415, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '[Rn] 5f14 6d3 7s2', '*'),
+    (106, 'Sg', 'Seaborgium', 6, 7, 'd', 8, 266.12193, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '[Rn] 5f14 6d4 7s2', '*'),
+    (107, 'Bh', 'Bohrium', 7, 7, 'd', 8, 264.12473, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '[Rn] 5f14 6d5 7s2', '*'),
+    (108, 'Hs', 'Hassium', 8, 7, 'd', 8, 269.13411, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '[Rn] 5f14 6d6 7s2', '*'),
+    (109, 'Mt', 'Meitnerium', 9, 7, 'd', 8, 268.13882, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '[Rn] 5f14 6d7 7s2', '*'),
+)
+
+
+def _ionenergy_isotopes(number):
+    """Delay load ionization energies and isotopes.
+
+    Return (ionenergy, isotopes) of element with atomic number.
+
+    """
+    global _IONENERGY_ISOTOPES
+    if _IONENERGY_ISOTOPES is None:
+        _IONENERGY_ISOTOPES = {
+            1: ((13.5984, ),
+                {1: Isotope(1.0078250321, 0.999885, 1),
+                 2: Isotope(2.014101778, 0.000115, 2)}),
+            2: ((24.5874, 54.416, ),
+                {3: Isotope(3.0160293097, 1.37e-06, 3),
+                 4: Isotope(4.0026032497, 0.99999863, 4)}),
+            3: ((5.3917, 75.638, 122.451, ),
+                {6: Isotope(6.0151223, 0.0759, 6),
+                 7: Isotope(7.016004, 0.9241, 7)}),
+            4: ((9.3227, 18.211, 153.893, 217.713, ),
+                {9: Isotope(9.0121821, 1.0, 9)}),
+            5: ((8.298, 25.154, 37.93, 59.368, 340.217, ),
+                {10: Isotope(10.012937, 0.199, 10),
+                 11: Isotope(11.0093055, 0.801, 11)}),
+            6: ((11.2603, 24.383, 47.877, 64.492, 392.077,
+                 489.981, ),
+                {12: Isotope(12.0, 0.9893, 12),
+                 13: Isotope(13.0033548378, 0.0107, 13)}),
+            7: ((14.5341, 39.601, 47.488, 77.472, 97.888,
+                 522.057, 667.029, ),
+                {14: Isotope(14.0030740052, 0.99632, 14),
+                 15: Isotope(15.0001088984, 0.00368, 15)}),
+            8: ((13.6181, 35.116, 54.934, 77.412,
+                 113.896, 138.116, 739.315, 871.387, ),
+                {16: Isotope(15.9949146221, 0.99757, 16),
+                 17: Isotope(16.9991315, 0.00038, 17),
+                 18: Isotope(17.9991604, 0.00205, 18)}),
+            9: ((17.4228, 34.97, 62.707, 87.138, 114.24,
+                 157.161, 185.182, 953.886, 1103.089, ),
+                {19: Isotope(18.9984032, 1.0, 19)}),
+            10: ((21.5645, 40.962, 63.45, 97.11, 126.21,
+                 157.93, 207.27, 239.09, 1195.797, 1362.164, ),
+                {20: Isotope(19.9924401759, 0.9048, 20),
+                 21: Isotope(20.99384674, 0.0027, 21),
+                 22: Isotope(21.99138551, 0.0925, 22)}),
+            11: ((5.1391, 47.286, 71.64, 98.91, 138.39,
+                 172.15, 208.47, 264.18, 299.87, 1465.091,
+                 1648.659, ),
+                {23: Isotope(22.98976967, 1.0, 23)}),
+            12: ((7.6462, 15.035, 80.143, 109.24, 141.26,
+                 186.5, 224.94, 265.9, 327.95, 367.53,
+                 1761.802, 1962.613, ),
+                {24: Isotope(23.9850419, 0.7899, 24),
+                 25: Isotope(24.98583702, 0.1, 25),
+                 26: Isotope(25.98259304, 0.1101, 26)}),
+            13: ((5.9858, 18.828, 28.447, 119.99, 153.71,
+                 190.47, 241.43, 284.59, 330.21, 398.57,
+                 442.07, 2085.983, 2304.08, ),
+                {27: Isotope(26.98153844, 1.0, 27)}),
+            14: ((8.1517, 16.345, 33.492, 45.141, 166.77,
+                 205.05, 246.52, 303.17, 351.1, 401.43,
+                 476.06, 523.5, 2437.676, 2673.108, ),
+                {28: Isotope(27.9769265327, 0.922297, 28),
+                 29: Isotope(28.97649472, 0.046832, 29),
+                 30: Isotope(29.97377022, 0.030871, 30)}),
+            15: ((10.4867, 19.725, 30.18, 51.37, 65.023,
+                 220.43, 263.22, 309.41, 371.73, 424.5,
+                 479.57, 560.41, 611.85, 2816.943, 3069.762, ),
+                {31: Isotope(30.97376151, 1.0, 31)}),
+            16: ((10.36, 23.33, 34.83, 47.3, 72.68,
+                 88.049, 280.93, 328.23, 379.1, 447.09,
+                 504.78, 564.65, 651.63, 707.14, 3223.836,
+                 3494.099, ),
+                {32: Isotope(31.97207069, 0.9493, 32),
+                 33: Isotope(32.9714585, 0.0076, 33),
+                 34: Isotope(33.96786683, 0.0429, 34),
+                 36: Isotope(35.96708088, 0.0002, 36)}),
+            17: ((12.9676, 23.81, 39.61, 53.46, 67.8,
+                 98.03, 114.193, 348.28, 400.05, 455.62,
+                 529.97, 591.97, 656.69, 749.75, 809.39,
+                 3658.425, 3946.193, ),
+                {35: Isotope(34.96885271, 0.7578, 35),
+                 37: Isotope(36.9659026, 0.2422, 37)}),
+            18: ((15.7596, 27.629, 40.74, 59.81, 75.02,
+                 91.007, 124.319, 143.456, 422.44, 478.68,
+                 538.95, 618.24, 686.09, 755.73, 854.75,
+                 918.0, 4120.778, 4426.114, ),
+                {36: Isotope(35.96754628, 0.003365, 36),
+                 38: Isotope(37.9627322, 0.000632, 38),
+                 40: Isotope(39.962383123, 0.996003, 40)}),
+            19: ((4.3407, 31.625, 45.72, 60.91, 82.66,
+                 100.0, 117.56, 154.86, 175.814, 503.44,
+                 564.13, 629.09, 714.02, 787.13, 861.77,
+                 968.0, 1034.0, 4610.955, 4933.931, ),
+                {39: Isotope(38.9637069, 0.932581, 39),
+                 40: Isotope(39.96399867, 0.000117, 40),
+                 41: Isotope(40.96182597, 0.067302, 41)}),
+            20: ((6.1132, 11.71, 50.908, 67.1, 84.41,
+                 108.78, 127.7, 147.24, 188.54, 211.27,
+                 591.25, 656.39, 726.03, 816.61, 895.12,
+                 974.0, 1087.0, 1157.0, 5129.045, 5469.738, ),
+                {40: Isotope(39.9625912, 0.96941, 40),
+                 42: Isotope(41.9586183, 0.00647, 42),
+                 43: Isotope(42.9587668, 0.00135, 43),
+                 44: Isotope(43.9554811, 0.02086, 44),
+                 46: Isotope(45.9536928, 4e-05, 46),
+                 48: Isotope(47.952534, 0.00187, 48)}),
+            21: ((6.5615, 12.8, 24.76, 73.47, 91.66,
+                 110.1, 138.0, 158.7, 180.02, 225.32,
+                 249.8, 685.89, 755.47, 829.79, 926.0, ),
+                {45: Isotope(44.9559102, 1.0, 45)}),
+            22: ((6.8281, 13.58, 27.491, 43.266, 99.22,
+                 119.36, 140.8, 168.5, 193.5, 215.91,
+                 265.23, 291.497, 787.33, 861.33, ),
+                {46: Isotope(45.9526295, 0.0825, 46),
+                 47: Isotope(46.9517638, 0.0744, 47),
+                 48: Isotope(47.9479471, 0.7372, 48),
+                 49: Isotope(48.9478708, 0.0541, 49),
+                 50: Isotope(49.9447921, 0.0518, 50)}),
+            23: ((6.7462, 14.65, 29.31, 46.707, 65.23,
+                 128.12, 150.17, 173.7, 205.8, 230.5,
+                 255.04, 308.25, 336.267, 895.58, 974.02, ),
+                {50: Isotope(49.9471628, 0.0025, 50),
+                 51: Isotope(50.9439637, 0.9975, 51)}),
+            24: ((6.7665, 16.5, 30.96, 49.1, 69.3,
+                 90.56, 161.1, 184.7, 209.3, 244.4,
+                 270.8, 298.0, 355.0, 384.3, 1010.64, ),
+                {50: Isotope(49.9460496, 0.04345, 50),
+                 52: Isotope(51.9405119, 0.83789, 52),
+                 53: Isotope(52.9406538, 0.09501, 53),
+                 54: Isotope(53.9388849, 0.02365, 54)}),
+            25: ((7.434, 15.64, 33.667, 51.2, 72.4,
+                 95.0, 119.27, 196.46, 221.8, 248.3,
+                 286.0, 314.4, 343.6, 404.0, 435.3,
+                 1136.2, ),
+                {55: Isotope(54.9380496, 1.0, 55)}),
+            26: ((7.9024, 16.18, 30.651, 54.8, 75.0,
+                 99.0, 125.0, 151.06, 235.04, 262.1,
+                 290.4, 330.8, 361.0, 392.2, 457.0,
+                 485.5, 1266.1, ),
+                {54: Isotope(53.9396148, 0.05845, 54),
+                 56: Isotope(55.9349421, 0.91754, 56),
+                 57: Isotope(56.9353987, 0.02119, 57),
+                 58: Isotope(57.9332805, 0.00282, 58)}),
+            27: ((7.881, 17.06, 33.5, 51.3, 79.5,
+                 102.0, 129.0, 157.0, 186.13, 276.0,
+                 305.0, 336.0, 376.0, 411.0, 444.0,
+                 512.0, 546.8, 1403.0, ),
+                {59: Isotope(58.9332002, 1.0, 59)}),
+            28: ((7.6398, 18.168, 35.17, 54.9, 75.5,
+                 108.0, 133.0, 162.0, 193.0, 224.5,
+                 321.2, 352.0, 384.0, 430.0, 464.0,
+                 499.0, 571.0, 607.2, 1547.0, ),
+                {58: Isotope(57.9353479, 0.680769, 58),
+                 60: Isotope(59.9307906, 0.262231, 60),
+                 61: Isotope(60.9310604, 0.011399, 61),
+                 62: Isotope(61.9283488, 0.036345, 62),
+                 64: Isotope(63.9279696, 0.009256, 64)}),
+            29: ((7.7264, 20.292, 26.83, 55.2, 79.9,
+                 103.0, 139.0, 166.0, 199.0, 232.0,
+                 266.0, 368.8, 401.0, 435.0, 484.0,
+                 520.0, 557.0, 633.0, 671.0, 1698.0, ),
+                {63: Isotope(62.9296011, 0.6917, 63),
+                 65: Isotope(64.9277937, 0.3083, 65)}),
+            30: ((9.3942, 17.964, 39.722, 59.4, 82.6,
+                 108.0, 134.0, 174.0, 203.0, 238.0,
+                 274.0, 310.8, 419.7, 454.0, 490.0,
+                 542.0, 579.0, 619.0, 698.8, 738.0,
+                 1856.0, ),
+                {64: Isotope(63.9291466, 0.4863, 64),
+                 66: Isotope(65.9260368, 0.279, 66),
+                 67: Isotope(66.9271309, 0.041, 67),
+                 68: Isotope(67.9248476, 0.1875, 68),
+                 70: Isotope(69.925325, 0.0062, 70)}),
+            31: ((5.9993, 20.51, 30.71, 64.0, ),
+                {69: Isotope(68.925581, 0.60108, 69),
+                 71: Isotope(70.924705, 0.39892, 71)}),
+            32: ((7.8994, 15.934, 34.22, 45.71, 93.5, ),
+                {70: Isotope(69.9242504, 0.2084, 70),
+                 72: Isotope(71.9220762, 0.2754, 72),
+                 73: Isotope(72.9234594, 0.0773, 73),
+                 74: Isotope(73.9211782, 0.3628, 74),
+                 76: Isotope(75.9214027, 0.0761, 76)}),
+            33: ((9.7886, 18.633, 28.351, 50.13, 62.63,
+                 127.6, ),
+                {75: Isotope(74.9215964, 1.0, 75)}),
+            34: ((9.7524, 21.9, 30.82, 42.944, 68.3,
+                 81.7, 155.4, ),
+                {74: Isotope(73.9224766, 0.0089, 74),
+                 76: Isotope(75.9192141, 0.0937, 76),
+                 77: Isotope(76.9199146, 0.0763, 77),
+                 78: Isotope(77.9173095, 0.2377, 78),
+                 80: Isotope(79.9165218, 0.4961, 80),
+                 82: Isotope(81.9167, 0.0873, 82)}),
+            35: ((11.8138, 21.8, 36.0, 47.3, 59.7,
+                 88.6, 103.0, 192.8, ),
+                {79: Isotope(78.9183376, 0.5069, 79),
+                 81: Isotope(80.916291, 0.4931, 81)}),
+            36: ((13.9996, 24.359, 36.95, 52.5, 64.7,
+                 78.5, 110.0, 126.0, 230.39, ),
+                {78: Isotope(77.920386, 0.0035, 78),
+                 80: Isotope(79.916378, 0.0228, 80),
+                 82: Isotope(81.9134846, 0.1158, 82),
+                 83: Isotope(82.914136, 0.1149, 83),
+                 84: Isotope(83.911507, 0.57, 84),
+                 86: Isotope(85.9106103, 0.173, 86)}),
+            37: ((4.1771, 27.28, 40.0, 52.6, 71.0,
+                 84.4, 99.2, 136.0, 150.0, 277.1, ),
+                {85: Isotope(84.9117893, 0.7217, 85),
+                 87: Isotope(86.9091835, 0.2783, 87)}),
+            38: ((5.6949, 11.03, 43.6, 57.0, 71.6,
+                 90.8, 106.0, 122.3, 162.0, 177.0,
+                 324.1, ),
+                {84: Isotope(83.913425, 0.0056, 84),
+                 86: Isotope(85.9092624, 0.0986, 86),
+                 87: Isotope(86.9088793, 0.07, 87),
+                 88: Isotope(87.9056143, 0.8258, 88)}),
+            39: ((6.2173, 12.24, 20.52, 61.8, 77.0,
+                 93.0, 116.0, 129.0, 146.52, 191.0,
+                 206.0, 374.0, ),
+                {89: Isotope(88.9058479, 1.0, 89)}),
+            40: ((6.6339, 13.13, 22.99, 34.34, 81.5, ),
+                {90: Isotope(89.9047037, 0.5145, 90),
+                 91: Isotope(90.905645, 0.1122, 91),
+                 92: Isotope(91.9050401, 0.1715, 92),
+                 94: Isotope(93.9063158, 0.1738, 94),
+                 96: Isotope(95.908276, 0.028, 96)}),
+            41: ((6.7589, 14.32, 25.04, 38.3, 50.55,
+                 102.6, 125.0, ),
+                {93: Isotope(92.9063775, 1.0, 93)}),
+            42: ((7.0924, 16.15, 27.16, 46.4, 61.2,
+                 68.0, 126.8, 153.0, ),
+                {92: Isotope(91.90681, 0.1484, 92),
+                 94: Isotope(93.9050876, 0.0925, 94),
+                 95: Isotope(94.9058415, 0.1592, 95),
+                 96: Isotope(95.9046789, 0.1668, 96),
+                 97: Isotope(96.906021, 0.0955, 97),
+                 98: Isotope(97.9054078, 0.2413, 98),
+                 100: Isotope(99.907477, 0.0963, 100)}),
+            43: ((7.28, 15.26, 29.54, ),
+                {98: Isotope(97.907216, 1.0, 98)}),
+            44: ((7.3605, 16.76, 28.47, ),
+                {96: Isotope(95.907598, 0.0554, 96),
+                 98: Isotope(97.905287, 0.0187, 98),
+                 99: Isotope(98.9059393, 0.1276, 99),
+                 100: Isotope(99.9042197, 0.126, 100),
+                 101: Isotope(100.9055822, 0.1706, 101),
+                 102: Isotope(101.9043495, 0.3155, 102),
+                 104: Isotope(103.90543, 0.1862, 104)}),
+            45: ((7.4589, 18.08, 31.06, ),
+                {103: Isotope(102.905504, 1.0, 103)}),
+            46: ((8.3369, 19.43, 32.93, ),
+                {102: Isotope(101.905608, 0.0102, 102),
+                 104: Isotope(103.904035, 0.1114, 104),
+                 105: Isotope(104.905084, 0.2233, 105),
+                 106: Isotope(105.903483, 0.2733, 106),
+                 108: Isotope(107.903894, 0.2646, 108),
+                 110: Isotope(109.905152, 0.1172, 110)}),
+            47: ((7.5762, 21.49, 34.83, ),
+                {107: Isotope(106.905093, 0.51839, 107),
+                 109: Isotope(108.904756, 0.48161, 109)}),
+            48: ((8.9938, 16.908, 37.48, ),
+                {106: Isotope(105.906458, 0.0125, 106),
+                 108: Isotope(107.904183, 0.0089, 108),
+                 110: Isotope(109.903006, 0.1249, 110),
+                 111: Isotope(110.904182, 0.128, 111),
+                 112: Isotope(111.9027572, 0.2413, 112),
+                 113: Isotope(112.9044009, 0.1222, 113),
+                 114: Isotope(113.9033581, 0.2873, 114),
+                 116: Isotope(115.904755, 0.0749, 116)}),
+            49: ((5.7864, 18.869, 28.03, 55.45, ),
+                {113: Isotope(112.904061, 0.0429, 113),
+                 115: Isotope(114.903878, 0.9571, 115)}),
+            50: ((7.3439, 14.632, 30.502, 40.734, 72.28, ),
+                {112: Isotope(111.904821, 0.0097, 112),
+                 114: Isotope(113.902782, 0.0066, 114),
+                 115: Isotope(114.903346, 0.0034, 115),
+                 116: Isotope(115.901744, 0.1454, 116),
+                 117: Isotope(116.902954, 0.0768, 117),
+                 118: Isotope(117.901606, 0.2422, 118),
+                 119: Isotope(118.903309, 0.0859, 119),
+                 120: Isotope(119.9021966, 0.3258, 120),
+                 122: Isotope(121.9034401, 0.0463, 122),
+                 124: Isotope(123.9052746, 0.0579, 124)}),
+            51: ((8.6084, 16.53, 25.3, 44.2, 56.0,
+                 108.0, ),
+                {121: Isotope(120.903818, 0.5721, 121),
+                 123: Isotope(122.9042157, 0.4279, 123)}),
+            52: ((9.0096, 18.6, 27.96, 37.41, 58.75,
+                 70.7, 137.0, ),
+                {120: Isotope(119.90402, 0.0009, 120),
+                 122: Isotope(121.9030471, 0.0255, 122),
+                 123: Isotope(122.904273, 0.0089, 123),
+                 124: Isotope(123.9028195, 0.0474, 124),
+                 125: Isotope(124.9044247, 0.0707, 125),
+                 126: Isotope(125.9033055, 0.1884, 126),
+                 128: Isotope(127.9044614, 0.3174, 128),
+                 130: Isotope(129.9062228, 0.3408, 130)}),
+            53: ((10.4513, 19.131, 33.0, ),
+                {127: Isotope(126.904468, 1.0, 127)}),
+            54: ((12.1298, 21.21, 32.1, ),
+                {124: Isotope(123.9058958, 0.0009, 124),
+                 126: Isotope(125.904269, 0.0009, 126),
+                 128: Isotope(127.9035304, 0.0192, 128),
+                 129: Isotope(128.9047795, 0.2644, 129),
+                 130: Isotope(129.9035079, 0.0408, 130),
+                 131: Isotope(130.9050819, 0.2118, 131),
+                 132: Isotope(131.9041545, 0.2689, 132),
+                 134: Isotope(133.9053945, 0.1044, 134),
+                 136: Isotope(135.90722, 0.0887, 136)}),
+            55: ((3.8939, 25.1, ),
+                {133: Isotope(132.905447, 1.0, 133)}),
+            56: ((5.2117, 100.004, ),
+                {130: Isotope(129.90631, 0.00106, 130),
+                 132: Isotope(131.905056, 0.00101, 132),
+                 134: Isotope(133.904503, 0.02417, 134),
+                 135: Isotope(134.905683, 0.06592, 135),
+                 136: Isotope(135.90457, 0.07854, 136),
+                 137: Isotope(136.905821, 0.11232, 137),
+                 138: Isotope(137.905241, 0.71698, 138)}),
+            57: ((5.5769, 11.06, 19.175, ),
+                {138: Isotope(137.907107, 0.0009, 138),
+                 139: Isotope(138.906348, 0.9991, 139)}),
+            58: ((5.5387, 10.85, 20.2, 36.72, ),
+                {136: Isotope(135.90714, 0.00185, 136),
+                 138: Isotope(137.905986, 0.00251, 138),
+                 140: Isotope(139.905434, 0.8845, 140),
+                 142: Isotope(141.90924, 0.11114, 142)}),
+            59: ((5.473, 10.55, 21.62, 38.95, 57.45, ),
+                {141: Isotope(140.907648, 1.0, 141)}),
+            60: ((5.525, 10.72, ),
+                {142: Isotope(141.907719, 0.272, 142),
+                 143: Isotope(142.90981, 0.122, 143),
+                 144: Isotope(143.910083, 0.238, 144),
+                 145: Isotope(144.912569, 0.083, 145),
+                 146: Isotope(145.913112, 0.172, 146),
+                 148: Isotope(147.916889, 0.057, 148),
+                 150: Isotope(149.920887, 0.056, 150)}),
+            61: ((5.582, 10.9, ),
+                {145: Isotope(144.912744, 1.0, 145)}),
+            62: ((5.6437, 11.07, ),
+                {144: Isotope(143.911995, 0.0307, 144),
+                 147: Isotope(146.914893, 0.1499, 147),
+                 148: Isotope(147.914818, 0.1124, 148),
+                 149: Isotope(148.91718, 0.1382, 149),
+                 150: Isotope(149.917271, 0.0738, 150),
+                 152: Isotope(151.919728, 0.2675, 152),
+                 154: Isotope(153.922205, 0.2275, 154)}),
+            63: ((5.6704, 11.25, ),
+                {151: Isotope(150.919846, 0.4781, 151),
+                 153: Isotope(152.921226, 0.5219, 153)}),
+            64: ((6.1498, 12.1, ),
+                {152: Isotope(151.919788, 0.002, 152),
+                 154: Isotope(153.920862, 0.0218, 154),
+                 155: Isotope(154.922619, 0.148, 155),
+                 156: Isotope(155.92212, 0.2047, 156),
+                 157: Isotope(156.923957, 0.1565, 157),
+                 158: Isotope(157.924101, 0.2484, 158),
+                 160: Isotope(159.927051, 0.2186, 160)}),
+            65: ((5.8638, 11.52, ),
+                {159: Isotope(158.925343, 1.0, 159)}),
+            66: ((5.9389, 11.67, ),
+                {156: Isotope(155.924278, 0.0006, 156),
+                 158: Isotope(157.924405, 0.001, 158),
+                 160: Isotope(159.925194, 0.0234, 160),
+                 161: Isotope(160.92693, 0.1891, 161),
+                 162: Isotope(161.926795, 0.2551, 162),
+                 163: Isotope(162.928728, 0.249, 163),
+                 164: Isotope(163.929171, 0.2818, 164)}),
+            67: ((6.0215, 11.8, ),
+                {165: Isotope(164.930319, 1.0, 165)}),
+            68: ((6.1077, 11.93, ),
+                {162: Isotope(161.928775, 0.0014, 162),
+                 164: Isotope(163.929197, 0.0161, 164),
+                 166: Isotope(165.93029, 0.3361, 166),
+                 167: Isotope(166.932045, 0.2293, 167),
+                 168: Isotope(167.932368, 0.2678, 168),
+                 170: Isotope(169.93546, 0.1493, 170)}),
+            69: ((6.1843, 12.05, 23.71, ),
+                {169: Isotope(168.934211, 1.0, 169)}),
+            70: ((6.2542, 12.17, 25.2, ),
+                {168: Isotope(167.933894, 0.0013, 168),
+                 170: Isotope(169.934759, 0.0304, 170),
+                 171: Isotope(170.936322, 0.1428, 171),
+                 172: Isotope(171.9363777, 0.2183, 172),
+                 173: Isotope(172.9382068, 0.1613, 173),
+                 174: Isotope(173.9388581, 0.3183, 174),
+                 176: Isotope(175.942568, 0.1276, 176)}),
+            71: ((5.4259, 13.9, ),
+                {175: Isotope(174.9407679, 0.9741, 175),
+                 176: Isotope(175.9426824, 0.0259, 176)}),
+            72: ((6.8251, 14.9, 23.3, 33.3, ),
+                {174: Isotope(173.94004, 0.0016, 174),
+                 176: Isotope(175.9414018, 0.0526, 176),
+                 177: Isotope(176.94322, 0.186, 177),
+                 178: Isotope(177.9436977, 0.2728, 178),
+                 179: Isotope(178.9458151, 0.1362, 179),
+                 180: Isotope(179.9465488, 0.3508, 180)}),
+            73: ((7.5496, ),
+                {180: Isotope(179.947466, 0.00012, 180),
+                 181: Isotope(180.947996, 0.99988, 181)}),
+            74: ((7.864, ),
+                {180: Isotope(179.946706, 0.0012, 180),
+                 182: Isotope(181.948206, 0.265, 182),
+                 183: Isotope(182.9502245, 0.1431, 183),
+                 184: Isotope(183.9509326, 0.3064, 184),
+                 186: Isotope(185.954362, 0.2843, 186)}),
+            75: ((7.8335, ),
+                {185: Isotope(184.9529557, 0.374, 185),
+                 187: Isotope(186.9557508, 0.626, 187)}),
+            76: ((8.4382, ),
+                {184: Isotope(183.952491, 0.0002, 184),
+                 186: Isotope(185.953838, 0.0159, 186),
+                 187: Isotope(186.9557479, 0.0196, 187),
+                 188: Isotope(187.955836, 0.1324, 188),
+                 189: Isotope(188.9581449, 0.1615, 189),
+                 190: Isotope(189.958445, 0.2626, 190),
+                 192: Isotope(191.961479, 0.4078, 192)}),
+            77: ((8.967, ),
+                {191: Isotope(190.960591, 0.373, 191),
+                 193: Isotope(192.962924, 0.627, 193)}),
+            78: ((8.9588, 18.563, ),
+                {190: Isotope(189.95993, 0.00014, 190),
+                 192: Isotope(191.961035, 0.00782, 192),
+                 194: Isotope(193.962664, 0.32967, 194),
+                 195: Isotope(194.964774, 0.33832, 195),
+                 196: Isotope(195.964935, 0.25242, 196),
+                 198: Isotope(197.967876, 0.07163, 198)}),
+            79: ((9.2255, 20.5, ),
+                {197: Isotope(196.966552, 1.0, 197)}),
+            80: ((10.4375, 18.756, 34.2, ),
+                {196: Isotope(195.965815, 0.0015, 196),
+                 198: Isotope(197.966752, 0.0997, 198),
+                 199: Isotope(198.968262, 0.1687, 199),
+                 200: Isotope(199.968309, 0.231, 200),
+                 201: Isotope(200.970285, 0.1318, 201),
+                 202: Isotope(201.970626, 0.2986, 202),
+                 204: Isotope(203.973476, 0.0687, 204)}),
+            81: ((6.1082, 20.428, 29.83, ),
+                {203: Isotope(202.972329, 0.29524, 203),
+                 205: Isotope(204.974412, 0.70476, 205)}),
+            82: ((7.4167, 15.032, 31.937, 42.32, 68.8, ),
+                {204: Isotope(203.973029, 0.014, 204),
+                 206: Isotope(205.974449, 0.241, 206),
+                 207: Isotope(206.975881, 0.221, 207),
+                 208: Isotope(207.976636, 0.524, 208)}),
+            83: ((7.2855, 16.69, 25.56, 45.3, 56.0,
+                 88.3, ),
+                {209: Isotope(208.980383, 1.0, 209)}),
+            84: ((8.414, ),
+                {209: Isotope(208.982416, 1.0, 209)}),
+            85: ((),
+                {210: Isotope(209.987131, 1.0, 210)}),
+            86: ((10.7485, ),
+                {222: Isotope(222.0175705, 1.0, 222)}),
+            87: ((4.0727, ),
+                {223: Isotope(223.0197307, 1.0, 223)}),
+            88: ((5.2784, 10.147, ),
+                {226: Isotope(226.0254026, 1.0, 226)}),
+            89: ((5.17, 12.1, ),
+                {227: Isotope(227.027747, 1.0, 227)}),
+            90: ((6.3067, 11.5, 20.0, 28.8, ),
+                {232: Isotope(232.0380504, 1.0, 232)}),
+            91: ((5.89, ),
+                {231: Isotope(231.0358789, 1.0, 231)}),
+            92: ((6.1941, ),
+                {234: Isotope(234.0409456, 5.5e-05, 234),
+                 235: Isotope(235.0439231, 0.0072, 235),
+                 238: Isotope(238.0507826, 0.992745, 238)}),
+            93: ((6.2657, ),
+                {237: Isotope(237.0481673, 1.0, 237)}),
+            94: ((6.026, ),
+                {244: Isotope(244.064198, 1.0, 244)}),
+            95: ((5.9738, ),
+                {243: Isotope(243.0613727, 1.0, 243)}),
+            96: ((5.9914, ),
+                {247: Isotope(247.070347, 1.0, 247)}),
+            97: ((6.1979, ),
+                {247: Isotope(247.070299, 1.0, 247)}),
+            98: ((6.2817, ),
+                {251: Isotope(251.07958, 1.0, 251)}),
+            99: ((6.42, ),
+                {252: Isotope(252.08297, 1.0, 252)}),
+            100: ((6.5, ),
+                {257: Isotope(257.095099, 1.0, 257)}),
+            101: ((6.58, ),
+                {258: Isotope(258.098425, 1.0, 258)}),
+            102: ((6.65, ),
+                {259: Isotope(259.10102, 1.0, 259)}),
+            103: ((4.9, ),
+                {262: Isotope(262.10969, 1.0, 262)}),
+            104: ((6.0, ),
+                {261: Isotope(261.10875, 1.0, 261)}),
+            105: ((),
+                {262: Isotope(262.11415, 1.0, 262)}),
+            106: ((),
+                {266: Isotope(266.12193, 1.0, 266)}),
+            107: ((),
+                {264: Isotope(264.12473, 1.0, 264)}),
+            108: ((),
+                {269: Isotope(269.13411, 1.0, 269)}),
+            109: ((),
+                {268: Isotope(268.13882, 1.0, 268)}),
+        }
+    return _IONENERGY_ISOTOPES[number]
+
+
+_IONENERGY_ISOTOPES = None
+
+ELEMENTS = ElementsDict.from_rows(_CORE_FIELDS, _CORE)
 
 
 PERIODS = {1: 'K', 2: 'L', 3: 'M', 4: 'N', 5: 'O', 6: 'P', 7: 'Q'}
@@ -0,0 +1,185 @@
+"""
+Element constants as arrays indexed by atomic number.
+
+The x-ray code needs only the symbol, atomic mass and default density of
+each element.  These are kept here as NumPy arrays indexed by Z (entry 0 is
+a placeholder), so converting between symbols and atomic numbers or looking
+up masses for many elements is one array operation instead of one
+elements.ELEMENTS lookup per element.
+
+    elementtable.atomic_numbers(["H", "O", "Pb"])    array([ 1,  8, 82])
+    elementtable.MASS[[1, 8]]                        array([ 1.00794, 15.9994 ])
+    elementtable.SYMBOL[[1, 8]]                      array(['H', 'O'], dtype='<U2')
+"""
+
+import numpy as np
+
+from . import elements
+
+# Read from the rows elements.ELEMENTS is built from, so no Element objects are made
+_COLUMNS = dict(zip(elements._CORE_FIELDS, zip(*elements._CORE)))
+
+# Upper limit for _test_import_time of importing elements and elementtable [s]
+IMPORT_TIME_TARGET_S = 0.01
+
+# Highest atomic number in elements.ELEMENTS
+MAX_Z = len(elements._CORE)
+
+# Indexed by atomic number.  Entry 0 is "" or nan.
+SYMBOL = np.array(("",) + _COLUMNS["symbol"])
+NAME = np.array(("",) + _COLUMNS["name"])
+# Relative atomic mass
+MASS = np.array((np.nan,) + _COLUMNS["mass"])
+# Default density of the pure element [g/cc]
+DENSITY = np.array((np.nan,) + _COLUMNS["density"])
+
+for _array in (SYMBOL, NAME, MASS, DENSITY):
+    _array.flags.writeable = False
+
+# Symbol, name or atomic number to atomic number, as accepted by elements.ELEMENTS
+Z_BY_KEY = {}
+for _z in range(1, MAX_Z + 1):
+    Z_BY_KEY[_z] = _z
+    Z_BY_KEY[str(SYMBOL[_z])] = _z
+    Z_BY_KEY[str(NAME[_z])] = _z
+
+# Atomic number by the two character codes of a symbol, 128 * first + second.
+# Codes of unused pairs are 0.
+_Z_BY_CODE = np.zeros(128 * 128, dtype=int)
+
+
+def _symbol_codes(symbols):
+    """
+    Return 128 * ord(first) + ord(second) of each 1- or 2-character string in
+    an array.  Strings with non-ASCII characters get code 0.
+    """
+    chars = symbols.astype("U2").view(np.uint32).reshape(symbols.shape + (2,))
+    codes = chars[..., 0] * 128 + chars[..., 1]
+    codes[(chars >= 128).any(axis=-1)] = 0
+    return codes
+
+
+_Z_BY_CODE[_symbol_codes(SYMBOL[1:])] = np.arange(1, MAX_Z + 1)
+
+
+def atomic_number(element):
+    """
+    Return the atomic number of one element given as symbol, name or atomic number.
+    """
+    try:
+        return Z_BY_KEY[element]
+    except KeyError:
+        raise KeyError(f"Unknown element '{element}'")
+    except TypeError:
+        raise KeyError(f"Unknown element {element!r}")
+
+
+def _check_range(z):
+    """
+    Raise KeyError for atomic numbers outside 1..MAX_Z.  Return z.
+    """
+    if z.size and (z.min() < 1 or z.max() > MAX_Z):
+        bad = z[(z < 1) | (z > MAX_Z)]
+        raise KeyError(f"Unknown element '{bad.flat[0]}'")
+    return z
+
+
+def atomic_numbers(symbols):
+    """
+    Convert atomic symbols or atomic numbers to an integer array of atomic numbers.
+
+    symbols: array-like of any shape, e.g. ["He", "Li", "U"], [2, "Li", 92]
+             or an image of symbols.  Element names are accepted too.
+
+    Integer arrays are returned as they are, after checking they are valid
+    atomic numbers.  Unknown elements raise KeyError.  Arrays of symbols are
+    converted by a table indexed by the character codes of each symbol.
+    """
+    z = np.asarray(symbols)
+    if z.dtype.kind in "iu":
+        return _check_range(z)
+    if z.ndim == 0:
+        return np.asarray(atomic_number(z.item()))
+    if z.dtype.kind == "U" and z.dtype.itemsize <= 8:
+        result = _Z_BY_CODE[_symbol_codes(z)]
+        missing = result == 0
+        if missing.any():
+            # Atomic numbers mixed with symbols, e.g. [2, "Li"]
+            result[missing] = [int(s) if s.isdigit() else atomic_number(s) for s in z[missing].tolist()]
+            _check_range(result)
+        return result
+    # Element names, e.g. "Hydrogen"
+    return _check_range(np.array([int(s) if isinstance(s, str) and s.isdigit() else atomic_number(s)
+                                  for s in z.ravel().tolist()], dtype=int).reshape(z.shape))
+
+
+def symbols(z):
+    """
+    Return chemical symbols of atomic numbers, as an array of the same shape.
+    """
+    return SYMBOL[np.asarray(z)]
+
+
+def _test_atomic_numbers():
+    assert atomic_numbers(["H", "O", "Pb"]).tolist() == [1, 8, 82]
+    assert atomic_numbers([2, "Li", 92]).tolist() == [2, 3, 92]
+    assert atomic_numbers(np.array([["U", "Hydrogen"]])).tolist() == [[92, 1]]
+    assert atomic_number("Fe") == 26
+    assert symbols([1, 8]).tolist() == ["H", "O"]
+    z = np.arange(1, MAX_Z + 1)
+    assert np.array_equal(atomic_numbers(symbols(z)), z)
+    for bad in [["H", "Xx"], [0], [-1], [MAX_Z + 1], ["H", "200"]]:
+        try:
+            atomic_numbers(bad)
+        except KeyError:
+            continue
+        raise AssertionError(f"atomic_numbers({bad}) should raise KeyError")
+
+
+def _python(code):
+    """
+    Run code in a fresh interpreter with this package importable and return its stderr and stdout.
+    """
+    import os
+    import sys
+    import subprocess
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return result.stderr, result.stdout
+
+
+def _import_times(module="xraymaterials"):
+    """
+    Import module in a fresh interpreter and return {module name: cumulative import time [s]}.
+    """
+    import re
+    (stderr, _) = _python(f"import {module}")
+    times = {}
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s*(\d+) \|\s*(\d+) \|\s*(\S+)", line)
+        if match:
+            times[match.group(3)] = int(match.group(2)) * 1e-6
+    return times
+
+
+def _test_import_time(repeat=5):
+    """
+    Check the best of repeat import times of elementtable, including
+    elements, against IMPORT_TIME_TARGET_S, and that importing xraymaterials
+    builds no Element objects.
+
+    Returns: {module name: best cumulative import time [s]}
+    """
+    names = ["xraymaterials.elements", "xraymaterials.elementtable", "xraymaterials"]
+    best = {name: np.inf for name in names}
+    for _ in range(repeat):
+        times = _import_times()
+        for name in names:
+            best[name] = min(best[name], times[name])
+    seconds = best["xraymaterials.elementtable"]
+    assert seconds < IMPORT_TIME_TARGET_S, f"Importing elementtable took {seconds*1e3:.1f} ms"
+    (_, built) = _python("import xraymaterials; print(len(xraymaterials.elements.ELEMENTS._list)"
+                         " - xraymaterials.elements.ELEMENTS._list.count(None))")
+    assert int(built) == 0, f"Importing xraymaterials built {int(built)} Element objects"
+    return best
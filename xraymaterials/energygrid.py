@@ -0,0 +1,166 @@
+"""
+Energy grids that are reused for many evaluations.
+
+np.interp searches the element table for every query energy on every call.
+An EnergyGrid does that search once per element table and keeps the
+bracketing indices and linear weights, so later interpolations onto the same
+energies are a gather and a multiply-add.
+
+Pass an EnergyGrid anywhere an energy_keV array is accepted:
+
+    grid = EnergyGrid(np.linspace(20, 150, 1000))
+    water.mu(grid)
+    refractiveindex.calculate_n(z, g_cc, energy_keV=grid)
+
+EnergyGrid(energy_keV, method="loglog") interpolates in log-log space
+instead, using the per-segment power laws of xraymaterials.powerlaw.
+"""
+
+import hashlib
+import threading
+import numpy as np
+
+from . import elementtable
+from . import loaddata
+from . import powerlaw
+
+METHODS = ("linear", "loglog")
+
+
+class EnergyGrid:
+    """
+    Fixed photon energies with cached interpolation weights per element table.
+
+    Caches take 16 to 24 bytes per energy per element used.
+    """
+
+    def __init__(self, energy_keV, method="linear"):
+        """
+        Args:
+            energy_keV (array-like): photon energies in keV, any shape
+            method (str): "linear" to match np.interp, or "loglog" for power-law
+                interpolation between table energies
+        """
+        if method not in METHODS:
+            raise Exception(f"Invalid interpolation method '{method}', should be one of {METHODS}")
+        self.method = method
+        self.energy_keV = np.array(energy_keV, dtype=float)
+        self.energy_keV.flags.writeable = False
+        self._weights = {}
+        self._coefficients = None
+        self._key = None
+        self._lock = threading.Lock()
+
+    @property
+    def shape(self):
+        return self.energy_keV.shape
+
+    @property
+    def size(self):
+        return self.energy_keV.size
+
+    def __len__(self):
+        return len(self.energy_keV)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.energy_keV
+        return self.energy_keV.astype(dtype)
+
+    @property
+    def key(self):
+        """
+        Hashable key for the grid's energies and method, computed once.  Equal grids have equal keys.
+        """
+        if self._key is None:
+            digest = hashlib.blake2b(np.ascontiguousarray(self.energy_keV).data, digest_size=16).digest()
+            self._key = ("grid", self.method, self.shape, digest)
+        return self._key
+
+    def __repr__(self):
+        return f"EnergyGrid({self.energy_keV!r}, method={self.method!r})"
+
+    def weights(self, element):
+        """
+        Return bracketing indices and weights for interpolating an element table.
+
+        element: atomic number or symbol
+
+        Returns:
+            index:  table row at or below each energy
+            weight: weight of row index+1.  Row index has weight 1-weight.
+                    Energies outside the table are clamped to its ends, as in np.interp.
+                    For method "loglog", the weight is in log energy.
+        """
+        z = elementtable.atomic_number(element)
+        if self.method == "loglog":
+            index, log_energy = self._cached_weights(z)
+            log_table_energy = powerlaw.element_table(z).log_energy
+            x0 = log_table_energy[index]
+            weight = (log_energy - x0) / (log_table_energy[index + 1] - x0)
+            return index.reshape(self.shape), weight.reshape(self.shape)
+        return self._cached_weights(z)[:2]
+
+    def _cached_weights(self, z):
+        try:
+            return self._weights[z]
+        except KeyError:
+            pass
+
+        if self.method == "loglog":
+            # Power laws need only the segment and the log energy
+            table = powerlaw.element_table(z)
+            log_energy = table.clip_log_energy(self.energy_keV)
+            entry = (table.segment(log_energy), log_energy)
+        else:
+            xp = loaddata.load_element_array(z)[loaddata.ELEMENT_COLUMN_INDEX["energy_keV"]]
+            index = np.searchsorted(xp, self.energy_keV, side="right") - 1
+            np.clip(index, 0, len(xp) - 2, out=index)
+            x0 = xp[index]
+            weight = (self.energy_keV - x0) / (xp[index + 1] - x0)
+            np.clip(weight, 0.0, 1.0, out=weight)
+            entry = (index, weight, 1.0 - weight)
+
+        with self._lock:
+            self._weights[z] = entry
+        return entry
+
+    def interp(self, element, column):
+        """
+        Interpolate one column of an element table onto the grid.
+
+        element: atomic number or symbol
+        column:  column name (see loaddata.ELEMENT_COLUMNS) or index
+
+        Returns: interpolated values, with the shape of the grid
+        """
+        if isinstance(column, str):
+            column = loaddata.ELEMENT_COLUMN_INDEX[column]
+        z = elementtable.atomic_number(element)
+        if self.method == "loglog":
+            index, log_energy = self._cached_weights(z)
+            values = powerlaw.element_table(z).interp_segments(column, log_energy, index)
+            return values.reshape(self.shape)
+        index, weight, weight_lo = self._cached_weights(z)
+        fp = loaddata.load_element_array(z)[column]
+        values = fp[index]
+        values *= weight_lo
+        values += fp[index + 1] * weight
+        return values
+
+    def coefficients(self):
+        """
+        Return a CoefficientMatrix for this grid, covering every element.  Built once.
+        """
+        if self._coefficients is None:
+            from .coefficients import CoefficientMatrix
+            self._coefficients = CoefficientMatrix(self)
+        return self._coefficients
+
+    def clear(self):
+        """
+        Drop cached weights and coefficients.
+        """
+        with self._lock:
+            self._weights.clear()
+            self._coefficients = None
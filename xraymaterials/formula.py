@@ -0,0 +1,188 @@
+"""
+Chemical formula parser.
+
+Understands element symbols with integer or fractional counts, groups in
+parentheses or brackets, and hydrates or other adducts joined by a dot:
+
+    parse("H2O")                    {'H': 2, 'O': 1}
+    parse("Ca(OH)2")                {'Ca': 1, 'O': 2, 'H': 2}
+    parse("CuSO4·5H2O")             {'Cu': 1, 'S': 1, 'O': 9, 'H': 10}
+    parse("Fe0.95O")                {'Fe': 0.95, 'O': 1}
+
+"·", "•" and "*" all join adducts.  Each may start with a multiplier.
+
+A dot between digits is a decimal point, so "CuSO4.5H2O" could be either a
+hydrate or CuSO4.5 H2O.  Fractional counts of 1 or more written directly
+before an element or group are rejected as ambiguous; write hydrates with
+"·" or "*", and separate such counts with a space, e.g. "Fe1.5 O".
+
+Parsed formulas are kept in an LRU cache (see cache_info()), so parsing the
+same strings over and over is a dict lookup.  stoichiometry_matrix() parses
+many formulas into a (formulas x 99) matrix of atom counts, the input of
+MaterialBatch.from_compounds.
+"""
+
+import re
+import functools
+import numpy as np
+
+from . import elementtable
+
+NUM_ELEMENTS = 99
+
+# Parsed formulas kept by the cache
+CACHE_SIZE = 4096
+
+_TOKEN = re.compile(r"""
+    (?P<element>[A-Z][a-z]?)
+  | (?P<count>\d+\.\d+|\d+)
+  | (?P<open>[(\[])
+  | (?P<close>[)\]])
+  | (?P<adduct>[·•*])
+  | (?P<space>\s+)
+  | (?P<error>.)
+""", re.VERBOSE)
+
+_CLOSING = {"(": ")", "[": "]"}
+
+# Start of an element or group, which may not directly follow a fractional count of 1 or more
+_GROUP_START = re.compile(r"[A-Z(\[]")
+
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _parse(formula):
+    """
+    Return tuple of (symbol, count) in order of first appearance.
+    """
+    # Open groups as [opening bracket, dict of symbol and count]; stack[0] is the current adduct
+    stack = [[None, {}]]
+    total = {}
+    multiplier = 1
+    # Element symbol or closed group waiting for its count
+    pending = None
+
+    def add(counts, symbol, count):
+        counts[symbol] = counts.get(symbol, 0) + count
+
+    def flush(count=1):
+        nonlocal pending
+        if isinstance(pending, str):
+            add(stack[-1][1], pending, count)
+        elif pending is not None:
+            for (symbol, group_count) in pending.items():
+                add(stack[-1][1], symbol, group_count * count)
+        pending = None
+
+    def end_adduct():
+        flush()
+        if len(stack) > 1:
+            raise Exception(f"Unclosed '{stack[-1][0]}' in formula '{formula}'")
+        for (symbol, count) in stack[0][1].items():
+            add(total, symbol, count * multiplier)
+        stack[0][1] = {}
+
+    for match in _TOKEN.finditer(formula):
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "element":
+            if text not in elementtable.Z_BY_KEY:
+                raise Exception(f"Cannot find element '{text}'.  Check capitalization?")
+            flush()
+            pending = text
+        elif kind == "count":
+            if "." in text and _number(text) >= 1 and _GROUP_START.match(formula, match.end()):
+                raise Exception(f"Ambiguous count '{text}' in formula '{formula}'.  Join adducts "
+                                f"with '·' or '*' (e.g. CuSO4·5H2O), or follow a fractional count with a space")
+            if pending is not None:
+                flush(_number(text))
+            elif multiplier == 1 and len(stack) == 1 and not stack[0][1]:
+                # Leading multiplier of an adduct, e.g. the 5 in 5H2O
+                multiplier = _number(text)
+            else:
+                raise Exception(f"Misplaced number '{text}' in formula '{formula}'")
+        elif kind == "open":
+            flush()
+            stack.append([text, {}])
+        elif kind == "close":
+            flush()
+            if len(stack) == 1 or _CLOSING[stack[-1][0]] != text:
+                raise Exception(f"Unmatched '{text}' in formula '{formula}'")
+            pending = stack.pop()[1]
+        elif kind == "adduct":
+            end_adduct()
+            multiplier = 1
+        elif kind == "error":
+            raise Exception(f"Unexpected character '{text}' in formula '{formula}'")
+    end_adduct()
+
+    if not total:
+        raise Exception(f"No elements in formula '{formula}'")
+    return tuple(total.items())
+
+
+def parse(formula):
+    """
+    Parse a chemical formula.
+
+    formula: chemical formula, capitalization-sensitive, e.g. "H2O" or "CuSO4·5H2O"
+
+    Returns: dict of element symbol and number of atoms per formula unit, in
+             order of first appearance.  Counts are ints unless fractional.
+    """
+    return dict(_parse(formula))
+
+
+def cache_info():
+    """
+    Return functools cache statistics (hits, misses, maxsize, currsize) of parsed formulas.
+    """
+    return _parse.cache_info()
+
+
+def clear_cache():
+    _parse.cache_clear()
+
+
+def stoichiometry_matrix(formulas):
+    """
+    Parse many formulas into a matrix of atom counts.
+
+    formulas: list of chemical formulas
+
+    Returns: (formulas x 99) array.  Column N holds the number of atoms of
+             atomic number N+1 per formula unit.
+    """
+    matrix = np.zeros((len(formulas), NUM_ELEMENTS))
+    for (row, formula) in zip(matrix, formulas):
+        for (symbol, count) in _parse(formula):
+            z = elementtable.Z_BY_KEY[symbol]
+            if z > NUM_ELEMENTS:
+                raise Exception(f"Element '{symbol}' in formula '{formula}' has no xray data")
+            row[z - 1] += count
+    return matrix
+
+
+def _test_parse():
+    assert parse("H2O") == {"H": 2, "O": 1}
+    assert parse("CH3COOH") == {"C": 2, "H": 4, "O": 2}
+    assert parse("Ca(OH)2") == {"Ca": 1, "O": 2, "H": 2}
+    assert parse("K4[Fe(CN)6]") == {"K": 4, "Fe": 1, "C": 6, "N": 6}
+    assert parse("CuSO4·5H2O") == {"Cu": 1, "S": 1, "O": 9, "H": 10}
+    assert parse("Na2CO3*10H2O") == {"Na": 2, "C": 1, "O": 13, "H": 20}
+    assert parse("Fe0.95O") == {"Fe": 0.95, "O": 1}
+    assert parse("(C2H4)2.5") == {"C": 5, "H": 10}
+    assert parse("Fe1.5 O") == {"Fe": 1.5, "O": 1}
+    for bad in ["H2O)", "(H2O", "Xx", "H2O-", "", "5", "CuSO4.5H2O", "Fe1.5O", "H2.O"]:
+        try:
+            parse(bad)
+        except Exception:
+            continue
+        raise AssertionError(f"parse('{bad}') should fail")
+    matrix = stoichiometry_matrix(["H2O", "CuSO4·5H2O"])
+    assert matrix.shape == (2, NUM_ELEMENTS)
+    assert matrix[1, 0] == 10 and matrix[1, 7] == 9 and matrix[1, 28] == 1
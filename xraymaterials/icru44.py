@@ -1,33 +1,184 @@
-import os
-import json
+"""
+ICRU-44 material compositions.
+
+The composition file is parsed once, on first use, into a Registry: a
+(materials x 99) mass-fraction matrix, a density vector and an index of
+names.  Names are looked up exactly, then ignoring case and repeated spaces;
+find() suggests close matches.
+
+    icru44.load("Bone, Cortical (ICRU-44)")     # Material
+    icru44.load("bone, cortical (icru-44)")     # same Material
+    icru44.find("teflon")                       # ['Polytetrafluoroethylene, (Teflon)']
+    icru44.load_all()                           # MaterialBatch of every material
+"""
+
+import re
+import difflib
+import threading
 import numpy as np
 from . import loaddata
+from .coefficients import NUM_ELEMENTS
 from .material import Material
 
+
+def _normalize(name):
+    return " ".join(name.casefold().split())
+
+
+class Registry:
+    """
+    Compositions of ICRU-44 materials as arrays.
+
+    Attributes:
+        names:         material names, in file order
+        mass_fraction: (materials x 99) read-only array.  Column N is the mass
+                       fraction of atomic number N+1.
+        density_g_cc:  (materials,) read-only array of densities
+    """
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries (list): dicts with fields material, density_g_cc, z and fraction,
+                            as in mixtures/material_composition.txt
+        """
+        self.names = [entry["material"] for entry in entries]
+        self.mass_fraction = np.zeros((len(entries), NUM_ELEMENTS))
+        self.density_g_cc = np.array([entry["density_g_cc"] for entry in entries], dtype=float)
+        for (row, entry) in zip(self.mass_fraction, entries):
+            row[np.asarray(entry["z"]) - 1] = entry["fraction"]
+        self.mass_fraction.flags.writeable = False
+        self.density_g_cc.flags.writeable = False
+        self._index = {name: ii for (ii, name) in enumerate(self.names)}
+        self._normalized = {}
+        for (ii, name) in enumerate(self.names):
+            self._normalized.setdefault(_normalize(name), ii)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index or _normalize(name) in self._normalized
+
+    def index(self, name, fuzzy=False):
+        """
+        Return the row of a material.
+
+        name:  material name.  Case and repeated spaces are ignored if there is no exact match.
+        fuzzy: if True, fall back to the closest name, see find()
+        """
+        try:
+            return self._index[name]
+        except KeyError:
+            pass
+        try:
+            return self._normalized[_normalize(name)]
+        except KeyError:
+            pass
+        matches = self.find(name)
+        if fuzzy and matches:
+            return self._index[matches[0]]
+        message = f"Material name '{name}' is not in ICRU-44 database"
+        if matches:
+            message += f".  Did you mean {', '.join(repr(m) for m in matches)}?"
+        raise Exception(message)
+
+    def find(self, name, n=3, cutoff=0.6):
+        """
+        Return up to n material names closest to name, best first.
+
+        Names containing every word of name come first, shortest first, then
+        names similar to it by difflib with ratio of at least cutoff.
+        """
+        normalized = _normalize(name)
+        words = re.findall(r"\w+", normalized)
+        keys = [key for key in self._normalized if words and all(word in key for word in words)]
+        keys.sort(key=len)
+        for key in difflib.get_close_matches(normalized, self._normalized.keys(), n=n, cutoff=cutoff):
+            if key not in keys:
+                keys.append(key)
+        return [self.names[self._normalized[key]] for key in keys[:n]]
+
+    def density_array(self, index=None):
+        """
+        Return element densities [g/cc] of materials, one row of 99 per material.
+
+        index: (optional) row or rows to return.  Default is all materials.
+        """
+        if index is None:
+            return self.mass_fraction * self.density_g_cc[:, None]
+        return self.mass_fraction[index] * np.asarray(self.density_g_cc[index])[..., None]
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def registry():
+    """
+    Return the Registry of ICRU-44 materials.  The composition file is parsed on first call.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = Registry(loaddata.load_compositions())
+    return _registry
+
+
 def list():
     """
     Return a list of known ICRU-44 material names.
 
     Valid ICRU-44 names can be input to load().
     """
+    return [name for name in registry().names]
 
-    with open(os.path.join(loaddata.pwd, "mixtures", "material_composition.txt")) as fh:
-        s = json.load(fh)
-        names = [entry["material"] for entry in s]
-
-    return names
 
+def find(material_name, n=3):
+    """
+    Return up to n known ICRU-44 names closest to material_name, best first.
+    """
+    return registry().find(material_name, n=n)
 
-    # return loaddata.list_files(loaddata.icru44_dir)
 
-def load(material_name):
+def load(material_name, fuzzy=False):
     """
     Load ICRU-44 material as a Material object.
+
+    material_name: name as in list().  Case and repeated spaces are ignored.
+    fuzzy:         if True, load the closest name when there is no match
     """
+    reg = registry()
+    return Material.from_array(reg.density_array(reg.index(material_name, fuzzy=fuzzy)))
+
+
+def load_all():
+    """
+    Load every ICRU-44 material as a MaterialBatch, indexed by name.
+    """
+    from .batch import MaterialBatch
+    reg = registry()
+    return MaterialBatch(reg.density_array(), names=reg.names)
+
+
+def _test_registry():
+    reg = registry()
+    assert len(reg) == len(list()) and reg.mass_fraction.shape == (len(reg), NUM_ELEMENTS)
+    np.testing.assert_allclose(reg.mass_fraction.sum(axis=1), 1.0, atol=2e-3)
+    bone = load("Bone, Cortical (ICRU-44)")
+    assert load("bone,  cortical (icru-44)") == bone
+    assert load("Bone Cortical ICRU44", fuzzy=True) == bone
+    assert find("Cortical Bone (ICRU-44)")[0] == "Bone, Cortical (ICRU-44)"
+    assert find("water") == ["Water, Liquid"]
+    composition = loaddata.load_composition("Bone, Cortical (ICRU-44)")
+    assert loaddata.load_compositions()[reg.index("Bone, Cortical (ICRU-44)")] == composition
+    expected = Material(composition["z"], composition["density_g_cc"] * np.array(composition["fraction"]))
+    assert bone == expected
+    batch = load_all()
+    np.testing.assert_array_equal(batch["Bone, Cortical (ICRU-44)"].to_array(), bone.to_array())
     try:
-        mat_df = loaddata.load_composition(material_name)
-    except KeyError as exc:
-        raise Exception(f"Material name '{material_name}' is not in ICRU-44 database")
-    elem_g_cc = mat_df["density_g_cc"] * np.array(mat_df["fraction"])
-    mat = Material(mat_df["z"], elem_g_cc)
-    return mat
\ No newline at end of file
+        load("Unobtainium")
+    except Exception:
+        return
+    raise AssertionError("Unknown name should raise")
@@ -1,11 +1,27 @@
+"""Library of ready-made materials, e.g. xraymaterials.library.water.
+
+Materials are built on first attribute access.  list() names every material
+without building any.
+"""
+
 from . import compounds
 from . import elements
 from . import mixtures
 
-from .compounds import *
-from .elements import *
-from .mixtures import *
+# Later modules take precedence, as with the star imports this package used to do.
+_modules = (mixtures, elements, compounds)
 
 
 def list():
-    return mixtures.list() + compounds.list() + elements.list()
\ No newline at end of file
+    return mixtures.list() + compounds.list() + elements.list()
+
+def __getattr__(name):
+    for module in _modules:
+        if name in module._recipes:
+            return getattr(module, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+def __dir__():
+    return sorted(set(globals()) | set(list()))
+
+__all__ = list()
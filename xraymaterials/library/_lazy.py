@@ -0,0 +1,58 @@
+"""Registry of library materials that are built on first access.
+
+Each library module registers a recipe (a function returning a Material) per
+name, and forwards its module-level __getattr__ to Recipes.get.  Built
+materials are stored in the module namespace, so later lookups are ordinary
+attribute access.
+"""
+
+import sys
+import threading
+
+
+class Recipes:
+    def __init__(self, module_name):
+        self._module_name = module_name
+        self._recipes = dict()
+        self._built = dict()
+        self._lock = threading.RLock()
+
+    def add(self, name, recipe):
+        """
+        Register recipe, a function with no arguments returning a Material, under name.
+        """
+        self._recipes[name] = recipe
+
+    def alias(self, name, target):
+        """
+        Register name as another name for the material target.  Both names give the same object.
+        """
+        self._recipes[name] = lambda: self.get(target)
+
+    def names(self):
+        """
+        Return list of registered names, in order of registration.  Builds nothing.
+        """
+        return [k for k in self._recipes.keys()]
+
+    def built(self):
+        """
+        Return dict of the materials built so far.
+        """
+        return dict(self._built)
+
+    def get(self, name):
+        """
+        Return the material registered under name, building it if necessary.
+        """
+        if name not in self._recipes:
+            raise AttributeError(f"module '{self._module_name}' has no attribute '{name}'")
+        with self._lock:
+            if name not in self._built:
+                material = self._recipes[name]()
+                self._built[name] = material
+                setattr(sys.modules[self._module_name], name, material)
+            return self._built[name]
+
+    def __contains__(self, name):
+        return name in self._recipes
@@ -1,61 +1,72 @@
 """Some materials specified by their chemical formulas.
+
+Materials are built on first access.
 """
 
-_g = dict()
+from ._lazy import Recipes
 
-def _init():
-    from ..material import Material as Material
+_recipes = Recipes(__name__)
 
-    global _g
-    g = _g
+def _compound(name, formula, density_g_cc=None):
+    def recipe():
+        from ..material import Material as Material
+        return Material.from_compound(formula, density_g_cc)
+    _recipes.add(name, recipe)
 
+def _init():
+    c = _compound
 
-    g["water"] = Material.from_compound("H2O", 1.0)
-    g["acetic_acid"] = Material.from_compound("C2H4O2", 1.049) # density: wikipedia
+    c("water", "H2O", 1.0)
+    c("acetic_acid", "C2H4O2", 1.049) # density: wikipedia
 
     # Lipids
-    g["triolein"] = Material.from_compound("C57H104O6")
+    c("triolein", "C57H104O6")
 
     # Sugars
-    g["sucrose"] = Material.from_compound("C12H22O11")
-    g["fructose"] = Material.from_compound("C6H12O6")
-    g["glucose"] = Material.from_compound("C6H12O6")
-    g["maltose"] = Material.from_compound("C12H22O11")
+    c("sucrose", "C12H22O11")
+    c("fructose", "C6H12O6")
+    c("glucose", "C6H12O6")
+    c("maltose", "C12H22O11")
 
-    g["gluconic_acid"] = Material.from_compound("C6H12O7")
+    c("gluconic_acid", "C6H12O7")
 
     # Amino acids
-    g["arginine"] = Material.from_compound("C6H14N4O2")
-    g["histidine"] = Material.from_compound("C6H9N3O2")
+    c("arginine", "C6H14N4O2")
+    c("histidine", "C6H9N3O2")
 
     # Polysaccharides
-    g["cellulose"] = Material.from_compound("C6H10O5", 1.5) # density: Wikipedia
+    c("cellulose", "C6H10O5", 1.5) # density: Wikipedia
 
     # Polymers
-    g["polyethylene_terephthalate"] = Material.from_compound("C10H8O4", 1.38) # density: Wikipedia
+    c("polyethylene_terephthalate", "C10H8O4", 1.38) # density: Wikipedia
 
-    g["polyoxymethylene"] = Material.from_compound("CH2O", 1.41) # density: wikipedia.  Delrin!
-    g["delrin"] = g["polyoxymethylene"]
+    c("polyoxymethylene", "CH2O", 1.41) # density: wikipedia.  Delrin!
+    _recipes.alias("delrin", "polyoxymethylene")
 
 
     # Components of C4
-    g["rdx"] = Material.from_compound("C3H6N6O6", 1.858) # wikipedia
-    g["dioctyl_sebacate"] = Material.from_compound("C26H50O4", 0.9) # wikipedia
-    g["polyisobutylene"] = Material.from_compound("C4H8", 0.92) # wikipedia; density has a range
+    c("rdx", "C3H6N6O6", 1.858) # wikipedia
+    c("dioctyl_sebacate", "C26H50O4", 0.9) # wikipedia
+    c("polyisobutylene", "C4H8", 0.92) # wikipedia; density has a range
 
     # Liang et al.
-    # Comprehensive chemical characterization of lubricating oils used in modern vehicular engines utilizing GC × GC-TOFMS
+    # Comprehensive chemical characterization of lubricating oils used in modern vehicular engines utilizing GC × GC-TOFMS
     # Fuel 220, 2018
     # This paper says that cyclohexene fragments are among the most common found
     # using gas chromatography of motor oils.  I need motor oil properties
     # for C4.
-    g["cyclohexene"] = Material.from_compound("C6H10") # Density unknown!!!!
-
-    globals().update(g)
+    c("cyclohexene", "C6H10") # Density unknown!!!!
 
 
 def list():
-    return [k for k in _g.keys()]
+    return _recipes.names()
+
+def __getattr__(name):
+    return _recipes.get(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(_recipes.names()))
 
 _init()
 
+__all__ = list()
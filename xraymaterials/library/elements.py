@@ -1,14 +1,32 @@
-from ..material import Material as _Material
-from ..elements import ELEMENTS as _ELEMENTS
-from .compounds import *
+"""Pure elements at their default densities, named in lower case (e.g. gold).
+
+Materials are built on first access.
+"""
+
+from .. import elementtable as _elementtable
+from ._lazy import Recipes
+
+_recipes = Recipes(__name__)
+
+def _element(symbol):
+    def recipe():
+        from ..material import Material as Material
+        return Material.from_element(symbol)
+    return recipe
 
 def _create_elements():
-    g = globals()
     for z in range(1,93):
-        elem = _ELEMENTS[z]
-        g[elem.name.lower()] = _Material.from_element(elem.symbol)
+        _recipes.add(str(_elementtable.NAME[z]).lower(), _element(str(_elementtable.SYMBOL[z])))
+
+def list():
+    return _recipes.names()
+
+def __getattr__(name):
+    return _recipes.get(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(_recipes.names()))
 
 _create_elements()
 
-def list():
-    return [_ELEMENTS[z].name.lower() for z in range(1,93)]
\ No newline at end of file
+__all__ = list()
@@ -1,106 +1,133 @@
+"""Mixtures of library elements and compounds.
 
-_g = dict()
+Materials are built on first access, along with the library materials they are made of.
+"""
 
-def _init():
+from ._lazy import Recipes
+from . import compounds as _c
+from . import elements as _e
+
+_recipes = Recipes(__name__)
+
+def _mixture(name):
+    def register(recipe):
+        _recipes.add(name, recipe)
+        return recipe
+    return register
+
+def _material():
     from ..material import Material as Material
-    from .elements import carbon, oxygen, hydrogen, nitrogen, lead, tin, nickel, manganese, chromium, iron, silicon, zinc, copper, phosphorus
-    from .compounds import cellulose, water, fructose, glucose, sucrose, maltose, gluconic_acid, water, acetic_acid
+    return Material
 
-    global _g
-    g = _g
 
-    # Density of textile fibers can be done with a gradient column:
-    # http://fashion2apparel.blogspot.com/2016/12/important-textile-fibers-densities.html
-    # These values range from 1.55 g/cc for cotton, down to 0.9 g/cc for polypropylene (Meraklon).
-    # (Meraklon is for diapers and other hygiene products.  tmyk)
-    # These densities are unhelpful for clothing in suitcases, sadly.
+# Density of textile fibers can be done with a gradient column:
+# http://fashion2apparel.blogspot.com/2016/12/important-textile-fibers-densities.html
+# These values range from 1.55 g/cc for cotton, down to 0.9 g/cc for polypropylene (Meraklon).
+# (Meraklon is for diapers and other hygiene products.  tmyk)
+# These densities are unhelpful for clothing in suitcases, sadly.
 
-    # A bale of cotton is around 450 kg/m^3 or 0.45 g/cc.
+# A bale of cotton is around 450 kg/m^3 or 0.45 g/cc.
 
-    # https://cerasis.com/calculate-freight-class/ referring to the NMFC book about freight classes
-    # 4-6 lbs/cubic foot
-    clothing_density_NMFC_g_cc = 0.096
-    clothing_density_Bill_g_cc = 0.25 # I think Bill said 0.25 g/cc was about right for clothes
+# https://cerasis.com/calculate-freight-class/ referring to the NMFC book about freight classes
+# 4-6 lbs/cubic foot
+_clothing_density_NMFC_g_cc = 0.096
+_clothing_density_Bill_g_cc = 0.25 # I think Bill said 0.25 g/cc was about right for clothes
 
-    # Detection of explosive materials using nuclear radiation, a critical review, Hussein 1992 cites
-    # W.J.Rof,J.R.Scot,J.Paciti,HandbokofComonPolymers:Fibres,Films,PlasticsandRubers,CRC Pres,Cleveland,1971.
-    # Mass density of silk/wool cloths: 200 kg/m3 = 0.2 g/cc
-    # 
+# Detection of explosive materials using nuclear radiation, a critical review, Hussein 1992 cites
+# W.J.Rof,J.R.Scot,J.Paciti,HandbokofComonPolymers:Fibres,Films,PlasticsandRubers,CRC Pres,Cleveland,1971.
+# Mass density of silk/wool cloths: 200 kg/m3 = 0.2 g/cc
+#
 
-    # From Bill:
-    #   I think .25 is pretty good.
-    #   If you think about the weight of a fully packed suitcase and divide by the volume, I think you will find it's close.
-    #   I have no source for this, but I have picked up a hell of a lot of suitcases.  (literally thousands)
+# From Bill:
+#   I think .25 is pretty good.
+#   If you think about the weight of a fully packed suitcase and divide by the volume, I think you will find it's close.
+#   I have no source for this, but I have picked up a hell of a lot of suitcases.  (literally thousands)
 
-    g["cotton_clothes_packed"] = cellulose.as_density(0.25)
+@_mixture("cotton_clothes_packed")
+def _cotton_clothes_packed():
+    return _c.cellulose.as_density(0.25)
 
-    # ==== Woods
+# ==== Woods
 
-    live_oak_g_cc = 0.977
-    white_oak_g_cc = 0.710
-    sugar_maple_g_cc = 0.676
-    jack_pine_g_cc = 0.461
-    wood = Material.sum_by_mass([carbon, oxygen, hydrogen, nitrogen], [50, 42, 6, 1])
+def _wood():
+    return _material().sum_by_mass([_e.carbon, _e.oxygen, _e.hydrogen, _e.nitrogen], [50, 42, 6, 1])
 
-    g["live_oak"] = wood.as_density(live_oak_g_cc)
-    g["white_oak"] = wood.as_density(white_oak_g_cc)
-    g["sugar_maple"] = wood.as_density(sugar_maple_g_cc)
-    g["jack_pine"] = wood.as_density(jack_pine_g_cc)
+def _add_wood(name, density_g_cc):
+    _recipes.add(name, lambda: _wood().as_density(density_g_cc))
 
-    # ==== Metal alloys
+_add_wood("live_oak", 0.977)
+_add_wood("white_oak", 0.710)
+_add_wood("sugar_maple", 0.676)
+_add_wood("jack_pine", 0.461)
 
-    # https://www.makeitfrom.com/material-properties/As-Forged-and-Air-Cooled-M10-C46400-Brass
-    g["naval_brass"] = Material.sum_by_mass([lead, tin, zinc, copper], [0.5, 0.5, 38, 61], final_density_g_cc=8.0)
+# ==== Metal alloys
 
-    # https://www.makeitfrom.com/material-properties/EN-CC481K-CuSn11P-C-Phosphor-Bronze
-    g["phosphor_bronze"] = Material.sum_by_mass([tin, phosphorus, copper], [11.0, 1.0, 88.0], final_density_g_cc=8.7)
+# https://www.makeitfrom.com/material-properties/As-Forged-and-Air-Cooled-M10-C46400-Brass
+@_mixture("naval_brass")
+def _naval_brass():
+    return _material().sum_by_mass([_e.lead, _e.tin, _e.zinc, _e.copper], [0.5, 0.5, 38, 61], final_density_g_cc=8.0)
 
-    # https://www.makeitfrom.com/material-properties/Half-Hard-201-Stainless-Steel
-    g["stainless_steel"] = Material.sum_by_mass([silicon, nickel, manganese, chromium, iron], [0.5, 4.5, 6.5, 17, 71.5], final_density_g_cc=7.7)
+# https://www.makeitfrom.com/material-properties/EN-CC481K-CuSn11P-C-Phosphor-Bronze
+@_mixture("phosphor_bronze")
+def _phosphor_bronze():
+    return _material().sum_by_mass([_e.tin, _e.phosphorus, _e.copper], [11.0, 1.0, 88.0], final_density_g_cc=8.7)
 
+# https://www.makeitfrom.com/material-properties/Half-Hard-201-Stainless-Steel
+@_mixture("stainless_steel")
+def _stainless_steel():
+    return _material().sum_by_mass([_e.silicon, _e.nickel, _e.manganese, _e.chromium, _e.iron], [0.5, 4.5, 6.5, 17, 71.5], final_density_g_cc=7.7)
 
-    # ==== Foodstuffs
 
-    # From Ball 2007, I will take the water and monosaccharide components and then
-    # just replace the other disaccharides with glucose.  Maltose for instance can
-    # be a big component of honey and has effects on its crystallization.
+# ==== Foodstuffs
 
+# From Ball 2007, I will take the water and monosaccharide components and then
+# just replace the other disaccharides with glucose.  Maltose for instance can
+# be a big component of honey and has effects on its crystallization.
+
+@_mixture("honey")
+def _honey():
     honey_g_cc = 1.415 # 0.5*(1.38 + 1.45) per wikipedia
-    g["honey"] = Material.sum_by_mass([water, fructose, glucose, sucrose, maltose, gluconic_acid],
+    return _material().sum_by_mass([_c.water, _c.fructose, _c.glucose, _c.sucrose, _c.maltose, _c.gluconic_acid],
                         [17.2, 38.4, 30.3, 1.3, 8.7, 0.57],
                         honey_g_cc)
 
-    # Generic vinegar: FDA regulations state minimum of 5% acidity (http://www.chem.latech.edu/~deddy/chem122m/L04U00Vinegar122.htm)
-    g["vinegar"] = Material.sum_by_mass([water, acetic_acid], [0.95, 0.05], 1.05) # density: google
+# Generic vinegar: FDA regulations state minimum of 5% acidity (http://www.chem.latech.edu/~deddy/chem122m/L04U00Vinegar122.htm)
+@_mixture("vinegar")
+def _vinegar():
+    return _material().sum_by_mass([_c.water, _c.acetic_acid], [0.95, 0.05], 1.05) # density: google
 
-    # https://www.simplyrecipes.com/a_guide_to_balsamic_vinegar/
-    # To qualify for official recognition, Balsamic Vinegar of Modena can only be made with the following ingredients:
-    # - Boiled or concentrated grape must (at least 20% by volume) 
-    # - Wine vinegar (at least 10%)
-    # - Natural caramel (made by cooking sugar) for color (up to 2%)
-    # - Aged balsamic vinegar (aged at least 10 years), an unspecified amount, usually negligible
+# https://www.simplyrecipes.com/a_guide_to_balsamic_vinegar/
+# To qualify for official recognition, Balsamic Vinegar of Modena can only be made with the following ingredients:
+# - Boiled or concentrated grape must (at least 20% by volume)
+# - Wine vinegar (at least 10%)
+# - Natural caramel (made by cooking sugar) for color (up to 2%)
+# - Aged balsamic vinegar (aged at least 10 years), an unspecified amount, usually negligible
 
 
 
-    # ==== Explosives
+# ==== Explosives
 
-    # C4 with RDX:
-    # 91% RDX
-    # 5.3% DOS
-    # 2.1% PIB
-    # 1.6% motor oil
-    # Nominal density 1.72658 g/cc
-    # (Wikipedia)
+# C4 with RDX:
+# 91% RDX
+# 5.3% DOS
+# 2.1% PIB
+# 1.6% motor oil
+# Nominal density 1.72658 g/cc
+# (Wikipedia)
 
-    from .compounds import rdx, dioctyl_sebacate, polyisobutylene, cyclohexene
-    g["c4_rdx"] = Material.sum_by_mass([rdx, dioctyl_sebacate, polyisobutylene, cyclohexene], 
-                                       [91.0, 5.3, 2.1, 1.6], 1.72658)
+@_mixture("c4_rdx")
+def _c4_rdx():
+    return _material().sum_by_mass([_c.rdx, _c.dioctyl_sebacate, _c.polyisobutylene, _c.cyclohexene],
+                                   [91.0, 5.3, 2.1, 1.6], 1.72658)
 
 
-    globals().update(g)
+def list():
+    return _recipes.names()
 
+def __getattr__(name):
+    return _recipes.get(name)
 
-def list():
-    return [k for k in _g.keys()]
+def __dir__():
+    return sorted(set(globals()) | set(_recipes.names()))
 
-_init()
+__all__ = list()
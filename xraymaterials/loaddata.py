@@ -1,26 +1,72 @@
 import os
-import pandas
 import glob
 import json
+import numpy as np
+
+from . import elementtable
+from .cache import LRUCache
+from .table import Table
 
 pwd = os.path.dirname(os.path.abspath(__file__))
 icru44_dir = os.path.join(pwd, "icru44")
 elements_dir = os.path.join(pwd, "elements")
 mixtures_dir = os.path.join(pwd, "mixtures")
+compiled_dir = os.path.join(pwd, "compiled")
+
+ELEMENT_COLUMNS = ["energy_keV", "f1_e_atom", "f2_e_atom", "mu_rho_pe_cm2_g", "sigma_rho_cm2_g",
+                   "mu_rho_tot_cm2_g", "mu_rho_K_cm2_g", "lambda_nm"]
+ELEMENT_COLUMN_INDEX = {name: ii for (ii, name) in enumerate(ELEMENT_COLUMNS)}
+
+# Bump when the layout of the packed element table changes, then rerun
+# python -m xraymaterials.compiletables
+ELEMENT_TABLE_VERSION = 1
+element_table_file = os.path.join(compiled_dir, f"elements_v{ELEMENT_TABLE_VERSION}.npy")
+element_index_file = os.path.join(compiled_dir, f"elements_v{ELEMENT_TABLE_VERSION}_index.npy")
+
+# Parsed tables returned by load_table, load_absorption_table, load_composition and load_compositions.
+# Adjust the limit with cache.max_bytes; inspect with cache.info().
+cache = LRUCache(max_bytes=64 * 2**20)
+
+def clear_cache():
+    """
+    Empty the table cache and reset its hit/miss counters.
+    """
+    cache.clear()
+
+def cache_info():
+    """
+    Return CacheInfo(hits, misses, entries, bytes, max_bytes) for the table cache.
+    """
+    return cache.info()
 
 def list_files(dir):
     files = glob.glob(os.path.join(dir, "*.txt"))
     return [os.path.splitext(os.path.basename(file))[0] for file in files]
 
-def load_csv_file(dir, file_name):
+def _file_path(dir, file_name):
     ext = os.path.splitext(file_name)
     if len(ext[1]) == 0:
         fname = file_name + ".txt"
     else:
         fname = file_name
-    
-    df = pandas.read_csv(os.path.join(dir, fname))
-    return df
+    return os.path.join(dir, fname)
+
+def load_csv_file(dir, file_name):
+    """
+    Return a data file as a pandas DataFrame of its own.  See load_table.
+    """
+    return load_table(dir, file_name).to_pandas(copy=True)
+
+def load_table(dir, file_name):
+    """
+    Return a data file as a Table of read-only NumPy columns.  Parsed once and cached.
+
+    Parameters:
+        dir: directory of the file, e.g. icru44_dir
+        file_name: name of the file.  ".txt" is added if it has no extension.
+    """
+    path = _file_path(dir, file_name)
+    return cache.get_or_compute(("table", path), lambda: Table.read_csv(path))
 
 def list_elements():
     """
@@ -28,7 +74,7 @@ def list_elements():
 
     Valid element names can be input to load_element.
     """
-    return _list_files(elements_dir)
+    return list_files(elements_dir)
 
 def load_element(element_name):
     """
@@ -48,7 +94,59 @@ def load_element(element_name):
                             isolated K-shell orbital
         lambda_nm:          photon wavelength
     """
-    return load_csv_file(elements_dir, element_name)
+    return load_element_table(element_name).to_pandas(copy=True)
+
+def load_element_table(element):
+    """
+    Return element xray properties as a Table with the columns of load_element.
+
+    Columns are read-only views of the packed element table; nothing is copied.
+
+    Parameters:
+        element: atomic number or symbol, e.g. 8 or "O"
+    """
+    return Table.from_block(ELEMENT_COLUMNS, load_element_array(element))
+
+_packed_elements = None
+
+def _load_packed_elements():
+    global _packed_elements
+    if _packed_elements is None:
+        shared_name = os.environ.get("XRAYMATERIALS_SHARED_TABLES")
+        if shared_name:
+            # Published by another process, see sharedtables
+            from .sharedtables import attach
+            return attach(shared_name)
+        if os.path.exists(element_table_file) and os.path.exists(element_index_file):
+            data = np.asarray(np.load(element_table_file, mmap_mode="r"))
+            index = np.load(element_index_file)
+        else:
+            from .compiletables import pack_element_tables
+            data, index = pack_element_tables()
+            data.flags.writeable = False
+        _packed_elements = (data, index)
+    return _packed_elements
+
+def load_element_array(element):
+    """
+    Return element xray properties as a read-only array.
+
+    The array is a slice of the packed element table, which is memory-mapped
+    on first use.  Row i holds column ELEMENT_COLUMNS[i], the same columns
+    returned by load_element.
+
+    Parameters:
+        element: atomic number or symbol, e.g. 8 or "O"
+
+    Returns:
+        table: array of shape (len(ELEMENT_COLUMNS), num_energies)
+    """
+    z = elementtable.atomic_number(element)
+    data, index = _load_packed_elements()
+    start, stop = index[z-1], index[z]
+    if start == stop:
+        raise Exception(f"No xray data for element '{element}'")
+    return data[:, start:stop]
 
 def load_absorption(material_name):
     """
@@ -63,7 +161,13 @@ def load_absorption(material_name):
         mu_rho_cm2_g:       mass attenuation coefficient
         muen_rho_cm2_g:     mass energy-absorption coefficient
     """
-    return load_csv_file(icru44_dir, material_name)
+    return load_absorption_table(material_name).to_pandas(copy=True)
+
+def load_absorption_table(material_name):
+    """
+    Return ICRU-44 material xray properties as a Table with the columns of load_absorption.
+    """
+    return load_table(icru44_dir, material_name)
 
 def load_composition(material_name):
     """
@@ -75,9 +179,22 @@ def load_composition(material_name):
         z: atomic numbers of elements in the mixture
         fraction: fraction by mass of each constituent element
     """
-    with open(os.path.join(pwd, "mixtures", "material_composition.txt")) as fh:
+    entry = _compositions()[material_name]
+    return dict(entry, z=list(entry["z"]), fraction=list(entry["fraction"]))
+
+def load_compositions():
+    """
+    Return the compositions of all ICRU-44 materials, in file order.
+
+    Returns a list of dicts with the fields of load_composition.
+    """
+    return [dict(entry, z=list(entry["z"]), fraction=list(entry["fraction"]))
+            for entry in _compositions().values()]
+
+def _compositions():
+    return cache.get_or_compute(("composition",), _load_composition_file)
+
+def _load_composition_file():
+    with open(os.path.join(mixtures_dir, "material_composition.txt")) as fh:
         s = json.load(fh)
-        kvs = [(entry["material"], entry) for entry in s]
-        s_dict = dict(kvs)
-    entry = s_dict[material_name]
-    return entry
+    return {entry["material"]: entry for entry in s}
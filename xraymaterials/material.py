@@ -1,15 +1,53 @@
 import numpy as np
-from . import elements
-from .refractiveindex import calculate_n, calculate_mu, calculate_mass_coefficient
+from . import elementtable
+from .refractiveindex import calculate_delta, calculate_beta, calculate_mu, calculate_mass_coefficient, calculate_optical_properties
 from . import stoichiometry
 from . import icru44
+from .scalartable import ScalarTable
+from . import spectra
+
+def _is_scalar(energy_keV):
+    return isinstance(energy_keV, (int, float, np.integer, np.floating))
+
+def _atomic_numbers(symbols):
+    """
+    Return int8 array of atomic numbers from symbols (e.g. "H") or atomic numbers.
+
+    Integers are taken as they are; only symbols and names are looked up.
+    """
+    if not isinstance(symbols, np.ndarray):
+        symbols = [s for s in symbols]
+    z = elementtable.atomic_numbers(symbols).reshape(-1)
+    if z.size and (z.min() < 1 or z.max() > elementtable.MAX_Z):
+        raise Exception(f"Invalid atomic numbers {z[(z < 1) | (z > elementtable.MAX_Z)]}")
+    return z.astype(np.int8)
+
+# Property name and function(z, g_cc, energy_keV, out) that calculates it
+_CALCULATE = {
+    "delta": lambda z, g_cc, energy_keV, out: calculate_delta(z, elem_g_cc=g_cc, energy_keV=energy_keV, out=out)[0],
+    "beta": lambda z, g_cc, energy_keV, out: calculate_beta(z, elem_g_cc=g_cc, energy_keV=energy_keV, out=out)[0],
+    "mu": lambda z, g_cc, energy_keV, out: calculate_mu(z, elem_g_cc=g_cc, energy_keV=energy_keV, out=out)[0],
+    "mu_pe": lambda z, g_cc, energy_keV, out: calculate_mass_coefficient(z, g_cc, "mu_rho_pe_cm2_g", energy_keV, out)[0],
+    "mu_pe_k": lambda z, g_cc, energy_keV, out: calculate_mass_coefficient(z, g_cc, "mu_rho_K_cm2_g", energy_keV, out)[0],
+    "sigma": lambda z, g_cc, energy_keV, out: calculate_mass_coefficient(z, g_cc, "sigma_rho_cm2_g", energy_keV, out)[0],
+}
 
 class Material:
     """
     Representation of materials for purpose of calculating xray absorption and refractive index.
     
     A material is essentially a dict of atomic symbols and mass densities.
+
+    Materials are immutable.  z (int8) and g_cc (float64) are read-only arrays
+    sorted by atomic number, so equal compositions compare and hash equal
+    however they were built.  Use as_density() instead of setting density.
+
+    Property methods given a single energy (e.g. water.mu(30.0)) take a fast
+    path through a table precomputed for the material, see scalartable.
+    Given arrays, they return read-only results memoized by spectra.
     """
+
+    __slots__ = ("_z", "_g_cc", "_hash", "_scalar_table", "_unit")
     
     def __init__(self, symbols, density_g_cc):
         """
@@ -22,85 +60,187 @@ class Material:
         Material.from_vector()
         Material.from_dict()
         
+        Repeated elements are added together.  Elements of zero density are left out.
+
         Args:
             symbols (array-like): List of symbols (e.g. "H") or atomic numbers
             density_g_cc (array-like): List of corresponding densities for each element, in grams per cc.
         """
-        self.z = []
-        self.g_cc = []
-        for s, density in zip(symbols, density_g_cc):
-            self.z.append(elements.ELEMENTS[s].number)
-            self.g_cc.append(density)
-        
-    def delta(self, energy_keV):
+        z = _atomic_numbers(symbols)
+        if not isinstance(density_g_cc, np.ndarray):
+            density_g_cc = [d for d in density_g_cc]
+        g_cc = np.array(density_g_cc, dtype=np.float64).reshape(-1)
+        if len(z) != len(g_cc):
+            raise Exception(f"Got {len(z)} elements but {len(g_cc)} densities")
+
+        unique_z, inverse = np.unique(z, return_inverse=True)
+        if len(unique_z) == len(z):
+            g_cc = g_cc[np.argsort(z)]
+        else:
+            summed = np.zeros(len(unique_z))
+            np.add.at(summed, inverse, g_cc)
+            g_cc = summed
+        # Elements of zero density are left out, as in from_array()
+        nonzero = g_cc != 0
+        if not nonzero.all():
+            unique_z, g_cc = unique_z[nonzero], g_cc[nonzero]
+        self._init(unique_z, g_cc)
+
+    def _init(self, z, g_cc):
+        # -0.0 + 0.0 is 0.0, so densities that compare equal also hash equal
+        g_cc = g_cc + 0.0
+        z.flags.writeable = False
+        g_cc.flags.writeable = False
+        self._z = z
+        self._g_cc = g_cc
+        self._hash = None
+        self._scalar_table = None
+        self._unit = None
+
+    @classmethod
+    def _from_arrays(cls, z, g_cc):
+        """
+        Create Material from int8 atomic numbers, sorted and unique, and float64 densities.
+
+        Takes ownership of the arrays and skips all checks.
+        """
+        material = cls.__new__(cls)
+        material._init(z, g_cc)
+        return material
+
+    @property
+    def z(self):
+        """
+        Atomic numbers of constituent elements, in increasing order
+        """
+        return self._z
+
+    @property
+    def g_cc(self):
+        """
+        Densities of constituent elements [g/cc]
+        """
+        return self._g_cc
+
+    def __eq__(self, other):
+        if not isinstance(other, Material):
+            return NotImplemented
+        return np.array_equal(self._z, other._z) and np.array_equal(self._g_cc, other._g_cc)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self._z.tobytes(), self._g_cc.tobytes()))
+        return self._hash
+
+    def __reduce__(self):
+        return (Material._from_arrays, (self._z, self._g_cc))
+
+    def delta(self, energy_keV, out=None):
         """
         Calculate refractive index decrement at given energies.
         The xray refractive index is given by n = 1 - delta - 1j*beta.
         
-        energy_keV: photon energies of interest, in keV
+        energy_keV: photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+        out: (optional) array to write the result into, with the shape of energy_keV
         
         Returns: delta corresponding to each energy
         """
-        delta, _, _ = calculate_n(self.z, elem_g_cc=self.g_cc, energy_keV=energy_keV)
-        return delta
+        return self._evaluate("delta", energy_keV, out)
     
-    def beta(self, energy_keV):
+    def beta(self, energy_keV, out=None):
         """
         Calculate imaginary part of refractive index at given energies.
         The xray refractive index is given by n = 1 - delta - 1j*beta.
         
-        energy_keV: photon energies of interest, in keV
+        energy_keV: photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+        out: (optional) array to write the result into, with the shape of energy_keV
         
         Returns: beta corresponding to each energy
         """
-        _, beta, _ = calculate_n(self.z, elem_g_cc=self.g_cc, energy_keV=energy_keV)
-        return beta
+        return self._evaluate("beta", energy_keV, out)
     
-    def mu(self, energy_keV):
+    def mu(self, energy_keV, out=None):
         """
         Calculate total absorption coefficient at given energies.  (Units: 1/cm)
         The total absorption includes photoelectric and Compton components.
         
-        energy_keV: photon energies of interest, in keV
+        energy_keV: photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+        out: (optional) array to write the result into, with the shape of energy_keV
         
         Returns: mu corresponding to each energy
         """
-        mu, _ = calculate_mu(self.z, elem_g_cc=self.g_cc, energy_keV=energy_keV)
-        return mu
+        return self._evaluate("mu", energy_keV, out)
     
-    def mu_pe(self, energy_keV):
+    def mu_pe(self, energy_keV, out=None):
         """
         Calculate photoelectric part of absorption coefficient at given energies.  (Units: 1/cm)
         
-        energy_keV: photon energies of interest, in keV
+        energy_keV: photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+        out: (optional) array to write the result into, with the shape of energy_keV
         
         Returns: mu_pe corresponding to each energy
         """
-        mu_pe, _ = calculate_mass_coefficient(self.z, self.g_cc, "mu_rho_pe_cm2_g", energy_keV)
-        return mu_pe
+        return self._evaluate("mu_pe", energy_keV, out)
     
-    def mu_pe_k(self, energy_keV):
+    def mu_pe_k(self, energy_keV, out=None):
         """
         Calculate K-shell component of photoelectric part of absorption coefficient at given energies.  (Units: 1/cm)
         
-        energy_keV: photon energies of interest, in keV
+        energy_keV: photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+        out: (optional) array to write the result into, with the shape of energy_keV
         
         Returns: mu_pe_k corresponding to each energy
         """
-        mu_pe_k, _ = calculate_mass_coefficient(self.z, self.g_cc, "mu_rho_K_cm2_g", energy_keV)
-        return mu_pe_k
+        return self._evaluate("mu_pe_k", energy_keV, out)
     
-    def sigma(self, energy_keV):
+    def sigma(self, energy_keV, out=None):
         """
         Calculate total scattering cross-section at given energies.  (Units: 1/cm)
         
-        energy_keV: photon energies of interest, in keV
+        energy_keV: photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+        out: (optional) array to write the result into, with the shape of energy_keV
         
         Returns: sigma corresponding to each energy
         """
-        sigma, _ = calculate_mass_coefficient(self.z, self.g_cc, "sigma_rho_cm2_g", energy_keV)
-        return sigma
+        return self._evaluate("sigma", energy_keV, out)
     
+    def _evaluate(self, property_name, energy_keV, out):
+        """
+        Evaluate a property, through the scalar table for single energies or
+        the spectrum cache otherwise.  Calls with out are always computed.
+        """
+        if out is None:
+            if _is_scalar(energy_keV) and len(self.z):
+                return self._scalar(property_name, energy_keV)
+            return spectra.cached(self, property_name, energy_keV,
+                                  lambda: _CALCULATE[property_name](self.z, self.g_cc, energy_keV, None))
+        return _CALCULATE[property_name](self.z, self.g_cc, energy_keV, out)
+
+    def _scalar(self, property_name, energy_keV):
+        """
+        Evaluate a property at a single energy from this material's ScalarTable.
+        """
+        if self._scalar_table is None:
+            self._scalar_table = ScalarTable(self.z, self.g_cc)
+        return np.float64(self._scalar_table(property_name, float(energy_keV)))
+
+    def optical_properties(self, energy_keV, out=None):
+        """
+        Calculate all optical properties at given energies in one pass.
+
+        Faster than calling delta(), beta(), mu(), mu_pe(), mu_pe_k() and
+        sigma() separately, since each element table is loaded and
+        interpolated only once.
+
+        energy_keV: photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+        out: (optional) six arrays to write delta, beta, mu, mu_pe, mu_pe_k and
+             sigma into, each with the shape of energy_keV
+
+        Returns: OpticalProperties named tuple with fields delta, beta, mu,
+                 mu_pe, mu_pe_k, sigma and energy_keV
+        """
+        return calculate_optical_properties(self.z, elem_g_cc=self.g_cc, energy_keV=energy_keV, out=out)
+
     def __add__(self, rhs):
         """
         Add materials by mass density.
@@ -124,16 +264,15 @@ class Material:
         return Material.from_array(z)
 
     def __getitem__(self, key):
-        if isinstance(key, str) or isinstance(key, int):
-            return self[ [key] ]
-
-        indices = [elements.ELEMENTS[k].number-1 for k in key]
-
-        x = self.to_array()
-        y = np.zeros_like(x)
-        y[indices] = x[indices]
+        """
+        Return Material made of only the given elements.
 
-        return Material.from_array(y)
+        key: symbol or atomic number, or list of them
+        """
+        if isinstance(key, (str, int, np.integer)):
+            key = [key]
+        keep = np.isin(self._z, _atomic_numbers(key))
+        return Material._from_arrays(self._z[keep], self._g_cc[keep])
         
     def to_dict(self):
         """
@@ -141,7 +280,7 @@ class Material:
         
         Returns: dict(zip(z, density_g_cc))
         """
-        return dict(zip(self.z, self.g_cc))
+        return dict(zip(self._z.tolist(), self._g_cc.tolist()))
     
     @staticmethod
     def _to_array(z, values):
@@ -163,20 +302,69 @@ class Material:
         """
         Total density of material [g/cc]
         """
-        return np.sum(self.g_cc)
+        return self._g_cc.sum()
     
     @density.setter
     def density(self, value):
-        multiplier = value / self.density
-        self.g_cc = np.multiply(self.g_cc, multiplier)
+        raise Exception("Materials are immutable; use material.as_density(new_density_g_cc) instead")
     
     def as_density(self, new_density_g_cc):
         """
         Return Material with density changed to new value.
         """
-        new_material = Material(self.z, self.g_cc)
-        new_material.density = new_density_g_cc
-        return new_material
+        return Material._from_arrays(self._z, self._g_cc * (new_density_g_cc / self.density))
+
+    def mass_fractions(self):
+        """
+        Return fraction by mass of each element in self.z
+        """
+        return self._g_cc / self.density
+
+    def unit_density(self):
+        """
+        Return Material with the same composition at a density of 1 g/cc.
+        """
+        if self._unit is None:
+            self._unit = Material._from_arrays(self._z, self.mass_fractions())
+        return self._unit
+
+    def mass_coefficient(self, property_name, energy_keV):
+        """
+        Calculate a property per unit density, i.e. of this composition at 1 g/cc.
+
+        For mu, mu_pe, mu_pe_k and sigma this is the mass coefficient in cm^2/g;
+        for delta and beta it is the value per g/cc.  Every property is
+        proportional to density, so the property at density rho is
+        rho * mass_coefficient().  Results are read-only and memoized per
+        composition, so all densities of one composition share them.
+
+        property_name: one of "delta", "beta", "mu", "mu_pe", "mu_pe_k", "sigma"
+        energy_keV:    photon energies of interest, in keV, or an EnergyGrid.  Any shape.
+
+        Returns: property per g/cc at each energy
+        """
+        if property_name not in _CALCULATE:
+            raise Exception('Invalid property name {}, should be one of {}'.format(property_name, list(_CALCULATE)))
+        if _is_scalar(energy_keV):
+            return self.mass_coefficient(property_name, np.array([energy_keV]))[0]
+        unit = self.unit_density()
+        return spectra.cached(self, property_name, energy_keV,
+                              lambda: _CALCULATE[property_name](unit.z, unit.g_cc, energy_keV, None),
+                              per_unit_density=True)
+
+    def at_densities(self, property_name, energy_keV, density_g_cc):
+        """
+        Calculate a property of this composition at one or many densities.
+
+        A single multiply of the memoized mass_coefficient() per call.
+
+        property_name: one of "delta", "beta", "mu", "mu_pe", "mu_pe_k", "sigma"
+        energy_keV:    photon energies of interest, in keV, or an EnergyGrid
+        density_g_cc:  density or array of densities [g/cc]
+
+        Returns: array of shape np.shape(density_g_cc) + np.shape(energy_keV)
+        """
+        return np.multiply.outer(density_g_cc, self.mass_coefficient(property_name, energy_keV))
 
     def number_densities(self):
         """
@@ -197,7 +385,7 @@ class Material:
         density_g_cc: (optional) density of material [g/cc]
         """
         if density_g_cc is None:
-            density_g_cc = elements.ELEMENTS[symbol].density
+            density_g_cc = float(elementtable.DENSITY[elementtable.atomic_number(symbol)])
         return cls([symbol], [density_g_cc])
     
     @classmethod
@@ -234,8 +422,9 @@ class Material:
         
         density_g_cc: array of densities
         """
-        z = np.where(density_g_cc)[0] + 1
-        return cls(z, density_g_cc[z-1])
+        density_g_cc = np.asarray(density_g_cc, dtype=np.float64)
+        index = np.flatnonzero(density_g_cc)
+        return cls._from_arrays((index + 1).astype(np.int8), density_g_cc[index])
     
     @classmethod
     def from_dict(cls, z_density):
@@ -248,8 +437,8 @@ class Material:
         return cls(z_density.keys(), z_density.values())
         
     def __repr__(self):
-        keys = [elements.ELEMENTS[z].symbol for z in self.z]
-        d = dict(zip(keys, self.g_cc))
+        keys = elementtable.SYMBOL[self._z].tolist()
+        d = dict(zip(keys, self._g_cc.tolist()))
         return repr(d)
     
     def __str__(self):
@@ -306,16 +495,22 @@ class Material:
         return Material.sum_by_mass([mat1, mat2], [m1, m2], final_density_g_cc)
 
     @staticmethod
-    def sum_by_volume(materials, volumes, final_density_g_cc=None):
+    def sum_by_volume(materials, volumes, final_density_g_cc=None, lazy=False):
         """
         Sum multiple materials with given parts-per-volume.  Volume is conserved.
         
         materials:          list of Materials
         volumes:            list of parts-by-volume
         final_density_g_cc: (optional) density of resulting material [g/cc]
+        lazy:               return a Mixture that evaluates properties from its
+                            components' spectra, see xraymaterials.mixture
         
         Returns: Material representing mixture of materials
         """
+        if lazy:
+            from .mixture import Mixture
+            return Mixture.by_volume(materials, volumes, final_density_g_cc)
+
         masses = [m.to_array() * v for (m,v) in zip(materials, volumes)]
         mass_total = np.sum(masses, 0)
         v_total = np.sum(volumes)
@@ -323,24 +518,26 @@ class Material:
         new_material = Material.from_array(mass_total / v_total)
         
         if final_density_g_cc is not None:
-            new_material.density = final_density_g_cc
+            new_material = new_material.as_density(final_density_g_cc)
         
         return new_material
 
     @staticmethod
-    def sum_by_mass(materials, masses, final_density_g_cc=None):
+    def sum_by_mass(materials, masses, final_density_g_cc=None, lazy=False):
         """
         Sum multiple materials with given parts-per-mass.  Volume is conserved.
         
         materials:          list of Materials
         masses:             list of parts-by-mass
         final_density_g_cc: (optional) density of resulting material [g/cc]
+        lazy:               return a Mixture that evaluates properties from its
+                            components' spectra, see xraymaterials.mixture
         
         Returns: Material representing mixture of materials
         """
         
         volumes = np.divide(masses, [m.density for m in materials])
-        return Material.sum_by_volume(materials, volumes, final_density_g_cc)
+        return Material.sum_by_volume(materials, volumes, final_density_g_cc, lazy)
     
     # An idea.
     # def _repr_markdown_(self):
@@ -354,3 +551,12 @@ class Material:
     #         s += elements.ELEMENTS[z].symbol + f"_{{{g_cc:0.3f}}}"
     #     s += "$"
     #     return s
+
+
+def _test_hash():
+    a = Material([1, 8], [0.1, -0.0])
+    b = Material([8, 1], [0.0, 0.1])
+    assert a == b and hash(a) == hash(b) and len({a, b}) == 1
+    c = Material([1, 8], [0.1, 0.0])
+    d = Material.from_array(c.to_array())
+    assert c == d and hash(c) == hash(d) and c.z.tolist() == [1]
@@ -0,0 +1,220 @@
+"""
+Lazy mixtures of materials.
+
+Every property xraymaterials computes is linear in element density, so the
+property of a mixture is the weighted sum of its components' properties.
+A Mixture records its components and weights and evaluates properties that
+way, reusing component spectra already memoized by spectra.  It is flattened
+into a Material of element densities only when something needs one.
+
+    honey = Material.sum_by_mass([water, fructose, glucose], [17.2, 38.4, 30.3], 1.415, lazy=True)
+    honey.mu(energy_keV)      # weighted sum of water.mu, fructose.mu, glucose.mu, read-only
+    honey.flatten()           # Material
+
+Mixtures are opt-in; the library's mixtures are Materials.  A Mixture is
+not a Material subclass, so use flatten() where a Material is required.
+
+Attributes a Mixture does not define itself (z, g_cc, to_dict, [], ...) are
+taken from its flattened Material.
+"""
+
+import numpy as np
+
+from . import spectra
+from .material import Material, _is_scalar
+
+
+class Mixture:
+    """
+    Weighted sum of materials: element densities are sum(weights[i] * components[i]).
+
+    Weights are volume fractions when the components keep their own
+    densities, as in Material.sum_by_volume.  Components may be Materials or Mixtures.
+    """
+
+    __slots__ = ("components", "weights", "_flat")
+
+    def __init__(self, components, weights):
+        """
+        Args:
+            components (list): Materials or Mixtures
+            weights (array-like): weight of each component
+        """
+        components = tuple(c for c in components)
+        weights = np.array(weights, dtype=float).reshape(-1)
+        if len(components) == 0:
+            raise Exception("A Mixture needs at least one component")
+        if len(components) != len(weights):
+            raise Exception(f"Got {len(components)} components but {len(weights)} weights")
+        weights.flags.writeable = False
+        self.components = components
+        self.weights = weights
+        self._flat = None
+
+    @classmethod
+    def by_volume(cls, materials, volumes, final_density_g_cc=None):
+        """
+        Mixture of materials with given parts-per-volume.  Volume is conserved.
+
+        See Material.sum_by_volume.
+        """
+        volumes = np.asarray(volumes, dtype=float)
+        mixture = cls(materials, volumes / np.sum(volumes))
+        if final_density_g_cc is not None:
+            mixture = mixture.as_density(final_density_g_cc)
+        return mixture
+
+    @classmethod
+    def by_mass(cls, materials, masses, final_density_g_cc=None):
+        """
+        Mixture of materials with given parts-per-mass.  Volume is conserved.
+
+        See Material.sum_by_mass.
+        """
+        volumes = np.divide(masses, [m.density for m in materials])
+        return cls.by_volume(materials, volumes, final_density_g_cc)
+
+    def flatten(self):
+        """
+        Return the Material with the element densities of this mixture.  Built once.
+        """
+        if self._flat is None:
+            self._flat = Material.from_array(self.to_array())
+        return self._flat
+
+    def to_array(self):
+        """
+        Convert to array.  Length of array is 99.  Nth element corresponds to atomic number N+1.
+
+        Returns: array of densities of component elements [g/cc]
+        """
+        if self._flat is not None:
+            return self._flat.to_array()
+        total = np.zeros(99)
+        for (weight, component) in zip(self.weights, self.components):
+            total += weight * component.to_array()
+        return total
+
+    @property
+    def density(self):
+        """
+        Total density of mixture [g/cc]
+        """
+        return sum(weight * component.density for (weight, component) in zip(self.weights, self.components))
+
+    def as_density(self, new_density_g_cc):
+        """
+        Return Mixture with density changed to new value.
+        """
+        return Mixture(self.components, self.weights * (new_density_g_cc / self.density))
+
+    def _evaluate(self, property_name, energy_keV, out):
+        """
+        Evaluate a property as the weighted sum of the components' property.
+
+        As for Material, array results are memoized by spectra and read-only,
+        and calls with out are computed without touching the cache.
+        """
+        if out is None:
+            if _is_scalar(energy_keV):
+                return self._sum(property_name, energy_keV, None)
+            return spectra.cached(self.flatten(), "mixture/" + property_name, energy_keV,
+                                  lambda: self._sum(property_name, energy_keV, None))
+        return self._sum(property_name, energy_keV, out)
+
+    def _sum(self, property_name, energy_keV, out):
+        total = out
+        scratch = None
+        for (ii, (weight, component)) in enumerate(zip(self.weights, self.components)):
+            method = getattr(component, property_name)
+            if out is None:
+                values = method(energy_keV)
+            else:
+                # Components are computed into scratch space, so chunked
+                # evaluation (see parallel) leaves the cache alone
+                if scratch is None:
+                    scratch = np.empty_like(out)
+                values = method(energy_keV, out=scratch)
+            if ii == 0:
+                total = np.multiply(values, weight, out=out)
+            else:
+                total += values * weight
+        return total
+
+    def delta(self, energy_keV, out=None):
+        """
+        Refractive index decrement at given energies.  n = 1 - delta - 1j*beta
+        """
+        return self._evaluate("delta", energy_keV, out)
+
+    def beta(self, energy_keV, out=None):
+        """
+        Imaginary part of refractive index at given energies.  n = 1 - delta - 1j*beta
+        """
+        return self._evaluate("beta", energy_keV, out)
+
+    def mu(self, energy_keV, out=None):
+        """
+        Total attenuation coefficient at given energies [1/cm]
+        """
+        return self._evaluate("mu", energy_keV, out)
+
+    def mu_pe(self, energy_keV, out=None):
+        """
+        Photoelectric attenuation coefficient at given energies [1/cm]
+        """
+        return self._evaluate("mu_pe", energy_keV, out)
+
+    def mu_pe_k(self, energy_keV, out=None):
+        """
+        K-shell component of photoelectric attenuation coefficient at given energies [1/cm]
+        """
+        return self._evaluate("mu_pe_k", energy_keV, out)
+
+    def sigma(self, energy_keV, out=None):
+        """
+        Total scattering cross-section at given energies [1/cm]
+        """
+        return self._evaluate("sigma", energy_keV, out)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.flatten(), name)
+
+    def __getitem__(self, key):
+        return self.flatten()[key]
+
+    def __add__(self, rhs):
+        return self.flatten() + rhs
+
+    def __eq__(self, other):
+        if isinstance(other, (Material, Mixture)):
+            return np.array_equal(self.to_array(), other.to_array())
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.flatten())
+
+    def __repr__(self):
+        return repr(self.flatten())
+
+    def __str__(self):
+        return repr(self)
+
+
+def _test_mixture():
+    from . import library
+    from . import parallel
+    energy_keV = np.linspace(20.0, 60.0, 1001)
+    water, salt = library.water, Material.from_compound("NaCl", 2.16)
+    mixture = Material.sum_by_mass([water, salt], [1.0, 0.357], 1.193, lazy=True)
+    material = Material.sum_by_mass([water, salt], [1.0, 0.357], 1.193)
+    mu = mixture.mu(energy_keV)
+    assert not mu.flags.writeable and mixture.mu(energy_keV) is mu
+    np.testing.assert_allclose(mu, material.mu(energy_keV), rtol=1e-12)
+    np.testing.assert_allclose(mixture.mu(30.0), material.mu(30.0), rtol=1e-12)
+    entries = spectra.cache_info().entries
+    chunked = parallel.evaluate(mixture, "mu", energy_keV, chunk_size=100, num_threads=2)
+    assert spectra.cache_info().entries == entries
+    np.testing.assert_allclose(chunked, mu, rtol=1e-12)
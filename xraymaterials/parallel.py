@@ -0,0 +1,292 @@
+"""
+Chunked, multi-threaded evaluation of material properties.
+
+For very large energy arrays (detector simulations pass 10^8 energies), the
+energies are split into chunks and each chunk is evaluated by the usual
+Material method in a thread pool, writing straight into its slice of the
+result.  np.interp and NumPy arithmetic release the GIL, so this scales with
+cores, and every energy goes through exactly the same operations as in the
+serial path, so results are bit-identical.
+
+Example:
+    mu = parallel.evaluate(water, "mu", energy_keV)
+    parallel.evaluate(water, "beta", energy_keV, out=beta, num_threads=8)
+
+Defaults are CHUNK_SIZE and NUM_THREADS; change them with configure().
+
+To spread many materials over all cores of a node, use a ProcessBackend.
+Its workers load the element tables once, receive only density vectors and
+the name of a shared memory block holding the energies, and write results
+into another shared memory block instead of pickling arrays back:
+
+    with parallel.ProcessBackend() as backend:
+        mu = backend.evaluate(materials, "mu", energy_keV)   # (materials,) + energy_keV.shape
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from . import loaddata
+from .batch import MaterialBatch
+from .coefficients import density_array, NUM_ELEMENTS
+from .energygrid import EnergyGrid
+
+# Energies per chunk.  2**18 doubles is 2 MiB, so a chunk's temporaries stay in cache.
+CHUNK_SIZE = 2**18
+NUM_THREADS = os.cpu_count() or 1
+
+PROPERTIES = ("delta", "beta", "mu", "mu_pe", "mu_pe_k", "sigma")
+
+# One thread pool, replaced when a different number of threads is requested
+_executor = None
+_executor_threads = 0
+_executor_lock = threading.Lock()
+
+
+def configure(chunk_size=None, num_threads=None):
+    """
+    Set the default chunk size and number of threads of evaluate().
+    """
+    global CHUNK_SIZE, NUM_THREADS
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise Exception(f"chunk_size must be positive, got {chunk_size}")
+        CHUNK_SIZE = int(chunk_size)
+    if num_threads is not None:
+        if num_threads < 1:
+            raise Exception(f"num_threads must be positive, got {num_threads}")
+        NUM_THREADS = int(num_threads)
+
+
+def _submit(num_threads, calls):
+    """
+    Submit (function, args, kwargs) calls to the thread pool and return their futures.
+
+    A pool of another size is shut down and replaced.  Its submitted work
+    still runs, so concurrent calls with other thread counts are safe.
+    """
+    global _executor, _executor_threads
+    with _executor_lock:
+        if _executor is None or _executor_threads != num_threads:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(num_threads, thread_name_prefix="xraymaterials")
+            _executor_threads = num_threads
+        return [_executor.submit(function, *args, **kwargs) for (function, args, kwargs) in calls]
+
+
+def shutdown():
+    """
+    Shut down the thread pool of evaluate().  A new one is started when needed.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def evaluate(material, property_name, energy_keV, out=None, chunk_size=None, num_threads=None):
+    """
+    Evaluate a property of a material in chunks of energies, on several threads.
+
+    material:      Material
+    property_name: one of "delta", "beta", "mu", "mu_pe", "mu_pe_k", "sigma"
+    energy_keV:    photon energies in keV, any shape.  An EnergyGrid is
+                   evaluated serially, since its cached weights cover the whole grid.
+    out:           (optional) C-contiguous array to write the result into,
+                   with the shape of energy_keV
+    chunk_size:    energies per chunk, default CHUNK_SIZE
+    num_threads:   threads to use, default NUM_THREADS
+
+    Returns: property at each energy, identical to getattr(material, property_name)(energy_keV)
+    """
+    if property_name not in PROPERTIES:
+        raise Exception('Invalid property name {}, should be one of {}'.format(property_name, PROPERTIES))
+    method = getattr(material, property_name)
+    chunk_size = CHUNK_SIZE if chunk_size is None else chunk_size
+    num_threads = NUM_THREADS if num_threads is None else num_threads
+
+    if isinstance(energy_keV, EnergyGrid):
+        return method(energy_keV, out=out)
+
+    energy_keV = np.asarray(energy_keV)
+    if out is None:
+        out = np.empty(energy_keV.shape)
+    elif out.shape != energy_keV.shape:
+        raise Exception(f"out has shape {out.shape}, but energies have shape {energy_keV.shape}")
+    elif not out.flags.c_contiguous:
+        raise Exception("out must be C-contiguous")
+
+    flat_energy = energy_keV.ravel()
+    flat_out = out.reshape(-1)
+    if num_threads == 1 or flat_energy.size <= chunk_size:
+        method(flat_energy, out=flat_out)
+        return out
+
+    starts = range(0, flat_energy.size, chunk_size)
+    futures = _submit(num_threads, [(method, (flat_energy[ii:ii+chunk_size],), {"out": flat_out[ii:ii+chunk_size]})
+                                    for ii in starts])
+    for future in futures:
+        future.result()
+    return out
+
+
+class ProcessBackend:
+    """
+    Process pool for evaluating properties of many materials at once.
+
+    Results match getattr(material, property_name)(EnergyGrid(energy_keV)):
+    each worker builds one EnergyGrid per call and reuses its interpolation
+    weights for every material it evaluates.
+    """
+
+    def __init__(self, max_workers=None, materials_per_task=None):
+        """
+        Args:
+            max_workers (int): number of worker processes, default os.cpu_count()
+            materials_per_task (int): (optional) materials sent to a worker at a
+                time.  Default splits each call into about 4 tasks per worker.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.materials_per_task = materials_per_task
+        from concurrent.futures import ProcessPoolExecutor
+        self._executor = ProcessPoolExecutor(self.max_workers, initializer=_init_process_worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+    def evaluate(self, materials, property_name, energy_keV, out=None):
+        """
+        Evaluate a property of many materials.
+
+        materials:     list of Materials, a MaterialBatch, or a (materials x 99) density matrix
+        property_name: one of "delta", "beta", "mu", "mu_pe", "mu_pe_k", "sigma"
+        energy_keV:    photon energies in keV, any shape
+        out:           (optional) array to copy the result into
+
+        Returns: array of shape (materials,) + energy_keV.shape
+        """
+        if property_name not in PROPERTIES:
+            raise Exception('Invalid property name {}, should be one of {}'.format(property_name, PROPERTIES))
+        density_g_cc = _density_matrix(materials)
+        energy_keV = np.asarray(energy_keV, dtype=float)
+        shape = (len(density_g_cc),) + energy_keV.shape
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape:
+            raise Exception(f"out has shape {out.shape}, expected {shape}")
+        if len(density_g_cc) == 0 or energy_keV.size == 0:
+            return out
+
+        per_task = self.materials_per_task or -(-len(density_g_cc) // (4 * self.max_workers))
+        energy_shm = _new_shared_array(energy_keV.shape)
+        result_shm = _new_shared_array(shape)
+        try:
+            _shared_array(energy_shm, energy_keV.shape)[...] = energy_keV
+            futures = [self._executor.submit(_process_task, property_name,
+                                             energy_shm.name, energy_keV.shape, result_shm.name, shape,
+                                             start, density_g_cc[start:start+per_task])
+                       for start in range(0, len(density_g_cc), per_task)]
+            for future in futures:
+                future.result()
+            out[...] = _shared_array(result_shm, shape)
+        finally:
+            for shm in (energy_shm, result_shm):
+                shm.close()
+                shm.unlink()
+        return out
+
+
+def evaluate_materials(materials, property_name, energy_keV, max_workers=None):
+    """
+    Evaluate a property of many materials on a temporary ProcessBackend.
+
+    Starting the pool costs some time; keep a ProcessBackend for repeated calls.
+
+    Returns: array of shape (materials,) + energy_keV.shape
+    """
+    with ProcessBackend(max_workers) as backend:
+        return backend.evaluate(materials, property_name, energy_keV)
+
+
+def _density_matrix(materials):
+    if isinstance(materials, MaterialBatch):
+        return materials.density_g_cc
+    if isinstance(materials, np.ndarray):
+        return np.atleast_2d(density_array(materials))
+    return np.array([density_array(m) for m in materials]).reshape(-1, NUM_ELEMENTS)
+
+
+def _new_shared_array(shape):
+    from multiprocessing import shared_memory
+    # SharedMemory refuses size 0
+    return shared_memory.SharedMemory(create=True, size=max(8 * int(np.prod(shape)), 1))
+
+
+def _shared_array(shm, shape):
+    return np.ndarray(shape, dtype=float, buffer=shm.buf)
+
+
+# Per worker process: (energy block name, EnergyGrid) of the current call
+_worker_grid = (None, None)
+
+def _init_process_worker():
+    # Load element tables once per worker, not per task
+    loaddata._load_packed_elements()
+
+
+# Workers share the parent's resource tracker, so attaching to the parent's
+# blocks registers nothing new, and the parent's unlink() cleans up.
+def _process_task(property_name, energy_name, energy_shape, result_name, result_shape, start, density_g_cc):
+    from multiprocessing import shared_memory
+    from .material import Material
+    global _worker_grid
+
+    if _worker_grid[0] != energy_name:
+        energy_shm = shared_memory.SharedMemory(name=energy_name)
+        try:
+            _worker_grid = (energy_name, EnergyGrid(_shared_array(energy_shm, energy_shape)))
+        finally:
+            energy_shm.close()
+    grid = _worker_grid[1]
+
+    result_shm = shared_memory.SharedMemory(name=result_name)
+    try:
+        result = _shared_array(result_shm, result_shape)
+        for (row, density) in enumerate(density_g_cc, start):
+            getattr(Material.from_array(density), property_name)(grid, out=result[row])
+        del result
+    finally:
+        result_shm.close()
+
+
+def _test_identical():
+    from .material import Material
+    bone = Material.from_icru44("Bone, Cortical (ICRU-44)")
+    energy_keV = np.random.default_rng(0).uniform(1.0, 200.0, size=(300, 1001))
+    for property_name in PROPERTIES:
+        serial = getattr(bone, property_name)(energy_keV)
+        chunked = evaluate(bone, property_name, energy_keV, chunk_size=4099, num_threads=4)
+        assert np.array_equal(serial, chunked), property_name
+
+
+def _test_process_backend():
+    from .material import Material
+    from . import library
+    materials = [library.water, Material.from_icru44("Bone, Cortical (ICRU-44)"), Material.from_compound("PbO", 9.5)] * 3
+    energy_keV = np.linspace(10.0, 150.0, 501).reshape(3, 167)
+    with ProcessBackend(max_workers=2, materials_per_task=2) as backend:
+        for property_name in PROPERTIES:
+            values = backend.evaluate(materials, property_name, energy_keV)
+            grid = EnergyGrid(energy_keV)
+            for (row, material) in zip(values, materials):
+                assert np.array_equal(row, getattr(material, property_name)(grid)), property_name
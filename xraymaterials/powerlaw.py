@@ -0,0 +1,165 @@
+"""
+Log-log (power-law) interpolation of element tables.
+
+Between absorption edges, attenuation coefficients and form factors vary
+close to a power law of energy, so interpolating linearly in log-log space is
+much more accurate than np.interp on the raw tables.  A PowerLawTable stores,
+for every segment of an element table, the slope and intercept of
+log(value) against log(energy), so evaluation is one exp().
+
+Segments are found through a uniform lookup table over log(energy), fine
+enough that each bin holds at most one table energy.  Finding the segment of
+an energy is then a direct index and at most one comparison, not a search.
+
+Use it through EnergyGrid(energy_keV, method="loglog"), or directly:
+
+    powerlaw.interp("Pb", "mu_rho_tot_cm2_g", energy_keV)
+"""
+
+import threading
+import numpy as np
+
+from . import elementtable
+from . import loaddata
+
+# Upper limit on lookup table size per element
+MAX_LOOKUP_BINS = 2**16
+
+
+class PowerLawTable:
+    """
+    Per-segment power laws for all columns of one element table.
+
+    Segments where a column is zero at only one end (e.g. the K-shell
+    coefficient at the K edge) fall back to linear interpolation.  Energies
+    outside the table take the end values, as with np.interp.
+    """
+
+    def __init__(self, element):
+        """
+        Args:
+            element: atomic number or symbol
+        """
+        self.z = elementtable.atomic_number(element)
+        table = loaddata.load_element_array(self.z)
+        energy_keV = table[loaddata.ELEMENT_COLUMN_INDEX["energy_keV"]]
+        self.energy_keV = energy_keV
+        self.values = table
+        self.log_energy = np.log(energy_keV)
+
+        # Segments zero at both ends get slope 0 and intercept -inf, so exp()
+        # gives 0.  Segments zero at one end only are interpolated linearly.
+        positive = table > 0
+        self.linear = positive[:, :-1] != positive[:, 1:]
+        power_law = positive[:, :-1] & positive[:, 1:]
+
+        d_log_energy = np.diff(self.log_energy)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_values = np.log(table)
+            self.slope = np.where(power_law, np.diff(log_values, axis=1) / d_log_energy, 0.0)
+            self.intercept = np.where(power_law, log_values[:, :-1] - self.slope * self.log_energy[:-1], -np.inf)
+
+        # Uniform lookup table over log energy: bin k starts at
+        # log_energy[0] + k*lookup_step and maps to the segment containing that point.
+        num_segments = len(energy_keV) - 1
+        log_range = self.log_energy[-1] - self.log_energy[0]
+        num_bins = int(min(np.ceil(log_range / d_log_energy.min()) + 1, MAX_LOOKUP_BINS))
+        self.lookup_step = log_range / (num_bins - 1)
+        bin_starts = self.log_energy[0] + self.lookup_step * np.arange(num_bins)
+        self.lookup = np.searchsorted(self.log_energy, bin_starts, side="right") - 1
+        np.clip(self.lookup, 0, num_segments - 1, out=self.lookup)
+        # Most table energies any bin can hold.  1 unless MAX_LOOKUP_BINS was hit.
+        self.max_steps = max(int(np.max(np.diff(self.lookup), initial=0)), 1)
+
+    def clip_log_energy(self, energy_keV):
+        """
+        Return log of energies as a flat array, clamped to the table's range.
+        """
+        log_energy = np.log(np.asarray(energy_keV, dtype=float).ravel())
+        np.clip(log_energy, self.log_energy[0], self.log_energy[-1], out=log_energy)
+        return log_energy
+
+    def segment(self, log_energy):
+        """
+        Return index of the table segment holding each log energy from clip_log_energy.
+        """
+        num_segments = len(self.log_energy) - 1
+        k = ((log_energy - self.log_energy[0]) / self.lookup_step).astype(np.intp)
+        np.clip(k, 0, len(self.lookup) - 1, out=k)
+        index = self.lookup[k]
+        # Rounding in k can put an energy just below its bin
+        index -= (log_energy < self.log_energy[index]) & (index > 0)
+        for _ in range(self.max_steps):
+            step = log_energy >= self.log_energy[np.minimum(index + 1, num_segments)]
+            step &= index < num_segments - 1
+            if not step.any():
+                break
+            index += step
+        return index
+
+    def interp(self, column, energy_keV):
+        """
+        Interpolate one column at given energies.
+
+        column:     column name (see loaddata.ELEMENT_COLUMNS) or index
+        energy_keV: photon energies in keV
+
+        Returns: interpolated values, with the shape of energy_keV
+        """
+        log_energy = self.clip_log_energy(energy_keV)
+        values = self.interp_segments(column, log_energy, self.segment(log_energy))
+        return values.reshape(np.shape(energy_keV))
+
+    def interp_segments(self, column, log_energy, index):
+        """
+        Interpolate one column given the results of clip_log_energy and segment.
+
+        Returns: flat array of interpolated values
+        """
+        if isinstance(column, str):
+            column = loaddata.ELEMENT_COLUMN_INDEX[column]
+
+        values = self.slope[column][index]
+        values *= log_energy
+        values += self.intercept[column][index]
+        np.exp(values, out=values)
+
+        linear = self.linear[column][index]
+        if linear.any():
+            ii = index[linear]
+            x0 = self.energy_keV[ii]
+            y0 = self.values[column][ii]
+            weight = (np.exp(log_energy[linear]) - x0) / (self.energy_keV[ii + 1] - x0)
+            np.clip(weight, 0.0, 1.0, out=weight)
+            values[linear] = y0 + weight * (self.values[column][ii + 1] - y0)
+        return values
+
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+def element_table(element):
+    """
+    Return the PowerLawTable of an element.  Built once per element.
+    """
+    z = elementtable.atomic_number(element)
+    try:
+        return _tables[z]
+    except KeyError:
+        pass
+    table = PowerLawTable(z)
+    with _tables_lock:
+        return _tables.setdefault(z, table)
+
+
+def interp(element, column, energy_keV):
+    """
+    Interpolate a column of an element table in log-log space.
+
+    element:    atomic number or symbol
+    column:     column name (see loaddata.ELEMENT_COLUMNS) or index
+    energy_keV: photon energies in keV
+
+    Returns: interpolated values, with the shape of energy_keV
+    """
+    return element_table(element).interp(column, np.asarray(energy_keV, dtype=float))
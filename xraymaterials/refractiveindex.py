@@ -1,27 +1,130 @@
 import re
+import collections
 import numpy as np
-import scipy.constants
-import pandas
 
-from . import elements
+from . import constants
 from . import loaddata
 from . import stoichiometry
+from .energygrid import EnergyGrid
+
+_ENERGY = loaddata.ELEMENT_COLUMN_INDEX["energy_keV"]
+_F1 = loaddata.ELEMENT_COLUMN_INDEX["f1_e_atom"]
+_F2 = loaddata.ELEMENT_COLUMN_INDEX["f2_e_atom"]
+
+OpticalProperties = collections.namedtuple("OpticalProperties",
+    ["delta", "beta", "mu", "mu_pe", "mu_pe_k", "sigma", "energy_keV"])
+
+# Element table columns interpolated by calculate_optical_properties, in order
+_OPTICAL_COLUMNS = [loaddata.ELEMENT_COLUMN_INDEX[name] for name in
+    ["f1_e_atom", "f2_e_atom", "mu_rho_tot_cm2_g", "mu_rho_pe_cm2_g", "mu_rho_K_cm2_g", "sigma_rho_cm2_g"]]
 
 def _energy_to_wavelength_m(energy_eV):
-    energy_J = energy_eV * scipy.constants.electron_volt
-    angular_frequency = energy_J / scipy.constants.hbar
-    lambda_m = 2*np.pi*scipy.constants.c/angular_frequency
+    energy_J = energy_eV * constants.electron_volt
+    angular_frequency = energy_J / constants.hbar
+    lambda_m = 2*np.pi*constants.c/angular_frequency
     return lambda_m
 
-_electron_radius_cm = scipy.constants.physical_constants["classical electron radius"][0] * 1e2
+_electron_radius_cm = constants.classical_electron_radius * 1e2
 def _calculate_refractive_index(energy_keV, number_density_cc, f1, f2):
     lambda_cm = _energy_to_wavelength_m(energy_keV * 1e3) * 1e2
     beta = (_electron_radius_cm/(2*np.pi)) * lambda_cm**2 * number_density_cc * f2
     delta = (_electron_radius_cm/(2*np.pi)) * lambda_cm**2 * number_density_cc * f1
     return beta, delta
 
+# r_e * lambda^2 / (2 pi) at 1 keV.  lambda scales as 1/E.
+_refractive_index_factor_keV2 = (_electron_radius_cm/(2*np.pi)) * (_energy_to_wavelength_m(1e3) * 1e2)**2
+
+def _apply_wavelength_factor(energy_keV, values):
+    """
+    Turn a sum of number density times form factor into delta or beta.
+
+    Multiplies values by r_e * lambda^2 / (2 pi), in place for arrays.
+    """
+    if isinstance(values, np.ndarray):
+        values /= energy_keV
+        values /= energy_keV
+        values *= _refractive_index_factor_keV2
+        return values
+    return values * _refractive_index_factor_keV2 / (energy_keV * energy_keV)
+
+
+def _energy_grid(energy_keV):
+    """
+    Return energy_keV as (array or None, EnergyGrid or None).
+    """
+    if isinstance(energy_keV, EnergyGrid):
+        return energy_keV.energy_keV, energy_keV
+    if energy_keV is not None:
+        energy_keV = np.asarray(energy_keV)
+    return energy_keV, None
+
+def _interp(energy_keV, grid, element, table, column):
+    if grid is not None:
+        return grid.interp(element, column)
+    return np.interp(energy_keV, table[_ENERGY], table[column])
+
+def _zeros(energy_keV, out):
+    if out is None:
+        return np.zeros(np.shape(energy_keV))
+    if out.shape != np.shape(energy_keV):
+        raise Exception(f"out has shape {out.shape}, but energies have shape {np.shape(energy_keV)}")
+    out[...] = 0.0
+    return out
+
+def _sum_columns(symbols, columns, weights, energy_keV, out=None):
+    """
+    Sum columns of element tables, interpolated to energy_keV and weighted per element.
+
+    totals[j] = sum over elements i of weights[j][i] * (column j of element i)
+
+    If energy_keV is None, the energies of the first element's table are used.
+    Totals are accumulated in place, into the arrays of out if given, so the
+    only temporary is one interpolated column at a time.
+
+    Returns:
+        totals: list with an array per column (a scalar for scalar energies)
+        energy_keV: energies of the totals
+    """
+    energy_keV, grid = _energy_grid(energy_keV)
+    if out is None:
+        out = [None] * len(columns)
+    totals = None
+
+    for (ii, elem_name) in enumerate(symbols):
+        table = loaddata.load_element_array(elem_name)
+        if energy_keV is None:
+            energy_keV = table[_ENERGY].copy()
+        if totals is None:
+            totals = [_zeros(energy_keV, o) for o in out]
+
+        for (total, column, w) in zip(totals, columns, weights):
+            values = _interp(energy_keV, grid, elem_name, table, column)
+            values *= w[ii]
+            total += values
+
+    if totals is None:
+        if energy_keV is None:
+            return [None] * len(columns), energy_keV
+        totals = [_zeros(energy_keV, o) for o in out]
+
+    # Scalar energies give scalar results, as np.interp does
+    totals = [t[()] if (o is None and t.ndim == 0) else t for (t, o) in zip(totals, out)]
+    return totals, energy_keV
+
+def _densities(symbols, elem_g_cc, elem_n_cc):
+    """
+    Return (mass densities, number densities) of elements given either one.
+    """
+    if elem_n_cc is not None:
+        if elem_g_cc is not None:
+            raise Exception("Only one of elem_g_cc and elem_n_cc can be given")
+        elem_g_cc = stoichiometry.mass_density(symbols, elem_n_cc)
+    elif elem_g_cc is not None:
+        elem_n_cc = stoichiometry.number_density(symbols, elem_g_cc)
+    return elem_g_cc, elem_n_cc
+
 
-def calculate_mass_coefficient(symbols, element_density_g_cc, property_name, energy_keV=None):
+def calculate_mass_coefficient(symbols, element_density_g_cc, property_name, energy_keV=None, out=None):
     """
     Calculate one of the density-normalized properties for a mixture of elements:
         mu_rho_pe_cm2_g:    mass photoelectric attenuation coefficient
@@ -36,8 +139,10 @@ def calculate_mass_coefficient(symbols, element_density_g_cc, property_name, ene
             Densities of constituent elements, in g/cm^3
         property_name: str
             One of the properties listed above
-        energy_keV: array-like
-            Energies at which to calculate n and mu, in keV
+        energy_keV: array-like or EnergyGrid
+            Energies at which to calculate n and mu, in keV.  Any shape.
+        out: array-like
+            (optional) Array to write the result into, with the shape of energy_keV
 
     Returns:
         property_value: array-like
@@ -45,37 +150,18 @@ def calculate_mass_coefficient(symbols, element_density_g_cc, property_name, ene
         energy_keV: array-like
             Energies at which property is provided
     """
-    if energy_keV is not None:
-        energy_keV = np.asarray(energy_keV)
-
     valid_property_names = ["mu_rho_pe_cm2_g", "sigma_rho_cm2_g", "mu_rho_tot_cm2_g", "mu_rho_K_cm2_g"]
     if property_name not in valid_property_names:
         raise Exception('Invalid property name {}, should be one of {}'.format(property_name, valid_property_names))
 
-    total_mu = None
-    
-    for (elem_name, elem_density) in zip(symbols, element_density_g_cc):
-        if isinstance(elem_name, int):
-            elem_name = elements.ELEMENTS[elem_name].symbol
-        
-        df = loaddata.load_element(elem_name)
-
-        if energy_keV is None:
-            energy_keV = df.energy_keV.values
-            mu_rho = df[property_name].values
-        else:
-            mu_rho = np.interp(energy_keV, df.energy_keV.values, df[property_name].values)
-        
-        if total_mu is None:
-            total_mu = mu_rho * elem_density
-        else:
-            total_mu += mu_rho * elem_density
-    
-    return total_mu, energy_keV
+    column = loaddata.ELEMENT_COLUMN_INDEX[property_name]
+    totals, energy_keV = _sum_columns(symbols, [column], [element_density_g_cc], energy_keV,
+                                      None if out is None else [out])
+    return totals[0], energy_keV
 
 
 
-def calculate_mu(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
+def calculate_mu(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None, out=None):
     """
     Calculate the total attenuation coefficient for a mixture of elements.
 
@@ -86,8 +172,10 @@ def calculate_mu(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
             Densities of constituent elements, in g/cm^3
         elem_n_cc: array-like
             Number densities of constituent elements, in 1/cm^3
-        energy_keV: array-like
-            Energies at which to calculate n and mu, in keV
+        energy_keV: array-like or EnergyGrid
+            Energies at which to calculate n and mu, in keV.  Any shape.
+        out: array-like
+            (optional) Array to write mu into, with the shape of energy_keV
 
     Returns:
         mu: array-like
@@ -98,12 +186,52 @@ def calculate_mu(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
     if elem_n_cc is not None:
         if elem_g_cc is not None:
             raise Exception("Only one of elem_g_cc and elem_n_cc can be given")
-        elem_g_cc = stoichiometry.mass_density(z, elem_n_cc)
+        elem_g_cc = stoichiometry.mass_density(symbols, elem_n_cc)
+
+    return calculate_mass_coefficient(symbols, elem_g_cc, "mu_rho_tot_cm2_g", energy_keV, out)
+
 
-    return calculate_mass_coefficient(symbols, elem_g_cc, "mu_rho_tot_cm2_g", energy_keV)
+def calculate_delta(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None, out=None):
+    """
+    Calculate the refractive index decrement delta for a mixture of elements.
+
+    Like calculate_n, but skips the imaginary part.
+
+    Returns:
+        delta: array-like
+            Refraction index decrement such that n = 1 - delta - 1j*beta
+        energy_keV: array-like
+            Energies at which delta is provided
+    """
+    _, elem_n_cc = _densities(symbols, elem_g_cc, elem_n_cc)
+    totals, energy_keV = _sum_columns(symbols, [_F1], [elem_n_cc], energy_keV,
+                                      None if out is None else [out])
+    if totals[0] is None:
+        return None, energy_keV
+    return _apply_wavelength_factor(energy_keV, totals[0]), energy_keV
+
+
+def calculate_beta(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None, out=None):
+    """
+    Calculate the imaginary part of the refractive index, beta, for a mixture of elements.
+
+    Like calculate_n, but skips the real part.
+
+    Returns:
+        beta: array-like
+            Imaginary part of refractive index such that n = 1 - delta - 1j*beta
+        energy_keV: array-like
+            Energies at which beta is provided
+    """
+    _, elem_n_cc = _densities(symbols, elem_g_cc, elem_n_cc)
+    totals, energy_keV = _sum_columns(symbols, [_F2], [elem_n_cc], energy_keV,
+                                      None if out is None else [out])
+    if totals[0] is None:
+        return None, energy_keV
+    return _apply_wavelength_factor(energy_keV, totals[0]), energy_keV
 
 
-def calculate_n(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
+def calculate_n(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None, out=None):
     """
     Calculate the refractive index for a mixture of elements.
 
@@ -114,8 +242,10 @@ def calculate_n(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
             Densities of constituent elements, in g/cm^3
         elem_n_cc: array-like
             Number densities of constituent elements, in 1/cm^3
-        energy_keV: array-like
-            Energies at which to calculate n, in keV
+        energy_keV: array-like or EnergyGrid
+            Energies at which to calculate n, in keV.  Any shape.
+        out: (array-like, array-like)
+            (optional) Arrays to write delta and beta into, with the shape of energy_keV
 
     Returns:
         delta: array-like
@@ -125,40 +255,11 @@ def calculate_n(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
         energy_keV: array-like
             Energies at which refractive index is provided
     """
-    beta = None
-    delta = None
-
-    if energy_keV is not None:
-        energy_keV = np.asarray(energy_keV)
-
-    if elem_g_cc is not None:
-        if elem_n_cc is not None:
-            raise Exception("Only one of elem_g_cc and elem_n_cc can be given")
-        elem_n_cc = stoichiometry.number_density(symbols, elem_g_cc)
-    
-    for (elem_name, n_cc) in zip(symbols, elem_n_cc):
-        if isinstance(elem_name, int):
-            elem_name = elements.ELEMENTS[elem_name].symbol
-        
-        df = loaddata.load_element(elem_name)
-        
-        if energy_keV is None:
-            energy_keV = df.energy_keV.values
-            f1 = df.f1_e_atom.values
-            f2 = df.f2_e_atom.values
-        else:
-            f1 = np.interp(energy_keV, df.energy_keV.values, df.f1_e_atom.values)
-            f2 = np.interp(energy_keV, df.energy_keV.values, df.f2_e_atom.values)
-        
-        b, d = _calculate_refractive_index(energy_keV, n_cc, f1, f2)
-        
-        if beta is not None:
-            beta += b
-            delta += d
-        else:
-            beta = b
-            delta = d
-    
+    _, elem_n_cc = _densities(symbols, elem_g_cc, elem_n_cc)
+    (delta, beta), energy_keV = _sum_columns(symbols, [_F1, _F2], [elem_n_cc, elem_n_cc], energy_keV, out)
+    if delta is not None:
+        delta = _apply_wavelength_factor(energy_keV, delta)
+        beta = _apply_wavelength_factor(energy_keV, beta)
     return delta, beta, energy_keV
 
 def calculate_n_mu(z, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
@@ -176,7 +277,7 @@ def calculate_n_mu(z, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
             Densities of constituent elements, in g/cm^3
         elem_n_cc: array-like
             Number densities of constituent elements, in 1/cm^3
-        energy_keV: array-like
+        energy_keV: array-like or EnergyGrid
             Energies at which to calculate n and mu, in keV
 
     Returns:
@@ -189,16 +290,50 @@ def calculate_n_mu(z, elem_g_cc=None, elem_n_cc=None, energy_keV=None):
         energy_keV: array-like
             Energies at which refractive index is provided
     """
-    if elem_n_cc is not None:
-        if elem_g_cc is not None:
-            raise Exception("Only one of elem_g_cc and elem_n_cc may be provided")
-        elem_g_cc = stoichiometry.mass_density(z, elem_n_cc)
-    elif elem_g_cc is not None:
-        elem_n_cc = stoichiometry.number_density(z, elem_g_cc)
-    
-    mu, energy_keV = calculate_mu(z, elem_g_cc, energy_keV)
-    delta, beta, _ = calculate_n(z, elem_n_cc=elem_n_cc, energy_keV=energy_keV)
-    
-    return delta, beta, mu, energy_keV
+    props = calculate_optical_properties(z, elem_g_cc, elem_n_cc, energy_keV)
+    return props.delta, props.beta, props.mu, props.energy_keV
+
+
+def calculate_optical_properties(symbols, elem_g_cc=None, elem_n_cc=None, energy_keV=None, out=None):
+    """
+    Calculate every optical property of a mixture of elements in one pass.
+
+    Each element table is loaded and each of its columns interpolated only once.
+
+    Either of elem_g_cc (element mass density in g/cc) or elem_n_cc (element number
+    density in 1/cc) may be given.
+
+    Parameters:
+        symbols: array-like
+            Atomic numbers or symbols of constituent elements
+        elem_g_cc: array-like
+            Densities of constituent elements, in g/cm^3
+        elem_n_cc: array-like
+            Number densities of constituent elements, in 1/cm^3
+        energy_keV: array-like or EnergyGrid
+            Energies at which to calculate properties, in keV.  Any shape.
+        out: sequence of 6 arrays
+            (optional) Arrays to write delta, beta, mu, mu_pe, mu_pe_k and sigma
+            into, each with the shape of energy_keV
+
+    Returns: OpticalProperties with fields
+        delta:      refraction index decrement such that n = 1 - delta - 1j*beta
+        beta:       imaginary part of refractive index such that n = 1 - delta - 1j*beta
+        mu:         total attenuation coefficient, 1/cm
+        mu_pe:      photoelectric attenuation coefficient, 1/cm
+        mu_pe_k:    K-shell component of mu_pe, 1/cm
+        sigma:      total scattering cross-section, 1/cm
+        energy_keV: energies at which properties are provided
+    """
+    elem_g_cc, elem_n_cc = _densities(symbols, elem_g_cc, elem_n_cc)
+
+    # f1 and f2 are weighted by number density, the rest by mass density
+    weights = [elem_n_cc, elem_n_cc] + [elem_g_cc] * (len(_OPTICAL_COLUMNS) - 2)
+    totals, energy_keV = _sum_columns(symbols, _OPTICAL_COLUMNS, weights, energy_keV, out)
 
+    # Refractive index of the mixture from number-density-weighted sums of f1 and f2
+    if totals[0] is not None:
+        totals[0] = _apply_wavelength_factor(energy_keV, totals[0])
+        totals[1] = _apply_wavelength_factor(energy_keV, totals[1])
 
+    return OpticalProperties(*totals, energy_keV)
@@ -0,0 +1,91 @@
+"""
+Per-material tables for fast evaluation at a single energy.
+
+Material.mu(30.0) and the other property methods use a ScalarTable when
+given one number instead of an array.  The table is built once per material
+and holds every property of the material on the union of its elements'
+energy grids.  The sum of the elements' piecewise-linear interpolants is
+itself piecewise linear on that union, so interpolating the merged table
+gives the same result as interpolating each element and summing, up to
+rounding.
+
+delta and beta scale with wavelength squared, i.e. 1/E^2, times a
+piecewise-linear sum of form factors; the table stores delta*E^2 and
+beta*E^2 and divides afterwards.
+
+A lookup is a bisection on a Python list and a few float operations, well
+inside LATENCY_TARGET_S.  Run _test_latency() to check it on a machine.
+"""
+
+import bisect
+import timeit
+import numpy as np
+
+from . import loaddata
+
+# Documented latency of a scalar property lookup on a warm table, in seconds
+LATENCY_TARGET_S = 20e-6
+
+PROPERTIES = ("delta", "beta", "mu", "mu_pe", "mu_pe_k", "sigma")
+# Properties stored multiplied by energy squared
+_WAVELENGTH_SQUARED = ("delta", "beta")
+
+
+class ScalarTable:
+    """
+    All properties of one material, tabulated on the union of its elements' energies.
+    """
+
+    def __init__(self, z, density_g_cc):
+        """
+        Args:
+            z (array-like): atomic numbers or symbols of constituent elements
+            density_g_cc (array-like): densities of constituent elements in g/cc
+        """
+        from .refractiveindex import calculate_optical_properties
+
+        energy_keV = np.unique(np.concatenate([loaddata.load_element_array(zz)[0] for zz in z]))
+        props = calculate_optical_properties(z, elem_g_cc=density_g_cc, energy_keV=energy_keV)
+        self.energy_keV = energy_keV.tolist()
+        self._values = {}
+        for name in PROPERTIES:
+            values = getattr(props, name)
+            if name in _WAVELENGTH_SQUARED:
+                values = values * energy_keV**2
+            self._values[name] = values.tolist()
+
+    def __call__(self, property_name, energy_keV):
+        """
+        Return property of the material at one energy, as a float.
+
+        Energies outside the table take the end values, as with np.interp.
+        """
+        energy = self.energy_keV
+        values = self._values[property_name]
+        if property_name in _WAVELENGTH_SQUARED:
+            return self._interp(energy, values, energy_keV) / (energy_keV * energy_keV)
+        return self._interp(energy, values, energy_keV)
+
+    @staticmethod
+    def _interp(energy, values, energy_keV):
+        ii = bisect.bisect_right(energy, energy_keV) - 1
+        if ii < 0:
+            return values[0]
+        if ii >= len(energy) - 1:
+            return values[-1]
+        x0 = energy[ii]
+        y0 = values[ii]
+        return y0 + (values[ii+1] - y0) * (energy_keV - x0) / (energy[ii+1] - x0)
+
+
+def _test_latency(number=20000):
+    from .material import Material
+    water = Material.from_compound("H2O", 1.0)
+    lead_glass = Material.from_icru44("Glass, Lead")
+    for material in [water, lead_glass]:
+        material.mu(30.0)
+        for property_name in PROPERTIES:
+            method = getattr(material, property_name)
+            seconds = min(timeit.repeat(lambda: method(33.3), number=number, repeat=3)) / number
+            assert seconds < LATENCY_TARGET_S, f"{property_name}(scalar) took {seconds*1e6:.1f} us"
+            np.testing.assert_allclose(method(33.3), method(np.array([33.3]))[0], rtol=1e-12)
@@ -0,0 +1,171 @@
+"""
+Publish the packed element table in shared memory for many processes.
+
+The packed table in xraymaterials/compiled/ is memory-mapped read-only, so
+processes on one machine already share its pages through the OS page cache.
+Where that file is unavailable (or tables were packed at run time), one
+process can publish the table into a multiprocessing.shared_memory block and
+every other process attaches to it without copying:
+
+    # parent
+    with sharedtables.publish() as tables:
+        ...start workers; they inherit XRAYMATERIALS_SHARED_TABLES...
+
+    # unrelated process
+    sharedtables.attach(name)   # tables.name from the publisher
+
+Workers attach on their first table lookup when SHARED_TABLES_ENV names a
+block.  Library materials are built on first access (see library), so
+workers hold only the materials they use.
+
+Block layout: int64 header (magic, version, index length, table columns),
+int64 index, then the float64 (len(ELEMENT_COLUMNS) x columns) table.
+"""
+
+import os
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+from . import loaddata
+
+# Environment variable naming the shared block to attach to
+SHARED_TABLES_ENV = "XRAYMATERIALS_SHARED_TABLES"
+
+_MAGIC = 0x5852_4d54  # "XRMT"
+_HEADER_SIZE = 4
+
+# Attached blocks, kept open for the life of the process
+_attached = {}
+
+
+def _open(name=None, size=0):
+    """
+    Open or create a shared memory block that no resource tracker unlinks.
+
+    The publisher unlinks the block itself; an attaching process must not
+    remove it when it exits.
+    """
+    create = name is None
+    try:
+        return shared_memory.SharedMemory(name, create=create, size=size, track=False)
+    except TypeError:
+        # Before Python 3.13 every SharedMemory is tracked
+        shm = shared_memory.SharedMemory(name, create=create, size=size)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _arrays(buffer):
+    header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=buffer)
+    magic, version, num_index, num_columns = (int(h) for h in header)
+    if magic != _MAGIC:
+        raise Exception("Shared memory block does not hold xraymaterials element tables")
+    if version != loaddata.ELEMENT_TABLE_VERSION:
+        raise Exception(f"Shared element tables have version {version}, expected {loaddata.ELEMENT_TABLE_VERSION}")
+    offset = 8 * _HEADER_SIZE
+    index = np.ndarray((num_index,), dtype=np.int64, buffer=buffer, offset=offset)
+    offset += 8 * num_index
+    data = np.ndarray((len(loaddata.ELEMENT_COLUMNS), num_columns), dtype=np.float64, buffer=buffer, offset=offset)
+    index.flags.writeable = False
+    data.flags.writeable = False
+    return data, index
+
+
+class SharedTables:
+    """
+    Element tables published in a shared memory block.
+
+    Keep it open while other processes may attach, then call unlink(), or
+    use it as a context manager.
+    """
+
+    def __init__(self, shm):
+        self._shm = shm
+        self.name = shm.name
+        self.data, self.index = _arrays(shm.buf)
+
+    @property
+    def nbytes(self):
+        return self._shm.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.unlink()
+
+    def unlink(self):
+        """
+        Remove the block.  Processes already attached keep their mapping.
+        """
+        if os.environ.get(SHARED_TABLES_ENV) == self.name:
+            del os.environ[SHARED_TABLES_ENV]
+        self.data = self.index = None
+        if getattr(self._shm, "_track", True):
+            # Before Python 3.13, unlink() unregisters the block, which _open already did
+            resource_tracker.register(self._shm._name, "shared_memory")
+        self._shm.unlink()
+        self._shm.close()
+
+    def __repr__(self):
+        return f"SharedTables({self.name!r}, {self.nbytes} bytes)"
+
+
+def publish(set_environment=True):
+    """
+    Copy the packed element tables into a new shared memory block.
+
+    set_environment: set SHARED_TABLES_ENV, so processes started afterwards attach to the block
+
+    Returns: SharedTables
+    """
+    data, index = loaddata._load_packed_elements()
+    size = 8 * (_HEADER_SIZE + index.size + data.size)
+    shm = _open(size=size)
+    header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+    header[:] = (_MAGIC, loaddata.ELEMENT_TABLE_VERSION, index.size, data.shape[1])
+    offset = 8 * _HEADER_SIZE
+    np.ndarray(index.shape, dtype=np.int64, buffer=shm.buf, offset=offset)[:] = index
+    offset += 8 * index.size
+    np.ndarray(data.shape, dtype=np.float64, buffer=shm.buf, offset=offset)[:] = data
+    del header
+
+    if set_environment:
+        os.environ[SHARED_TABLES_ENV] = shm.name
+    return SharedTables(shm)
+
+
+def attach(name):
+    """
+    Use element tables published by another process, without copying.
+
+    Replaces this process's packed element table, loaddata._packed_elements.
+    Arrays and Tables already returned by loaddata.load_element_array() or
+    load_element_table() keep viewing the table they were sliced from;
+    DataFrames from load_element() are copies.  loaddata.cache holds
+    load_table() results and ICRU-44 compositions, not element tables, so
+    clear_cache() does not affect them.
+
+    Returns: (data, index) read-only arrays backed by the shared block
+    """
+    if name not in _attached:
+        _attached[name] = _open(name)
+    arrays = _arrays(_attached[name].buf)
+    loaddata._packed_elements = arrays
+    return arrays
+
+
+def _test_attach():
+    import subprocess
+    import sys
+    from .material import Material
+    energy_keV = np.linspace(10.0, 100.0, 7)
+    expected = Material.from_compound("H2O", 1.0).mu(energy_keV)
+    code = ("import numpy as np; from xraymaterials import Material, loaddata; "
+            "print(Material.from_compound('H2O', 1.0).mu(np.linspace(10.0, 100.0, 7)).tolist()); "
+            "from xraymaterials import sharedtables; print(list(sharedtables._attached))")
+    with publish() as tables:
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+        values, attached = output.split("\n")[:2]
+        assert np.array_equal(np.array(eval(values)), expected)
+        assert eval(attached) == [tables.name], attached
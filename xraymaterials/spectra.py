@@ -0,0 +1,124 @@
+"""
+Memoized material spectra.
+
+Material property methods look their results up here before computing them.
+Entries are keyed on the content of the material (its atomic numbers and
+element densities) and of the energies, so equal materials built by
+different routes, e.g. library.delrin and library.polyoxymethylene, share
+entries, as do equal energy arrays that are different objects.
+
+Material.mass_coefficient() and at_densities() cache properties per unit
+density keyed on mass fractions instead, so one entry serves every density
+of a composition.
+
+Cached arrays are read-only; copy them before modifying.  Results that would
+not fit in the cache, scalar energies and calls with out= are not cached.
+
+    spectra.cache_info()        # CacheInfo(hits, misses, entries, bytes, max_bytes), .hit_rate
+    spectra.cache.max_bytes = 2**30
+    spectra.disable()
+"""
+
+import hashlib
+import numpy as np
+
+from .cache import LRUCache
+from .energygrid import EnergyGrid
+
+cache = LRUCache(max_bytes=256 * 2**20)
+
+_enabled = True
+
+
+def enable():
+    """
+    Look up and store spectra in the cache.  The default.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+    Compute every spectrum afresh.  Cached entries are kept; see clear_cache().
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def clear_cache():
+    """
+    Empty the spectrum cache and reset its hit/miss counters.
+    """
+    cache.clear()
+
+
+def cache_info():
+    """
+    Return CacheInfo(hits, misses, entries, bytes, max_bytes) for the spectrum cache.
+    """
+    return cache.info()
+
+
+def energy_key(energy_keV):
+    """
+    Return a key for the content of an energy array or EnergyGrid.
+
+    An EnergyGrid is hashed once; arrays are hashed on every call.
+    """
+    if isinstance(energy_keV, EnergyGrid):
+        return energy_keV.key
+    energy_keV = np.ascontiguousarray(energy_keV, dtype=float)
+    digest = hashlib.blake2b(energy_keV.data, digest_size=16).digest()
+    return ("array", energy_keV.shape, digest)
+
+
+def material_key(material):
+    """
+    Return a key for the composition of a Material.
+    """
+    return (material.z.tobytes(), material.g_cc.tobytes())
+
+
+def composition_key(material):
+    """
+    Return a key for the mass fractions of a Material, whatever its density.
+
+    Fractions are rounded to 12 decimals, so copies rescaled with as_density()
+    get the same key despite rounding in the rescaling.
+    """
+    return (material.z.tobytes(), np.round(material.mass_fractions(), 12).tobytes())
+
+
+def cached(material, property_name, energy_keV, compute, per_unit_density=False):
+    """
+    Return property of material at energies from the cache, or compute() and store it.
+
+    material:         Material
+    property_name:    name of the property, part of the key
+    energy_keV:       array-like or EnergyGrid
+    compute:          function of no arguments returning the property
+    per_unit_density: key on the mass fractions of material instead of its
+                      element densities, for properties per g/cc
+    """
+    if not _enabled or energy_keV is None:
+        return compute()
+    max_bytes = cache.max_bytes
+    if max_bytes is not None and 8 * np.size(energy_keV) > max_bytes:
+        return compute()
+
+    if per_unit_density:
+        key = (composition_key(material), property_name + "/rho", energy_key(energy_keV))
+    else:
+        key = (material_key(material), property_name, energy_key(energy_keV))
+    return cache.get_or_compute(key, lambda: _read_only(compute()))
+
+
+def _read_only(value):
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
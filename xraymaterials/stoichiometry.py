@@ -1,8 +1,8 @@
-import re
 import numpy as np
-import scipy.constants
-from . import elements
+from . import constants
+from . import elementtable
 from . import loaddata
+from . import formula as formula_module
 
 
 # TODO: consider whether this function is necessary and/or should be renamed
@@ -19,7 +19,7 @@ def compound_number_densities(formula, total_density_g_cc):
         number_density_cc: list of number densities in units of 1/cc
     """
     elements, numbers, atomic_masses = calculate_stoichiometry(formula)
-    element_mass_g = np.multiply(numbers, atomic_masses) * scipy.constants.atomic_mass / scipy.constants.gram
+    element_mass_g = np.multiply(numbers, atomic_masses) * constants.atomic_mass / constants.gram
     mol_mass_g = element_mass_g.sum()
     mol_number_density_cc = total_density_g_cc / mol_mass_g
     
@@ -31,41 +31,49 @@ def calculate_stoichiometry(formula):
     Calculate the atomic composition of a molecule.
 
     Parameters:
-        formula: chemical formula, capitalization-sensitive, e.g. "H2O"
+        formula: chemical formula, capitalization-sensitive, e.g. "H2O".
+                 Groups, hydrates and fractional counts are allowed, see formula.parse.
 
     Returns:
         element_symbols:   list of chemical symbols e.g. ["H", "O"]
         element_count:     list of numbers of atoms of each element, e.g. [2, 1]
         element_mass:      list of atomic masses of each element, e.g. [1.00794, 15.9994]
     """
-    element_pattern = re.compile(r"([A-Z][a-z]?)([0-9]*)")
-    tokens = element_pattern.findall(formula)
-    
-    element_symbols = []
-    element_mass_total = []
-    element_count = []
-    element_mass = []
-    
-    for (elem_name, elem_number) in tokens:
-        
-        if elem_name not in elements.ELEMENTS:
-            raise Exception(f"Cannot find element '{elem_name}'.  Check capitalization?")
-        elem_record = elements.ELEMENTS[elem_name]
-        
-        element_symbols.append(elem_name)
-        if elem_number:
-            elem_number = int(elem_number)
-        else:
-            elem_number = 1
-            
-        element_count.append(elem_number)
-        
-        element_mass_total.append(elem_record.mass * elem_number)
-        element_mass.append(elem_record.mass)
-    
+    counts = formula_module.parse(formula)
+    element_symbols = [s for s in counts.keys()]
+    element_count = [n for n in counts.values()]
+    element_mass = elementtable.MASS[elementtable.atomic_numbers(element_symbols)].tolist()
     return element_symbols, element_count, element_mass
 
 
+# Mass of one atom of each element in grams, indexed by atomic number.  Entry 0 is nan.
+ATOMIC_MASS_G = elementtable.MASS * (constants.atomic_mass / constants.gram)
+ATOMIC_MASS_G.flags.writeable = False
+
+
+def atomic_numbers(symbols):
+    """
+    Convert atomic symbols or atomic numbers to an integer array of atomic numbers.
+
+    Integer arrays are returned as they are, e.g. ['He', 'Li', 'U'] or [2, 'Li', 92].
+    See elementtable.atomic_numbers.
+    """
+    return elementtable.atomic_numbers(symbols)
+
+
+def _atomic_mass_g(symbols, values):
+    """
+    Return atomic masses in grams, shaped to broadcast against values.
+
+    Masses line up with the leading axes of values, so symbols of shape S go
+    with values of shape S + (any trailing axes), e.g. a number density image
+    per element.
+    """
+    mass_g = ATOMIC_MASS_G[atomic_numbers(symbols)]
+    if values.shape[:mass_g.ndim] != mass_g.shape:
+        raise Exception("Number of symbols does not match number of densities")
+    return mass_g.reshape(mass_g.shape + (1,) * (values.ndim - mass_g.ndim))
+
 
 def number_density(symbols, density_g_cc):
     """
@@ -74,30 +82,17 @@ def number_density(symbols, density_g_cc):
     Parameters:
         symbols: array-like
             Atomic symbols or atomic numbers, e.g.
-                ['He', 'Li', 'U'] or [2, 3, 92]
+                ['He', 'Li', 'U'] or [2, 3, 92].  Any shape.
         density_g_cc: array-like
-            Mass densities of given elements in units of g/cc
+            Mass densities of given elements in units of g/cc.  Its leading
+            axes match symbols; any further axes (e.g. voxels) are broadcast.
 
     Returns:
         number_density_cc: array-like
             Number densities of given elements in units of 1/cc 
     """
-    if len(symbols) != len(density_g_cc):
-        raise Exception("Number of symbols does not match number of densities")
-
-    density_g_cc = np.asarray(density_g_cc)
-    number_density_cc = np.empty_like(density_g_cc)
-    
-    for ii,(elem_name,elem_density_g_cc) in enumerate(zip(symbols, density_g_cc)):
-        if isinstance(elem_name, int):
-            elem_name = elements.ELEMENTS[elem_name].symbol
-        
-        elem_mass_g = elements.ELEMENTS[elem_name].mass * scipy.constants.atomic_mass / scipy.constants.gram
-        
-        n_cc = elem_density_g_cc / elem_mass_g
-        number_density_cc[ii] = n_cc
-    
-    return number_density_cc
+    density_g_cc = np.asarray(density_g_cc, dtype=float)
+    return density_g_cc / _atomic_mass_g(symbols, density_g_cc)
         
 
 def mass_density(symbols, number_density_cc):
@@ -107,29 +102,17 @@ def mass_density(symbols, number_density_cc):
     Parameters:
         symbols: array-like
             Atomic symbols or atomic numbers, e.g.
-                ['He', 'Li', 'U'] or [2, 3, 92]
+                ['He', 'Li', 'U'] or [2, 3, 92].  Any shape.
         number_density_cc: array-like
-            Number densities of given elements in units of 1/cc 
+            Number densities of given elements in units of 1/cc.  Its leading
+            axes match symbols; any further axes (e.g. voxels) are broadcast.
 
     Returns:
         density_g_cc: array-like
             Mass densities of given elements in units of g/cc
     """
-    if len(symbols) != len(number_density_cc):
-        raise Exception("Number of symbols does not match number of densities")
-
-    number_density_cc = np.asarray(number_density_cc)
-    density_g_cc = np.empty_like(number_density_cc)
-    
-    for ii,(elem_name,elem_n_cc) in enumerate(zip(symbols, number_density_cc)):
-        if isinstance(elem_name, int):
-            elem_name = elements.ELEMENTS[elem_name].symbol
-        
-        elem_mass_g = elements.ELEMENTS[elem_name].mass * scipy.constants.atomic_mass / scipy.constants.gram
-        elem_density_g_cc = elem_n_cc * elem_mass_g
-        density_g_cc[ii] = elem_density_g_cc
-    
-    return density_g_cc
+    number_density_cc = np.asarray(number_density_cc, dtype=float)
+    return number_density_cc * _atomic_mass_g(symbols, number_density_cc)
 
 
 def _test_density():
@@ -139,3 +122,10 @@ def _test_density():
     np.testing.assert_array_almost_equal(rho_in, rho_out)
 
 
+def _test_density_images():
+    z = np.array([1, 8])
+    rho = np.random.default_rng(0).uniform(0.0, 2.0, size=(2, 16, 16))
+    n = number_density(z, rho)
+    assert n.shape == rho.shape
+    np.testing.assert_allclose(n[1], number_density("O", rho[1]))
+    np.testing.assert_allclose(mass_density(z, n), rho)
@@ -0,0 +1,139 @@
+"""
+Tables of named NumPy columns.
+
+loaddata returns its data files as Tables.  A Table maps column names to
+1-D arrays of equal length.  Tables read from files keep all columns in one
+2-D block, one contiguous row per column, so selecting a column is a view
+and to_pandas() wraps the block without copying it.
+
+    table = loaddata.load_element_table("O")
+    table["energy_keV"]          # contiguous, read-only array
+    table.to_pandas()            # read-only DataFrame sharing the table's memory
+"""
+
+import numpy as np
+
+
+class Table:
+    """
+    Columns of equal length, by name, in order.
+    """
+
+    __slots__ = ("_columns", "_block")
+
+    def __init__(self, columns):
+        """
+        Args:
+            columns (dict): column name and 1-D array-like of values
+        """
+        self._columns = {name: np.asarray(values) for (name, values) in columns.items()}
+        lengths = {len(values) for values in self._columns.values()}
+        if len(lengths) > 1:
+            raise Exception(f"Columns have different lengths {sorted(lengths)}")
+        self._block = None
+
+    @classmethod
+    def from_block(cls, names, block):
+        """
+        Return Table whose columns are the rows of a 2-D array.  No data is copied.
+
+        names: column names, one per row of block
+        block: array of shape (len(names), num_rows)
+        """
+        if block.ndim != 2 or block.shape[0] != len(names):
+            raise Exception(f"Expected a block of {len(names)} rows, got shape {block.shape}")
+        table = cls({name: values for (name, values) in zip(names, block)})
+        table._block = block
+        return table
+
+    @classmethod
+    def read_csv(cls, fname):
+        """
+        Read a comma-separated file of numbers with a header line of column names.
+        """
+        with open(fname) as fh:
+            names = fh.readline().strip().split(",")
+            data = np.loadtxt(fh, delimiter=",", ndmin=2).reshape(-1, len(names))
+        block = np.ascontiguousarray(data.T)
+        block.flags.writeable = False
+        return cls.from_block(names, block)
+
+    @property
+    def columns(self):
+        """
+        Column names, in order.
+        """
+        return list(self._columns)
+
+    @property
+    def nbytes(self):
+        """
+        Bytes of column data.
+        """
+        if self._block is not None:
+            return self._block.nbytes
+        return sum(values.nbytes for values in self._columns.values())
+
+    def keys(self):
+        return self._columns.keys()
+
+    def values(self):
+        return self._columns.values()
+
+    def items(self):
+        return self._columns.items()
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        """
+        Number of rows.
+        """
+        for values in self._columns.values():
+            return len(values)
+        return 0
+
+    def to_array(self):
+        """
+        Return 2-D array of shape (columns, rows).  A view for Tables read from files.
+        """
+        if self._block is not None:
+            return self._block
+        return np.array([values for values in self._columns.values()])
+
+    def to_pandas(self, copy=False):
+        """
+        Return pandas DataFrame of this Table.
+
+        copy: if False, the DataFrame wraps the Table's memory, which is
+              read-only for Tables from loaddata, so the DataFrame cannot be
+              modified in place.  If True, the DataFrame owns a copy.
+        """
+        import pandas
+        if self._block is not None:
+            return pandas.DataFrame(self._block.T, columns=self.columns, copy=copy)
+        return pandas.DataFrame(self._columns, copy=copy)
+
+    def __repr__(self):
+        return f"Table({len(self)} rows, columns={self.columns})"
+
+
+def _test_to_pandas():
+    block = np.arange(12.0).reshape(3, 4)
+    table = Table.from_block(["a", "b", "c"], block)
+    assert len(table) == 4 and table.columns == ["a", "b", "c"]
+    assert np.shares_memory(table["b"], block) and table["b"].flags.c_contiguous
+    df = table.to_pandas()
+    assert df.shape == (4, 3) and list(df.columns) == ["a", "b", "c"]
+    assert np.shares_memory(df["b"].to_numpy(), block)
+    np.testing.assert_array_equal(df["c"].to_numpy(), block[2])
+    df = table.to_pandas(copy=True)
+    df.loc[0, "a"] = -1.0
+    assert block[0, 0] == 0.0